@@ -0,0 +1,123 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.chat.chat_models import ChatLog
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.database.connection import AsyncSessionLocal
+
+queue_depth = metrics_registry.gauge("chat_log_queue_depth", "저장 대기 중인 채팅 로그 수")
+flush_seconds = metrics_registry.histogram("chat_log_flush_seconds", "채팅 로그 일괄 저장 소요 시간")
+flushed_rows = metrics_registry.counter("chat_log_flushed_rows_total", "일괄 저장된 채팅 로그 수")
+dropped_rows = metrics_registry.counter("chat_log_dropped_rows_total", "저장 실패로 버려진 채팅 로그 수")
+
+
+# 채팅 로그 write-behind 저장기 (개수/시간 기준으로 모아 다중 행 INSERT 한 번으로 커밋)
+class ChatLogWriter:
+    def __init__(
+            self,
+            session_factory: async_sessionmaker,
+            batch_size: int,
+            flush_interval: float,
+            max_queue_size: int,
+            max_attempts: int = 3
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.max_attempts = max_attempts
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    # 남은 로그를 모두 저장한 뒤 종료
+    async def stop(self):
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    # 로그를 큐에 추가 (큐가 가득 차면 자리가 날 때까지 대기)
+    async def enqueue(self, session_id: int, chat_type: str, message: str, timestamp: Optional[datetime] = None):
+        await self._queue.put({
+            "session_id": session_id,
+            "chat_type": chat_type,
+            "message": message,
+            "timestamp": timestamp or datetime.now(),
+        })
+        queue_depth.set(self._queue.qsize())
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            rows = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(rows) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            queue_depth.set(self._queue.qsize())
+            await self._flush(rows)
+
+        # 종료 신호 이후 남은 로그 정리
+        rows = []
+        while not self._queue.empty():
+            row = self._queue.get_nowait()
+            if row is not None:
+                rows.append(row)
+        for start in range(0, len(rows), self.batch_size):
+            await self._flush(rows[start:start + self.batch_size])
+        queue_depth.set(0)
+
+    async def _flush(self, rows: List[Dict]):
+        for attempt in range(1, self.max_attempts + 1):
+            start = time.perf_counter()
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(insert(ChatLog).values(rows))
+                    await db.commit()
+                flush_seconds.observe(time.perf_counter() - start)
+                flushed_rows.inc(len(rows))
+                return
+            except Exception as e:
+                print(f"[채팅 로그 저장 오류] {attempt}/{self.max_attempts}회 실패: {e}")
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(0.1 * attempt)
+        dropped_rows.inc(len(rows))
+
+
+chat_log_writer = ChatLogWriter(
+    AsyncSessionLocal,
+    batch_size=settings.CHAT_LOG_BATCH_SIZE,
+    flush_interval=settings.CHAT_LOG_FLUSH_INTERVAL_SECONDS,
+    max_queue_size=settings.CHAT_LOG_QUEUE_SIZE
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from app.database.base import Base
 from datetime import datetime
 
@@ -11,10 +11,17 @@ class ChatSession(Base):
     session_type = Column(String(50), nullable=False)
     started_at = Column(DateTime, nullable=False, default=datetime.now)
     ended_at = Column(DateTime)
+    # 세션 종료 또는 메모리에서 제거된 시점의 대화 상태 (ConversationState JSON)
+    state_snapshot = Column(Text)
 
 
 class ChatLog(Base):
     __tablename__ = "chat_logs"
+    __table_args__ = (
+        # 세션별 키셋 페이지네이션 (session_id, id) / 기간별 내보내기
+        Index("ix_chat_logs_session_id_id", "session_id", "id"),
+        Index("ix_chat_logs_timestamp", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, nullable=False)
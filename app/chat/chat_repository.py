@@ -1,7 +1,13 @@
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.chat.chat_models import ChatSession, ChatLog
+from app.chat.chat_log_writer import chat_log_writer
+from app.chat.conversation_state_store import conversation_state_store
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Sequence
+
+CHAT_LOG_COLUMNS = (ChatLog.id, ChatLog.session_id, ChatLog.chat_type, ChatLog.message, ChatLog.timestamp)
 
 class ChatCrud:
     def __init__(self, db: AsyncSession):
@@ -16,18 +22,26 @@ class ChatCrud:
         )
         self.db.add(session)
         await self.db.commit()
-        await self.db.refresh(session)
         return session.id
 
-    # 채팅 세션 종료
+    # 채팅 세션 종료 (메모리의 대화 상태를 세션에 스냅샷으로 저장)
+    # 세션이 없으면(잘못된 ID) 메모리의 상태는 그대로 둠
     async def end_chat_session(self, session_id: int):
         session = await self.db.get(ChatSession, session_id)
-        if session:
-            session.ended_at = datetime.now()
-            await self.db.commit()
+        if session is None:
+            return
+        state = conversation_state_store.pop(session_id)
+        session.ended_at = datetime.now()
+        if state is not None:
+            session.state_snapshot = state.model_dump_json()
+        await self.db.commit()
 
-    # 채팅 로그 저장
+    # 채팅 로그 저장 (write-behind 저장기가 실행 중이면 큐에 넣고 일괄 저장)
     async def save_chat_log(self, session_id: int, chat_type: str, message: str):
+        if chat_log_writer.running:
+            await chat_log_writer.enqueue(session_id, chat_type, message)
+            return
+
         log = ChatLog(
             session_id=session_id,
             chat_type=chat_type,
@@ -39,4 +53,46 @@ class ChatCrud:
 
     # ID로 채팅 세션 조회
     async def get_chat_session_by_id(self, session_id: int) -> Optional[ChatSession]:
-        return await self.db.get(ChatSession, session_id)
\ No newline at end of file
+        return await self.db.get(ChatSession, session_id)
+
+    # 세션의 채팅 로그를 id 순으로 after_id 다음부터 limit건 조회 (키셋 페이지네이션)
+    async def get_chat_logs_page(self, session_id: int, after_id: int = 0, limit: int = 50) -> List[Row]:
+        stmt = (
+            select(*CHAT_LOG_COLUMNS)
+            .where(ChatLog.session_id == session_id, ChatLog.id > after_id)
+            .order_by(ChatLog.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    # 전체 채팅 로그를 (session_id, id) 순으로 커서 다음부터 limit건 조회 (OFFSET 대체)
+    async def get_chat_logs_after(self, after_session_id: int = 0, after_id: int = 0, limit: int = 50) -> List[Row]:
+        stmt = (
+            select(*CHAT_LOG_COLUMNS)
+            .where(tuple_(ChatLog.session_id, ChatLog.id) > tuple_(after_session_id, after_id))
+            .order_by(ChatLog.session_id, ChatLog.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    # 기간 내 채팅 로그를 서버 측 커서로 chunk_size건씩 읽어 묶음 단위로 반환 (메모리 사용량 일정)
+    async def stream_chat_logs(
+            self,
+            start: datetime,
+            end: datetime,
+            chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        stmt = (
+            select(*CHAT_LOG_COLUMNS)
+            .where(ChatLog.timestamp >= start, ChatLog.timestamp < end)
+            .order_by(ChatLog.timestamp, ChatLog.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(stmt)
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            await result.close()
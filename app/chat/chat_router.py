@@ -0,0 +1,177 @@
+import json
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.chat.chat_repository import ChatCrud
+from app.chat.chat_schemas import ChatLogItem, ChatLogPage, SimilarLectureRequest
+from app.chat.conversation_state_store import conversation_state_store
+from app.core.config import settings
+from app.core.observability import current_request_id
+from app.database.connection import AsyncSessionLocal, get_db
+from app.lecture.lecture_repository import LectureCrud
+from app.recommendation.service.gpt_service import GPTService
+
+router = APIRouter(prefix="/chat", tags=["chat"])
+
+
+# 유사 강의 추천을 스트리밍하며 이벤트(start, token, lecture, done) 생성
+async def similar_lecture_events(request: SimilarLectureRequest, db: AsyncSession) -> AsyncIterator[Dict]:
+    yield {"type": "start"}
+
+    available_lectures = await LectureCrud(db).get_lecture_names()
+    chat_crud = ChatCrud(db)
+    deleted_lectures = request.deleted_lectures
+    interests = request.interest or [request.user_input]
+
+    # 세션이 있으면 이전 턴의 삭제 강의/관심 분야를 이어서 사용
+    state = None
+    if request.session_id is not None:
+        await chat_crud.save_chat_log(request.session_id, "U", request.user_input)
+        state = await conversation_state_store.load(db, request.session_id)
+        for lecture in request.deleted_lectures:
+            if lecture not in state.deleted_lectures:
+                state.deleted_lectures.append(lecture)
+        if request.interest or not state.interests:
+            state.interests = interests
+        deleted_lectures = state.deleted_lectures
+        interests = state.interests
+
+    recommended = []
+    async for event_type, value in GPTService().stream_other_similar_lectures(
+            request.user_input,
+            deleted_lectures,
+            interests,
+            available_lectures
+    ):
+        if event_type == "lecture":
+            recommended.append(value)
+        yield {"type": event_type, "data": value}
+
+    if state is not None:
+        state.recommended = recommended
+        conversation_state_store.save(state)
+        await chat_crud.save_chat_log(request.session_id, "B", "\n".join(recommended))
+    yield {"type": "done", "data": recommended}
+
+
+def _sse(event: Dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event.get('data'), ensure_ascii=False)}\n\n"
+
+
+# 유사 강의 추천 SSE 스트리밍
+@router.post("/recommendations/stream")
+async def stream_similar_lectures(request: SimilarLectureRequest):
+    # 응답 본문이 끝날 때까지 세션을 유지하도록 스트림 안에서 세션 생성
+    async def body():
+        try:
+            async with AsyncSessionLocal() as db:
+                async for event in similar_lecture_events(request, db):
+                    yield _sse(event)
+        except Exception as e:
+            print(f"[{current_request_id()}] [SSE 스트리밍 오류] {e}")
+            yield _sse({"type": "error", "data": "추천 생성 중 오류가 발생했습니다."})
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# 유사 강의 추천 WebSocket 스트리밍 (연결당 여러 요청 처리)
+@router.websocket("/ws")
+async def chat_websocket(websocket: WebSocket):
+    await websocket.accept()
+    try:
+        while True:
+            # 잘못된 프레임(JSON 아님, 객체 아님, 스키마 불일치, 바이너리)은 오류 이벤트만 보내고 연결 유지
+            try:
+                request = SimilarLectureRequest.model_validate(json.loads(await websocket.receive_text()))
+            except (ValueError, KeyError) as e:
+                await websocket.send_json({"type": "error", "data": f"잘못된 요청 형식입니다. ({type(e).__name__})"})
+                continue
+            async with AsyncSessionLocal() as db:
+                try:
+                    async for event in similar_lecture_events(request, db):
+                        await websocket.send_json(event)
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    print(f"[WebSocket 스트리밍 오류] {e}")
+                    await websocket.send_json({"type": "error", "data": "추천 생성 중 오류가 발생했습니다."})
+    except WebSocketDisconnect:
+        pass
+
+
+# 조회 결과를 페이지로 변환 (limit + 1건을 조회해 다음 페이지 존재 여부 판단)
+def _log_page(rows: List[Row], limit: int) -> ChatLogPage:
+    items = [ChatLogItem(**row._mapping) for row in rows[:limit]]
+    if len(rows) <= limit:
+        return ChatLogPage(items=items)
+    last = items[-1]
+    return ChatLogPage(items=items, next_after_session_id=last.session_id, next_after_id=last.id)
+
+
+# 세션별 채팅 기록 (id 기준 키셋 페이지네이션)
+@router.get("/sessions/{session_id}/logs", response_model=ChatLogPage)
+async def get_session_logs(
+        session_id: int,
+        after_id: int = Query(0, ge=0),
+        limit: int = Query(50, ge=1, le=settings.CHAT_HISTORY_MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_db)
+):
+    rows = await ChatCrud(db).get_chat_logs_page(session_id, after_id, limit + 1)
+    return _log_page(rows, limit)
+
+
+# 전체 채팅 기록 ((session_id, id) 기준 키셋 페이지네이션, 분석용 OFFSET 조회 대체)
+@router.get("/logs", response_model=ChatLogPage)
+async def get_logs(
+        after_session_id: int = Query(0, ge=0),
+        after_id: int = Query(0, ge=0),
+        limit: int = Query(50, ge=1, le=settings.CHAT_HISTORY_MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_db)
+):
+    rows = await ChatCrud(db).get_chat_logs_after(after_session_id, after_id, limit + 1)
+    return _log_page(rows, limit)
+
+
+def _ndjson(row: Row) -> str:
+    return json.dumps({
+        "id": row.id,
+        "session_id": row.session_id,
+        "chat_type": row.chat_type,
+        "message": row.message,
+        "timestamp": row.timestamp.isoformat(),
+    }, ensure_ascii=False) + "\n"
+
+
+# chat_logs.timestamp는 서버 로컬 시각(naive)이므로 시간대가 지정된 값은 로컬 시각으로 변환 후 시간대 제거
+def _naive_local(value: datetime) -> datetime:
+    return value.astimezone().replace(tzinfo=None) if value.tzinfo is not None else value
+
+
+# 기간 [start, end) 채팅 로그 NDJSON 내보내기 (서버 측 커서로 묶음 단위 스트리밍)
+@router.get("/logs/export")
+async def export_logs(start: datetime, end: Optional[datetime] = None):
+    start = _naive_local(start)
+    end = _naive_local(end) if end is not None else datetime.now()
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end는 start 이후여야 합니다.")
+
+    # 응답 본문이 끝날 때까지 세션(커서)을 유지하도록 스트림 안에서 세션 생성
+    async def body():
+        try:
+            async with AsyncSessionLocal() as db:
+                async for rows in ChatCrud(db).stream_chat_logs(start, end, settings.CHAT_EXPORT_CHUNK_SIZE):
+                    yield "".join(_ndjson(row) for row in rows)
+        except Exception as e:
+            # 헤더가 이미 전송되어 상태 코드를 바꿀 수 없으므로 로그만 남기고 스트림 종료
+            print(f"[{current_request_id()}] [채팅 로그 내보내기 오류] {e}")
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
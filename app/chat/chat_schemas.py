@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, PrivateAttr, field_serializer
+
+from app.curriculum.service.credit_ledger import CreditLedger, LedgerEntry
+
+
+class SimilarLectureRequest(BaseModel):
+    user_input: str
+    interest: List[str] = []
+    deleted_lectures: List[str] = []
+    session_id: Optional[int] = None
+
+
+# 여러 턴에 걸친 추천 대화 상태 (세션 종료 또는 저장소에서 제거 시 chat_sessions.state_snapshot에 JSON으로 저장)
+class ConversationState(BaseModel):
+    session_id: int
+    recommended: List[str] = []
+    deleted_lectures: List[str] = []
+    interests: List[str] = []
+    conditions: List[str] = []
+    draft_lectures: List[str] = []
+    # 세션의 학점 장부 항목 (스냅샷 저장/복원용, 메모리에서는 _ledger를 직접 갱신)
+    ledger_entries: Optional[List[LedgerEntry]] = None
+    _ledger: Optional[CreditLedger] = PrivateAttr(default=None)
+
+    # 세션 학점 장부 (스냅샷에서 복원한 상태면 저장된 항목으로 한 번만 재구성, 없으면 None)
+    @property
+    def ledger(self) -> Optional[CreditLedger]:
+        if self._ledger is None and self.ledger_entries is not None:
+            self._ledger = CreditLedger.from_entries(self.ledger_entries)
+        return self._ledger
+
+    def attach_ledger(self, ledger: CreditLedger):
+        self._ledger = ledger
+
+    @field_serializer("ledger_entries")
+    def _serialize_ledger_entries(self, entries: Optional[List[LedgerEntry]]):
+        return self._ledger.entries() if self._ledger is not None else entries
+
+
+class ChatLogItem(BaseModel):
+    id: int
+    session_id: int
+    chat_type: str
+    message: str
+    timestamp: datetime
+
+
+# 키셋 페이지 (다음 요청에 next_after_session_id/next_after_id를 그대로 전달, 마지막 페이지면 None)
+class ChatLogPage(BaseModel):
+    items: List[ChatLogItem]
+    next_after_session_id: Optional[int] = None
+    next_after_id: Optional[int] = None
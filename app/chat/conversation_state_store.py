@@ -0,0 +1,188 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.chat.chat_models import ChatSession
+from app.chat.chat_schemas import ConversationState
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.database.connection import AsyncSessionLocal
+
+state_entries = metrics_registry.gauge("conversation_state_entries", "메모리에 있는 대화 상태 수")
+state_bytes = metrics_registry.gauge("conversation_state_bytes", "대화 상태 추정 메모리 사용량")
+state_evictions = metrics_registry.counter("conversation_state_evictions_total", "대화 상태 제거 수", ["reason"])
+state_loads = metrics_registry.counter("conversation_state_loads_total", "대화 상태 조회 수", ["source"])
+state_snapshot_writes = metrics_registry.counter(
+    "conversation_state_snapshot_writes_total", "제거된 대화 상태의 스냅샷 저장 결과", ["outcome"]
+)
+
+
+# 세션 ID별 대화 상태 저장소 (LRU + 메모리 상한 + 유휴 만료)
+# 세션 종료 시에는 end_chat_session이, 용량/유휴로 제거될 때는 백그라운드 작업이 DB에 스냅샷 저장
+class ConversationStateStore:
+    def __init__(
+            self,
+            max_entries: int,
+            max_bytes: int,
+            idle_ttl_seconds: float,
+            session_factory: Optional[async_sessionmaker] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.session_factory = session_factory
+        # session_id -> (상태, 추정 크기, 마지막 사용 시각)
+        self._entries: "OrderedDict[int, Tuple[ConversationState, int, float]]" = OrderedDict()
+        self._bytes = 0
+        # 제거 후 아직 DB에 쓰지 않은 스냅샷 (session_id -> JSON, 세션별 최신 것만 유지)
+        self._pending: Dict[int, str] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._write_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: int) -> bool:
+        return session_id in self._entries
+
+    def get(self, session_id: int) -> Optional[ConversationState]:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        state, size, last_used = entry
+        if self._expired(last_used, time.monotonic()):
+            self._remove(session_id, "idle")
+            return None
+        self._entries[session_id] = (state, size, time.monotonic())
+        self._entries.move_to_end(session_id)
+        return state
+
+    # 메모리 -> 세션 스냅샷 (저장 대기 중인 것 우선) -> 빈 상태 순으로 조회
+    async def load(self, db: AsyncSession, session_id: int) -> ConversationState:
+        state = self.get(session_id)
+        if state is not None:
+            state_loads.inc(source="memory")
+            return state
+
+        snapshot = self._pending.get(session_id)
+        if snapshot is None:
+            result = await db.execute(select(ChatSession.state_snapshot).where(ChatSession.id == session_id))
+            snapshot = result.scalar_one_or_none()
+        if snapshot:
+            state = ConversationState.model_validate_json(snapshot)
+            state_loads.inc(source="snapshot")
+        else:
+            state = ConversationState(session_id=session_id)
+            state_loads.inc(source="new")
+        self.save(state)
+        return state
+
+    # 상태 변경 후 호출 (크기 갱신 및 LRU 갱신)
+    def save(self, state: ConversationState):
+        size = len(state.model_dump_json())
+        previous = self._entries.pop(state.session_id, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._entries[state.session_id] = (state, size, time.monotonic())
+        self._bytes += size
+        self._evict()
+
+    # 세션 종료 시 호출 (저장 대기 중인 스냅샷은 호출자가 직접 저장하도록 넘기고 대기열에서 제외)
+    def pop(self, session_id: int) -> Optional[ConversationState]:
+        snapshot = self._pending.pop(session_id, None)
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return ConversationState.model_validate_json(snapshot) if snapshot else None
+        self._remove(session_id, None)
+        return entry[0]
+
+    # 유휴 만료 상태 일괄 제거
+    def evict_idle(self) -> int:
+        now = time.monotonic()
+        expired = [session_id for session_id, (_, _, last_used) in self._entries.items()
+                   if self._expired(last_used, now)]
+        for session_id in expired:
+            self._remove(session_id, "idle")
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self._bytes, "pending_snapshots": len(self._pending)}
+
+    # 진행 중인 스냅샷 저장을 기다리고 남은 스냅샷까지 저장 (종료 시 호출)
+    async def flush(self):
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        for session_id, snapshot in list(self._pending.items()):
+            await self._write_snapshot(session_id, snapshot)
+
+    def _expired(self, last_used: float, now: float) -> bool:
+        return self.idle_ttl_seconds > 0 and now - last_used >= self.idle_ttl_seconds
+
+    def _evict(self):
+        # LRU 순서이므로 앞쪽부터 유휴 만료 상태 제거
+        now = time.monotonic()
+        while self._entries:
+            session_id, (_, _, last_used) = next(iter(self._entries.items()))
+            if not self._expired(last_used, now):
+                break
+            self._remove(session_id, "idle")
+
+        # 가장 오래 사용하지 않은 상태부터 제거 (가장 최근 상태 하나는 유지)
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            session_id = next(iter(self._entries))
+            self._remove(session_id, "capacity")
+        state_entries.set(len(self._entries))
+        state_bytes.set(self._bytes)
+
+    def _remove(self, session_id: int, reason: Optional[str]):
+        state, size, _ = self._entries.pop(session_id)
+        self._bytes -= size
+        if reason:
+            state_evictions.inc(reason=reason)
+            self._persist(state)
+        state_entries.set(len(self._entries))
+        state_bytes.set(self._bytes)
+
+    # 제거 시점의 상태를 직렬화해 두고 백그라운드로 저장 (실행 중인 이벤트 루프가 없으면 flush에서 저장)
+    def _persist(self, state: ConversationState):
+        if self.session_factory is None:
+            return
+        snapshot = state.model_dump_json()
+        self._pending[state.session_id] = snapshot
+        try:
+            task = asyncio.get_running_loop().create_task(self._write_snapshot(state.session_id, snapshot))
+        except RuntimeError:
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write_snapshot(self, session_id: int, snapshot: str):
+        # 같은 세션이 다시 제거되면 오래된 스냅샷이 나중에 커밋되지 않도록 순서대로 저장
+        async with self._write_lock:
+            if self._pending.get(session_id) is not snapshot:
+                return
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(
+                        update(ChatSession).where(ChatSession.id == session_id).values(state_snapshot=snapshot)
+                    )
+                    await db.commit()
+                state_snapshot_writes.inc(outcome="success")
+            except Exception as e:
+                print(f"[대화 상태 스냅샷 저장 오류] session_id={session_id}: {e}")
+                state_snapshot_writes.inc(outcome="error")
+            finally:
+                if self._pending.get(session_id) is snapshot:
+                    del self._pending[session_id]
+
+
+conversation_state_store = ConversationStateStore(
+    max_entries=settings.CONVERSATION_STATE_MAX_ENTRIES,
+    max_bytes=settings.CONVERSATION_STATE_MAX_BYTES,
+    idle_ttl_seconds=settings.CONVERSATION_STATE_IDLE_TTL_SECONDS,
+    session_factory=AsyncSessionLocal
+)
@@ -6,6 +6,22 @@ load_dotenv()
 class Settings:
     # OpenAI API 설정
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL")
+
+    # LLM 게이트웨이 설정 (동시성 제한, 호출 기한, 재시도)
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    LLM_BACKOFF_BASE_SECONDS: float = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+    LLM_BACKOFF_MAX_SECONDS: float = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8"))
+
+    # 모델 등급 라우팅 설정
+    # 등급: "이름=모델:응답 예산(초)", 경로: "호출 지점=등급>대체 등급" (지정한 호출 지점만 기본 경로를 덮어씀)
+    LLM_MODEL_TIERS: str = os.getenv("LLM_MODEL_TIERS", "fast=gpt-4o-mini:8,standard=gpt-4o:15,large=gpt-4-turbo:30")
+    LLM_MODEL_ROUTES: str = os.getenv("LLM_MODEL_ROUTES", "")
+    # 이 비율만큼의 temperature=0 호출은 기준 등급으로도 호출해 응답 일치율 기록 (0이면 비활성화)
+    LLM_REFERENCE_TIER: str = os.getenv("LLM_REFERENCE_TIER", "large")
+    LLM_ROUTING_SHADOW_RATE: float = float(os.getenv("LLM_ROUTING_SHADOW_RATE", "0"))
 
     # 데이터베이스 설정
     DB_HOST: str = os.getenv("DB_HOST")
@@ -13,12 +29,58 @@ class Settings:
     DB_USER: str = os.getenv("DB_USER")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD")
     DB_NAME: str = os.getenv("DB_NAME")
+    # 커넥션 풀 크기와 기동 시 미리 열어 확인할 연결 수
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_WARM_CONNECTIONS: int = int(os.getenv("DB_WARM_CONNECTIONS", os.getenv("DB_POOL_SIZE", "5")))
+    # 지정 시 DB_* 대신 사용할 SQLAlchemy URL (예: 벤치마크용 sqlite+aiosqlite)
+    DATABASE_URL: str = os.getenv("DATABASE_URL")
 
     # 애플리케이션 설정
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
 
+    # 이 시간(초) 이상 걸린 요청은 요청 ID, SQL 통계와 함께 로그 출력
+    SLOW_REQUEST_LOG_SECONDS: float = float(os.getenv("SLOW_REQUEST_LOG_SECONDS", "1.0"))
+
+    # GPT 응답 캐시 설정
+    GPT_CACHE_ENABLED: bool = os.getenv("GPT_CACHE_ENABLED", "True").lower() == "true"
+    GPT_CACHE_PATH: str = os.getenv("GPT_CACHE_PATH", ".cache/gpt_responses.sqlite3")
+    GPT_CACHE_TTL_SECONDS: int = int(os.getenv("GPT_CACHE_TTL_SECONDS", "604800"))
+    GPT_CACHE_MEMORY_ENTRIES: int = int(os.getenv("GPT_CACHE_MEMORY_ENTRIES", "2048"))
+    GPT_CACHE_DISK_ENTRIES: int = int(os.getenv("GPT_CACHE_DISK_ENTRIES", "100000"))
+
+    # 로컬 의도 분류기 확신도 기준 (이상이면 GPT 호출 생략)
+    INTENT_CONFIDENCE_THRESHOLD: float = float(os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.85"))
+
+    # 강의 개요 필터링 시 GPT에 전달할 최대 후보 수 (0이면 로컬 사전 필터링 비활성화)
+    DESCRIPTION_PREFILTER_TOP_K: int = int(os.getenv("DESCRIPTION_PREFILTER_TOP_K", "8"))
+
+    # 후보 목록이 포함된 프롬프트의 호출별 토큰 예산
+    PROMPT_TOKEN_BUDGET: int = int(os.getenv("PROMPT_TOKEN_BUDGET", "1500"))
+
+    # 채팅 로그 일괄 저장 설정
+    CHAT_LOG_BATCH_SIZE: int = int(os.getenv("CHAT_LOG_BATCH_SIZE", "100"))
+    CHAT_LOG_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("CHAT_LOG_FLUSH_INTERVAL_SECONDS", "0.5"))
+    CHAT_LOG_QUEUE_SIZE: int = int(os.getenv("CHAT_LOG_QUEUE_SIZE", "10000"))
+
+    # 채팅 기록 조회/내보내기 설정 (페이지 최대 크기, 서버 측 커서에서 한 번에 가져올 행 수)
+    CHAT_HISTORY_MAX_PAGE_SIZE: int = int(os.getenv("CHAT_HISTORY_MAX_PAGE_SIZE", "200"))
+    CHAT_EXPORT_CHUNK_SIZE: int = int(os.getenv("CHAT_EXPORT_CHUNK_SIZE", "1000"))
+
+    # 대화 상태 저장소 설정 (최대 세션 수, 메모리 상한, 유휴 만료)
+    CONVERSATION_STATE_MAX_ENTRIES: int = int(os.getenv("CONVERSATION_STATE_MAX_ENTRIES", "10000"))
+    CONVERSATION_STATE_MAX_BYTES: int = int(os.getenv("CONVERSATION_STATE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CONVERSATION_STATE_IDLE_TTL_SECONDS: int = int(os.getenv("CONVERSATION_STATE_IDLE_TTL_SECONDS", "1800"))
+
+    # 강의 카탈로그 캐시 설정
+    # 이 프로세스의 ORM으로 바꾼 카탈로그 테이블은 즉시 반영되지만, 직접 실행한 SQL/마이그레이션/배치 적재나
+    # 다른 서버 인스턴스에서 바꾼 내용은 최대 이 시간(초)만큼 늦게 반영됨 (0이면 재시작 전까지 재적재 안 함)
+    CATALOG_TTL_SECONDS: int = int(os.getenv("CATALOG_TTL_SECONDS", "3600"))
+
     @property
     def database_url(self) -> str:
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
         return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
 settings = Settings()
\ No newline at end of file
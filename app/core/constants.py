@@ -5,6 +5,10 @@ field_practice_required = 1
 major_required_lectures = 33
 general_required_lectures = 13
 
+# 학기당 최대 수강 학점, 재수강 대상 성적
+max_semester_credits = 21
+retake_grades = ("C+", "C0", "D+", "D0", "F")
+
 preferred_professors = [
     {"id": 124, "name": "이상호"},
     {"id": 125, "name": "최종필"},
@@ -0,0 +1,167 @@
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SQL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+SQL_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+http_request_seconds = metrics_registry.histogram(
+    "http_request_seconds", "라우트별 요청 처리 시간 (응답 본문 전송 완료까지)", ["method", "route", "status"], HTTP_BUCKETS
+)
+http_requests_inflight = metrics_registry.gauge("http_requests_inflight", "처리 중인 HTTP 요청 수")
+http_request_sql_statements = metrics_registry.histogram(
+    "http_request_sql_statements", "요청당 실행한 SQL 문 수", ["route"], COUNT_BUCKETS
+)
+http_request_sql_seconds = metrics_registry.histogram(
+    "http_request_sql_seconds", "요청당 SQL 실행 시간 합계", ["route"], HTTP_BUCKETS
+)
+sql_statement_seconds = metrics_registry.histogram(
+    "sql_statement_seconds", "SQL 문 실행 시간", ["operation"], SQL_BUCKETS
+)
+sql_errors = metrics_registry.counter("sql_errors_total", "SQL 실행 오류 수", ["error"])
+db_pool_checkout_seconds = metrics_registry.histogram(
+    "db_pool_checkout_seconds", "커넥션 풀 체크아웃 대기 시간 (새 연결 생성 포함)", (), SQL_BUCKETS
+)
+db_pool_checkout_timeouts = metrics_registry.counter("db_pool_checkout_timeouts_total", "커넥션 풀 체크아웃 시간 초과 수")
+db_pool_checked_out = metrics_registry.gauge("db_pool_checked_out", "사용 중인 커넥션 수 (수집 시점)")
+db_pool_overflow = metrics_registry.gauge("db_pool_overflow", "pool_size를 넘겨 연 커넥션 수 (수집 시점)")
+
+
+# 요청 하나 동안 누적하는 SQL 통계
+class RequestStats:
+    __slots__ = ("sql_statements", "sql_seconds")
+
+    def __init__(self):
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+request_stats_var: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+# 현재 요청 ID (요청 밖에서는 "-"), 로그 앞에 붙여 요청 단위로 추적
+def current_request_id() -> str:
+    return request_id_var.get()
+
+
+# 체크아웃 대기 시간을 기록하는 비동기 큐 풀
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts.inc()
+            raise
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - start)
+
+
+# 수집 시점의 풀 사용량 반영 (큐 풀이 아니면 무시)
+def update_pool_gauges(engine: Engine):
+    pool = engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        db_pool_checked_out.set(pool.checkedout())
+        db_pool_overflow.set(max(pool.overflow(), 0))
+
+
+# 엔진 이벤트로 SQL 문 실행 시간/오류 기록 (요청 중이면 요청 통계에도 누적)
+def instrument_engine(engine: Engine):
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        operation = statement.lstrip()[:6].upper()
+        sql_statement_seconds.observe(elapsed, operation=operation if operation in SQL_OPERATIONS else "OTHER")
+        stats = request_stats_var.get()
+        if stats is not None:
+            stats.sql_statements += 1
+            stats.sql_seconds += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+        sql_errors.inc(error=type(context.original_exception).__name__)
+
+
+# 요청 ID 부여, 라우트별 지연 시간과 요청당 SQL 통계 기록 (순수 ASGI라 스트리밍 응답도 끝까지 측정)
+class ObservabilityMiddleware:
+    def __init__(self, app, slow_request_seconds: float = settings.SLOW_REQUEST_LOG_SECONDS):
+        self.app = app
+        self.slow_request_seconds = slow_request_seconds
+        self._route_paths: Dict[Callable, str] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _header(scope, b"x-request-id")[:64] or uuid.uuid4().hex
+        stats = RequestStats()
+        id_token = request_id_var.set(request_id)
+        stats_token = request_stats_var.set(stats)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        http_requests_inflight.inc()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_inflight.dec()
+            route = self._route(scope)
+            http_request_seconds.observe(elapsed, method=scope["method"], route=route, status=str(status))
+            http_request_sql_statements.observe(stats.sql_statements, route=route)
+            http_request_sql_seconds.observe(stats.sql_seconds, route=route)
+            if elapsed >= self.slow_request_seconds:
+                print(f"[{request_id}] [느린 요청] {scope['method']} {route} {status} {elapsed * 1000:.1f}ms "
+                      f"SQL {stats.sql_statements}건 {stats.sql_seconds * 1000:.1f}ms")
+            request_stats_var.reset(stats_token)
+            request_id_var.reset(id_token)
+
+    # 경로 변수 대신 라우트 템플릿으로 라벨링 (매칭되지 않은 요청은 하나로 묶음)
+    def _route(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            router = scope.get("router")
+            for route in getattr(router, "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            path = path or "unmatched"
+            self._route_paths[endpoint] = path
+        return path
+
+
+def _header(scope, name: bytes) -> str:
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return ""
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.metrics import metrics_registry
+
+startup_step_seconds = metrics_registry.gauge("startup_step_seconds", "기동 준비 단계별 소요 시간", ["step"])
+startup_ready = metrics_registry.gauge("startup_ready", "기동 준비 완료 여부 (1이면 완료)")
+
+
+# 기동 준비 상태 (/ready 응답), 단계별 소요 시간과 실패 사유 기록
+class StartupState:
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.ready_at: Optional[float] = None
+        self.steps: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_at is not None
+
+    async def run_step(self, name: str, step: Callable[[], Awaitable]):
+        start = time.monotonic()
+        try:
+            await step()
+        except Exception as e:
+            self.errors[name] = f"{type(e).__name__}: {e}"
+            print(f"[기동 준비 실패] {name}: {e}")
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            self.steps[name] = elapsed
+            startup_step_seconds.set(elapsed, step=name)
+
+    def mark_ready(self):
+        self.ready_at = time.monotonic()
+        startup_ready.set(1)
+
+    def report(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+            "ready_after_seconds": round(self.ready_at - self.started_at, 3) if self.ready else None,
+            "steps_ms": {name: round(seconds * 1000, 1) for name, seconds in self.steps.items()},
+            "errors": dict(self.errors),
+        }
+
+
+# 여러 준비 단계를 동시에 실행하고 모두 성공하면 준비 완료로 표시
+async def warm_up(state: StartupState, steps: Dict[str, Callable[[], Awaitable]]) -> bool:
+    results = await asyncio.gather(
+        *(state.run_step(name, step) for name, step in steps.items()),
+        return_exceptions=True
+    )
+    if any(isinstance(result, BaseException) for result in results):
+        return False
+    state.mark_ready()
+    return True
+
+
+startup_state = StartupState()
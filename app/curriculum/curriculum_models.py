@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database.base import Base
 from datetime import datetime
@@ -6,6 +6,9 @@ from datetime import datetime
 
 class Curriculum(Base):
     __tablename__ = "curriculums"
+    __table_args__ = (
+        Index("ix_curriculums_user_id_name", "user_id", "name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)
@@ -21,7 +24,7 @@ class CurriLecture(Base):
     __tablename__ = "curri_lectures"
 
     id = Column(Integer, primary_key=True, index=True)
-    curri_id = Column(Integer, ForeignKey("curriculums.id"))
+    curri_id = Column(Integer, ForeignKey("curriculums.id"), index=True)
     lect_id = Column(Integer, ForeignKey("lecture_code.id"))
     name = Column(String(255), nullable=False)
     credits = Column(Integer, nullable=False)
@@ -1,10 +1,21 @@
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
 from app.curriculum.curriculum_models import Curriculum, CurriLecture
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from app.lecture.lecture_catalog import lecture_catalog
 from app.lecture.lecture_models import LectureCode
+from app.lecture.lecture_record import LectureRecord
+
+
+# 일괄 저장할 커리큘럼
+class CurriculumDraft(NamedTuple):
+    user_id: int
+    name: str
+    total_credits: int
+    lectures: Sequence[LectureRecord]
+    description: str = ""
 
 
 class CurriculumCrud:
@@ -35,6 +46,18 @@ class CurriculumCrud:
     async def get_curri_lecture_by_id(self, curri_lecture_id: int) -> Optional[CurriLecture]:
         return await self.db.get(CurriLecture, curri_lecture_id)
 
+    # 커리큘럼에 담긴 강의 조회 (필요한 컬럼만 조회)
+    async def get_curri_lectures(self, curri_id: int) -> List[LectureRecord]:
+        stmt = (
+            select(LectureCode.code, CurriLecture.name, CurriLecture.credits, CurriLecture.type,
+                   CurriLecture.grade, CurriLecture.semester)
+            .join(LectureCode, LectureCode.id == CurriLecture.lect_id)
+            .where(CurriLecture.curri_id == curri_id)
+            .order_by(CurriLecture.id)
+        )
+        result = await self.db.execute(stmt)
+        return [LectureRecord(*row) for row in result]
+
     # 커리큘럼 저장
     async def save_curriculum(self, user_id: int, name: str, total_credits: int, description: str = "") -> int:
         curriculum = Curriculum(
@@ -46,51 +69,91 @@ class CurriculumCrud:
         )
         self.db.add(curriculum)
         await self.db.commit()
-        await self.db.refresh(curriculum)
         return curriculum.id
 
     # 커리큘럼 강의 저장
-    async def save_curri_lectures(self, curri_id: int, lectures: list):
-        # 강의 코드 매핑 조회
-        lecture_codes = [lec[7] for lec in lectures if len(lec) > 7 and lec[7]]
-        stmt = select(LectureCode.code, LectureCode.id).where(LectureCode.code.in_(lecture_codes))
-        result = await self.db.execute(stmt)
-        code_id_map = {row.code: row.id for row in result}
-
-        curri_lectures = []
-        for (name, credit, lec_type, grade, semester, _, _, code, _) in lectures:
-            if code in code_id_map:
-                curri_lecture = CurriLecture(
-                    curri_id=curri_id,
-                    lect_id=code_id_map[code],
-                    name=name,
-                    credits=credit,
-                    semester=semester,
-                    type=lec_type,
-                    grade=grade
-                )
-                curri_lectures.append(curri_lecture)
-
-        self.db.add_all(curri_lectures)
+    async def save_curri_lectures(self, curri_id: int, lectures: Sequence[LectureRecord]):
+        code_id_map = (await lecture_catalog.get(self.db)).code_id_map
+        rows = self._curri_lecture_rows(curri_id, lectures, code_id_map)
+        if rows:
+            await self.db.execute(insert(CurriLecture).values(rows))
+        await self.db.commit()
+
+    # 여러 커리큘럼과 강의를 한 트랜잭션으로 저장 (커리큘럼 수와 무관하게 왕복 횟수 일정)
+    async def save_curricula(self, drafts: Sequence[CurriculumDraft]) -> List[int]:
+        if not drafts:
+            return []
+
+        code_id_map = (await lecture_catalog.get(self.db)).code_id_map
+        curri_ids = await self._insert_curricula(drafts)
+        rows = []
+        for curri_id, draft in zip(curri_ids, drafts):
+            rows.extend(self._curri_lecture_rows(curri_id, draft.lectures, code_id_map))
+        if rows:
+            await self.db.execute(insert(CurriLecture).values(rows))
+
         await self.db.commit()
+        return curri_ids
+
+    # 커리큘럼 행을 한 번에 INSERT하고 드래프트 순서대로 생성된 ID 반환
+    # ((user_id, name)은 고유하지 않으므로 이름으로 다시 조회하지 않고 INSERT 결과에서 ID를 얻음)
+    async def _insert_curricula(self, drafts: Sequence[CurriculumDraft]) -> List[int]:
+        created_at = datetime.now()
+        values = [
+            {
+                "user_id": draft.user_id,
+                "name": draft.name,
+                "created_at": created_at,
+                "total_credits": draft.total_credits,
+                "description": draft.description,
+            }
+            for draft in drafts
+        ]
+
+        # RETURNING을 지원하는 DB(SQLite, MariaDB 등)는 입력 순서대로 ID를 돌려받음
+        if self.db.get_bind().dialect.insert_returning:
+            result = await self.db.execute(
+                insert(Curriculum).returning(Curriculum.id, sort_by_parameter_order=True), values
+            )
+            return list(result.scalars())
+
+        # MySQL: 다중 행 INSERT 하나는 연속된 AUTO_INCREMENT 값을 받고 LAST_INSERT_ID()는 첫 행의 ID
+        # (auto_increment_increment = 1 기준)
+        result = await self.db.execute(insert(Curriculum).values(values))
+        if result.rowcount != len(drafts):
+            raise RuntimeError(f"커리큘럼 INSERT 행 수 불일치 ({result.rowcount} != {len(drafts)})")
+        return list(range(result.lastrowid, result.lastrowid + len(drafts)))
+
+    @staticmethod
+    def _curri_lecture_rows(curri_id: int, lectures: Sequence[LectureRecord], code_id_map: Dict[str, int]) -> List[Dict]:
+        return [
+            {
+                "curri_id": curri_id,
+                "lect_id": code_id_map[lec.code],
+                "name": lec.name,
+                "credits": lec.credits,
+                "semester": lec.semester,
+                "type": lec.type,
+                "grade": lec.grade,
+            }
+            for lec in lectures
+            if lec.code in code_id_map
+        ]
 
     # 커리큘럼 이름으로 삭제
     async def delete_curriculum_by_name(self, user_id: int, curriculum_name: str) -> bool:
-        stmt = select(Curriculum).where(
+        curriculum_ids = select(Curriculum.id).where(
             Curriculum.user_id == user_id,
             Curriculum.name == curriculum_name
-        )
-        result = await self.db.execute(stmt)
-        curriculum = result.scalar_one_or_none()
-
-        if not curriculum:
-            return False
+        ).scalar_subquery()
 
         # 관련 강의들 먼저 삭제
-        delete_lectures_stmt = delete(CurriLecture).where(CurriLecture.curri_id == curriculum.id)
-        await self.db.execute(delete_lectures_stmt)
+        await self.db.execute(delete(CurriLecture).where(CurriLecture.curri_id.in_(curriculum_ids)))
 
         # 커리큘럼 삭제
-        await self.db.delete(curriculum)
+        result = await self.db.execute(delete(Curriculum).where(
+            Curriculum.user_id == user_id,
+            Curriculum.name == curriculum_name
+        ))
         await self.db.commit()
-        return True
\ No newline at end of file
+        return result.rowcount > 0
@@ -0,0 +1,119 @@
+from typing import AbstractSet, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.core import constants
+
+MAJOR_TYPES = ("전선", "전필", "ME", "MR")
+GENERAL_TYPES = ("교선", "교필", "GE", "GR")
+MAJOR_REQUIRED_TYPES = ("전필", "MR")
+FIELD_PRACTICE = "현장실습"
+
+
+class LedgerEntry(NamedTuple):
+    code: str
+    name: str
+    credits: int
+    type: str
+    score: Optional[str] = None
+
+
+# 졸업 요건 진행 상황 누적 장부 (강의 추가/삭제/재수강을 O(1)로 반영)
+class CreditLedger:
+    def __init__(self):
+        self._entries: Dict[str, LedgerEntry] = {}
+        self.total_credits = 0
+        self.major_credits = 0
+        self.general_credits = 0
+        self.field_practice_credits = 0
+        self.major_required_credits_earned = 0
+
+    # completed_data 형식 ({학기: {유형: [(코드, 이름, 학점, 성적)]}})에서 생성
+    # 같은 코드가 여러 번 나오면 마지막 항목 하나만 인정 (재수강). 장부 도입 전 계산은 중복 학점을 모두
+    # 더했으므로, 중복 코드가 있는 성적표는 calculate_credits/졸업 요건 검사 결과가 이전보다 작게 나옴
+    @classmethod
+    def from_lecture_data(cls, lecture_data: Dict) -> "CreditLedger":
+        ledger = cls()
+        for semester, lectures in lecture_data.items():
+            for lecture_type, lectures_list in lectures.items():
+                for code, name, credit, score in lectures_list:
+                    ledger.add(code, name, credit, lecture_type, score)
+        return ledger
+
+    # 대화 상태 스냅샷에 저장한 항목에서 복원
+    @classmethod
+    def from_entries(cls, entries: Iterable[LedgerEntry]) -> "CreditLedger":
+        ledger = cls()
+        for entry in entries:
+            ledger.add(*entry)
+        return ledger
+
+    def entries(self) -> List[LedgerEntry]:
+        return list(self._entries.values())
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def completed_codes(self) -> AbstractSet[str]:
+        return self._entries.keys()
+
+    def get(self, code: str) -> Optional[LedgerEntry]:
+        return self._entries.get(code)
+
+    def _apply(self, entry: LedgerEntry, sign: int):
+        self.total_credits += sign * entry.credits
+        if entry.type in MAJOR_TYPES:
+            self.major_credits += sign * entry.credits
+        elif entry.type in GENERAL_TYPES:
+            self.general_credits += sign * entry.credits
+        if entry.type in MAJOR_REQUIRED_TYPES:
+            self.major_required_credits_earned += sign * entry.credits
+        if FIELD_PRACTICE in entry.name:
+            self.field_practice_credits += sign
+
+    # 강의 추가 (이미 있는 코드면 새 정보로 교체)
+    def add(self, code: str, name: str, credits: int, lecture_type: str, score: Optional[str] = None):
+        self.remove(code)
+        entry = LedgerEntry(code, name, credits, lecture_type, score)
+        self._entries[code] = entry
+        self._apply(entry, 1)
+
+    def remove(self, code: str) -> Optional[LedgerEntry]:
+        entry = self._entries.pop(code, None)
+        if entry is not None:
+            self._apply(entry, -1)
+        return entry
+
+    # 재수강: 학점은 한 번만 인정되므로 성적만 갱신
+    def retake(self, code: str, score: str) -> bool:
+        entry = self._entries.get(code)
+        if entry is None:
+            return False
+        self._entries[code] = entry._replace(score=score)
+        return True
+
+    # 재수강 대상 강의 코드 (constants.retake_grades 이하 성적)
+    def retake_candidates(self) -> AbstractSet[str]:
+        return {code for code, entry in self._entries.items() if entry.score in constants.retake_grades}
+
+    # CurriculumService.calculate_credits와 같은 형식
+    def as_tuple(self) -> Tuple[int, int, int, int, int, AbstractSet[str]]:
+        return (self.total_credits, self.major_credits, self.general_credits, self.field_practice_credits,
+                self.major_required_credits_earned, self.completed_codes)
+
+    # 졸업 요건별 (취득, 기준) 학점
+    def progress(self) -> Dict[str, Tuple[int, int]]:
+        return {
+            "total": (self.total_credits, constants.total_graduation_credits),
+            "major": (self.major_credits, constants.major_required_credits),
+            "general": (self.general_credits, constants.general_required_credits),
+            "field_practice": (self.field_practice_credits, constants.field_practice_required),
+        }
+
+    def remaining(self) -> Dict[str, int]:
+        return {key: max(required - earned, 0) for key, (earned, required) in self.progress().items()}
+
+    def is_graduation_ready(self) -> bool:
+        return not any(self.remaining().values())
@@ -1,42 +1,64 @@
-from typing import Dict, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.chat.chat_schemas import ConversationState
+from app.chat.conversation_state_store import conversation_state_store
+from app.core import constants
 from app.utils.completed_data import completed_data
 from app.curriculum.curriculum_repository import CurriculumCrud
+from app.curriculum.service.credit_ledger import CreditLedger
+from app.curriculum.service.curriculum_planner import CurriculumPlan, CurriculumPlanner
+from app.lecture.lecture_catalog import lecture_catalog
 
 
 class CurriculumService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, state: Optional[ConversationState] = None):
         self.db = db
         self.curriculum_repo = CurriculumCrud(db)
+        self.state = state
+        self._ledger: Optional[CreditLedger] = None
+
+    # 누적 학점 장부 (세션 상태가 있으면 세션에 보관해 턴마다 성적 데이터를 다시 순회하지 않음,
+    # 세션이 없으면 이 서비스 인스턴스 동안만 유지)
+    @property
+    def ledger(self) -> CreditLedger:
+        if self.state is not None:
+            if self.state.ledger is None:
+                self.state.attach_ledger(CreditLedger.from_lecture_data(completed_data))
+            return self.state.ledger
+        if self._ledger is None:
+            self._ledger = CreditLedger.from_lecture_data(completed_data)
+        return self._ledger
+
+    # 대화 중 강의 추가/삭제/재수강을 장부에 바로 반영 (세션 상태 크기/LRU 갱신)
+    def add_lecture(self, code: str, name: str, credits: int, lecture_type: str, score: Optional[str] = None):
+        self.ledger.add(code, name, credits, lecture_type, score)
+        self._save_state()
+
+    def remove_lecture(self, code: str) -> bool:
+        removed = self.ledger.remove(code) is not None
+        self._save_state()
+        return removed
+
+    def retake_lecture(self, code: str, score: str) -> bool:
+        retaken = self.ledger.retake(code, score)
+        self._save_state()
+        return retaken
+
+    def _save_state(self):
+        if self.state is not None:
+            conversation_state_store.save(self.state)
 
     # 학점 계산 함수
     def calculate_credits(self, lecture_data: Dict = None) -> Tuple[int, int, int, int, int, Set[str]]:
         if lecture_data is None:
-            lecture_data = completed_data
-
-        total_credits = 0
-        major_credits = 0
-        general_credits = 0
-        field_practice_credits = 0
-        major_required_credits_earned = 0
-        completed_lecture_codes = set()
-
-        for semester, lectures in lecture_data.items():
-            for lecture_type, lectures_list in lectures.items():
-                for code, name, credit, _ in lectures_list:
-                    total_credits += credit
-                    completed_lecture_codes.add(code)
-                    if lecture_type in ("전선", "전필", "ME", "MR"):
-                        major_credits += credit
-                    elif lecture_type in ("교선", "교필", "GE", "GR"):
-                        general_credits += credit
-                    if lecture_type in ("전필", "MR"):
-                        major_required_credits_earned += credit
-                    if "현장실습" in name:
-                        field_practice_credits += 1
+            ledger = self.ledger
+        else:
+            ledger = CreditLedger.from_lecture_data(lecture_data)
 
+        (total_credits, major_credits, general_credits, field_practice_credits,
+         major_required_credits_earned, completed_lecture_codes) = ledger.as_tuple()
         return (total_credits, major_credits, general_credits, field_practice_credits,
-                major_required_credits_earned, completed_lecture_codes)
+                major_required_credits_earned, set(completed_lecture_codes))
 
     # 커리큘럼 이름 생성 함수
     async def generate_curriculum_name(self, user_id: int) -> str:
@@ -49,4 +71,38 @@ class CurriculumService:
             candidate = f"커리큘럼 {i}"
             if candidate not in existing_names_set:
                 return candidate
-            i += 1
\ No newline at end of file
+            i += 1
+
+    # 재수강 대상 강의 코드 (constants.retake_grades 이하 성적)
+    def get_retake_codes(self, lecture_data: Dict = None) -> Set[str]:
+        ledger = self.ledger if lecture_data is None else CreditLedger.from_lecture_data(lecture_data)
+        return set(ledger.retake_candidates())
+
+    # 선호 교수 담당 강의 코드
+    async def get_preferred_professor_codes(self, year: str = None, semester: str = None) -> Set[str]:
+        professor_ids = [professor["id"] for professor in constants.preferred_professors]
+        catalog = await lecture_catalog.get(self.db)
+        return catalog.professor_index.codes(professor_ids, year, semester)
+
+    # GPT 호출 없이 졸업 요건을 채우는 학기별 커리큘럼 계획 생성
+    async def plan_curriculum(
+            self,
+            start_grade: int,
+            start_semester: int,
+            conditions: List[str],
+            lecture_data: Dict = None
+    ) -> CurriculumPlan:
+        ledger = self.ledger if lecture_data is None else CreditLedger.from_lecture_data(lecture_data)
+        snapshot = await lecture_catalog.get(self.db)
+        preferred_codes = (
+            await self.get_preferred_professor_codes() if "preferred_professor" in conditions else set()
+        )
+        planner = CurriculumPlanner(snapshot.lectures, snapshot.replacement_index)
+        return planner.plan(
+            ledger.as_tuple(),
+            start_grade,
+            start_semester,
+            conditions,
+            preferred_codes=preferred_codes,
+            retake_codes=ledger.retake_candidates()
+        )
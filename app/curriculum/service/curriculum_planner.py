@@ -0,0 +1,324 @@
+from typing import AbstractSet, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.core import constants
+from app.curriculum.service.credit_ledger import FIELD_PRACTICE, GENERAL_TYPES, MAJOR_TYPES
+from app.lecture.lecture_record import LectureRecord
+from app.lecture.replacement_index import ReplacementIndex
+
+REQUIRED_TYPES = ("전필", "교필", "MR", "GR")
+TEAM_PROJECT_VALUES = ("Y", "YES", "O", "1", "TRUE")
+
+
+class PlannedSemester(NamedTuple):
+    grade: int
+    semester: int
+    lectures: Tuple[LectureRecord, ...]
+
+    @property
+    def credits(self) -> int:
+        return sum(lecture.credits for lecture in self.lectures)
+
+
+class CurriculumPlan(NamedTuple):
+    semesters: Tuple[PlannedSemester, ...]
+    # 남은 졸업 요건 (0 이하이면 충족)
+    missing: Dict[str, int]
+    unscheduled_required: Tuple[LectureRecord, ...] = ()
+    retake_codes: frozenset = frozenset()
+
+    @property
+    def satisfied(self) -> bool:
+        return not self.unscheduled_required and all(value <= 0 for value in self.missing.values())
+
+
+def _to_int(value, default: Optional[int] = None) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+# 졸업 요건 상수 기반 로컬 커리큘럼 플래너 (필수 과목 백트래킹 배치 + 한계 가지치기 선택 과목 탐색)
+class CurriculumPlanner:
+    def __init__(
+            self,
+            lectures: Iterable[LectureRecord],
+            replacement_index: Optional[ReplacementIndex] = None,
+            max_semester_credits: int = constants.max_semester_credits,
+            last_grade: int = 4,
+            node_limit: int = 2000
+    ):
+        # 같은 코드가 여러 전공에 걸쳐 있으면 첫 번째만 사용
+        self.lectures: List[LectureRecord] = []
+        seen = set()
+        for lecture in lectures:
+            if lecture.code and lecture.code not in seen:
+                seen.add(lecture.code)
+                self.lectures.append(lecture)
+        self.replacement_index = replacement_index
+        self.max_semester_credits = max_semester_credits
+        self.last_grade = last_grade
+        self.node_limit = node_limit
+
+    def _equivalents(self, code: str) -> frozenset:
+        if self.replacement_index is None:
+            return frozenset((code,))
+        return self.replacement_index.equivalents(code)
+
+    def plan(
+            self,
+            earned: Tuple[int, int, int, int, int, AbstractSet[str]],
+            start_grade: int,
+            start_semester: int,
+            conditions: Sequence[str] = (),
+            preferred_codes: Iterable[str] = (),
+            retake_codes: Iterable[str] = ()
+    ) -> CurriculumPlan:
+        """
+        earned는 CurriculumService.calculate_credits (또는 CreditLedger.as_tuple) 반환값, conditions는 parse_conditions_with_gpt 키 목록.
+        """
+        total, major, general, field_practice, _, completed_codes = earned
+        preferred_codes = frozenset(preferred_codes) if "preferred_professor" in conditions else frozenset()
+        retake_codes = frozenset(retake_codes) if "retake" in conditions else frozenset()
+        no_team_project = "no_team_project" in conditions
+
+        terms = [
+            (grade, semester)
+            for grade in range(start_grade, self.last_grade + 1)
+            for semester in (1, 2)
+            if (grade, semester) >= (start_grade, start_semester)
+        ]
+        state = _PlanState(terms, self.max_semester_credits)
+        for code in completed_codes:
+            state.block(self._equivalents(code))
+
+        need = {
+            "total": constants.total_graduation_credits - total,
+            "major": constants.major_required_credits - major,
+            "general": constants.general_required_credits - general,
+            "field_practice": constants.field_practice_required - field_practice,
+        }
+
+        # 1) 필수 과목: 가능한 학기가 적은 과목부터 백트래킹으로 배치
+        required = []
+        for lecture in self.lectures:
+            if lecture.type in REQUIRED_TYPES and not state.is_blocked(lecture.code):
+                required.append(lecture)
+                state.block(self._equivalents(lecture.code))
+        for lecture in required:
+            state.unblock(self._equivalents(lecture.code))
+        required.sort(key=lambda lec: (len(self._offered_terms(lec, terms)), -lec.credits, lec.code))
+
+        unscheduled = []
+        self._nodes = 0
+        if not self._assign_required(required, 0, state, terms):
+            unscheduled = self._assign_first_fit(required, state, terms)
+        for lecture in required:
+            if lecture not in unscheduled:
+                self._apply(lecture, need, 1)
+
+        # 2) 선택 과목: 부족 요건 순으로 정렬 후 한계 가지치기 깊이 우선 탐색
+        electives = [
+            lecture for lecture in self.lectures
+            if lecture.type not in REQUIRED_TYPES
+            and lecture.code not in retake_codes
+            and not state.is_blocked(lecture.code)
+            and not (no_team_project and str(lecture.team_project).strip().upper() in TEAM_PROJECT_VALUES)
+        ]
+        major_first = need["major"] >= need["general"]
+        electives.sort(key=lambda lec: (
+            not (need["field_practice"] > 0 and FIELD_PRACTICE in lec.name),
+            lec.code not in preferred_codes,
+            (lec.type in GENERAL_TYPES) if major_first else (lec.type in MAJOR_TYPES),
+            -lec.credits,
+            _to_int(lec.grade, 0),
+            lec.code,
+        ))
+        suffix = self._suffix_bounds(electives)
+        offered = {lecture.code: self._offered_terms(lecture, terms) for lecture in electives}
+
+        self._nodes = 0
+        self._best = (self._deficit(need), [list(lectures) for lectures in state.schedule], dict(need))
+        if not self._search_electives(electives, suffix, offered, 0, state, need):
+            _, schedule, need = self._best
+            state.restore(schedule)
+            self._fill_electives(electives, offered, state, need)
+
+        # 3) 재수강: 요건 학점에는 포함되지 않으므로 요건을 채운 뒤 남는 학점 안에서 배치
+        for lecture in self.lectures:
+            if lecture.code not in retake_codes:
+                continue
+            for term in self._offered_terms(lecture, terms):
+                if state.capacity[term] >= lecture.credits:
+                    state.place(term, lecture, ())
+                    break
+
+        semesters = tuple(
+            PlannedSemester(grade, semester, tuple(state.schedule[i]))
+            for i, (grade, semester) in enumerate(terms)
+        )
+        return CurriculumPlan(semesters, need, tuple(unscheduled), retake_codes)
+
+    def _offered_terms(self, lecture: LectureRecord, terms: List[Tuple[int, int]]) -> List[int]:
+        grade = _to_int(lecture.grade, 1)
+        semester = _to_int(lecture.semester)
+        return [
+            i for i, (term_grade, term_semester) in enumerate(terms)
+            if term_grade >= grade and (semester is None or semester == term_semester)
+        ]
+
+    @staticmethod
+    def _apply(lecture: LectureRecord, need: Dict[str, int], sign: int):
+        need["total"] -= sign * lecture.credits
+        if lecture.type in MAJOR_TYPES:
+            need["major"] -= sign * lecture.credits
+        elif lecture.type in GENERAL_TYPES:
+            need["general"] -= sign * lecture.credits
+        if FIELD_PRACTICE in lecture.name:
+            need["field_practice"] -= sign
+
+    # 아직 부족한 요건을 하나라도 줄이는 강의인지
+    @staticmethod
+    def _is_useful(lecture: LectureRecord, need: Dict[str, int]) -> bool:
+        if need["field_practice"] > 0 and FIELD_PRACTICE in lecture.name:
+            return True
+        if lecture.type in MAJOR_TYPES and need["major"] > 0:
+            return True
+        if lecture.type in GENERAL_TYPES and need["general"] > 0:
+            return True
+        return need["total"] > max(need["major"], 0) + max(need["general"], 0)
+
+    @staticmethod
+    def _deficit(need: Dict[str, int]) -> int:
+        return sum(max(value, 0) for value in need.values())
+
+    def _assign_required(self, required: List[LectureRecord], i: int, state: "_PlanState", terms) -> bool:
+        if i == len(required):
+            return True
+        self._nodes += 1
+        if self._nodes > self.node_limit:
+            return False
+
+        lecture = required[i]
+        equivalents = self._equivalents(lecture.code)
+        for term in self._offered_terms(lecture, terms):
+            if state.capacity[term] >= lecture.credits:
+                state.place(term, lecture, equivalents)
+                if self._assign_required(required, i + 1, state, terms):
+                    return True
+                state.unplace(term, lecture, equivalents)
+        return False
+
+    def _assign_first_fit(self, required: List[LectureRecord], state: "_PlanState", terms) -> List[LectureRecord]:
+        unscheduled = []
+        for lecture in required:
+            equivalents = self._equivalents(lecture.code)
+            for term in self._offered_terms(lecture, terms):
+                if state.capacity[term] >= lecture.credits:
+                    state.place(term, lecture, equivalents)
+                    break
+            else:
+                unscheduled.append(lecture)
+        return unscheduled
+
+    # 요건을 모두 채우는 배치가 없으면 (남은 학기로 부족하거나 노드 한도 초과) 최선의 배치에
+    # 부족 요건을 줄이는 과목을 남는 학점 안에서 순서대로 추가 (탐색 첫 단계에서 가지치기되면 빈 배치로 끝나므로)
+    def _fill_electives(self, electives, offered, state: "_PlanState", need: Dict[str, int]):
+        for lectures in state.schedule:
+            for lecture in lectures:
+                if not state.is_blocked(lecture.code):
+                    state.block(self._equivalents(lecture.code))
+        for lecture in electives:
+            if state.is_blocked(lecture.code) or not self._is_useful(lecture, need):
+                continue
+            for term in offered[lecture.code]:
+                if state.capacity[term] >= lecture.credits:
+                    state.place(term, lecture, self._equivalents(lecture.code))
+                    self._apply(lecture, need, 1)
+                    break
+
+    # i번째 이후 선택 과목으로 채울 수 있는 최대 학점/현장실습 수 (가지치기용 상한)
+    @staticmethod
+    def _suffix_bounds(electives: List[LectureRecord]) -> List[Tuple[int, int, int]]:
+        suffix = [(0, 0, 0)] * (len(electives) + 1)
+        for i in range(len(electives) - 1, -1, -1):
+            lecture = electives[i]
+            major, general, field = suffix[i + 1]
+            if lecture.type in MAJOR_TYPES:
+                major += lecture.credits
+            elif lecture.type in GENERAL_TYPES:
+                general += lecture.credits
+            if FIELD_PRACTICE in lecture.name:
+                field += 1
+            suffix[i] = (major, general, field)
+        return suffix
+
+    def _search_electives(self, electives, suffix, offered, start: int, state: "_PlanState", need: Dict[str, int]) -> bool:
+        deficit = self._deficit(need)
+        if deficit == 0:
+            return True
+        if deficit < self._best[0]:
+            self._best = (deficit, [list(lectures) for lectures in state.schedule], dict(need))
+
+        self._nodes += 1
+        if self._nodes > self.node_limit:
+            return False
+
+        # 남은 학기 학점으로 전공/교양 부족분을 동시에 채울 수 없거나 남은 후보가 부족하면 가지치기
+        capacity = sum(state.capacity)
+        major, general, field = suffix[start]
+        if (capacity < max(need["total"], max(need["major"], 0) + max(need["general"], 0))
+                or major < need["major"] or general < need["general"] or field < need["field_practice"]):
+            return False
+
+        for j in range(start, len(electives)):
+            lecture = electives[j]
+            if state.is_blocked(lecture.code) or not self._is_useful(lecture, need):
+                continue
+            equivalents = self._equivalents(lecture.code)
+            for term in offered[lecture.code]:
+                if state.capacity[term] < lecture.credits:
+                    continue
+                state.place(term, lecture, equivalents)
+                self._apply(lecture, need, 1)
+                if self._search_electives(electives, suffix, offered, j + 1, state, need):
+                    return True
+                self._apply(lecture, need, -1)
+                state.unplace(term, lecture, equivalents)
+                if self._nodes > self.node_limit:
+                    return False
+        return False
+
+
+class _PlanState:
+    def __init__(self, terms: List[Tuple[int, int]], max_semester_credits: int):
+        self.capacity = [max_semester_credits] * len(terms)
+        self.schedule: List[List[LectureRecord]] = [[] for _ in terms]
+        self._blocked: Dict[str, int] = {}
+
+    def is_blocked(self, code: str) -> bool:
+        return self._blocked.get(code, 0) > 0
+
+    def block(self, codes: Iterable[str]):
+        for code in codes:
+            self._blocked[code] = self._blocked.get(code, 0) + 1
+
+    def unblock(self, codes: Iterable[str]):
+        for code in codes:
+            self._blocked[code] -= 1
+
+    def place(self, term: int, lecture: LectureRecord, equivalents: Iterable[str]):
+        self.capacity[term] -= lecture.credits
+        self.schedule[term].append(lecture)
+        self.block(equivalents)
+
+    def unplace(self, term: int, lecture: LectureRecord, equivalents: Iterable[str]):
+        self.capacity[term] += lecture.credits
+        self.schedule[term].pop()
+        self.unblock(equivalents)
+
+    def restore(self, schedule: List[List[LectureRecord]]):
+        for term, lectures in enumerate(schedule):
+            self.capacity[term] += sum(lecture.credits for lecture in self.schedule[term])
+            self.capacity[term] -= sum(lecture.credits for lecture in lectures)
+        self.schedule = schedule
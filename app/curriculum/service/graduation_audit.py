@@ -0,0 +1,214 @@
+# 전체 학생 졸업 요건 일괄 점검 (야간 배치)
+#
+# 사용법:
+#   python -m app.curriculum.service.graduation_audit --input transcripts.jsonl --output audit.jsonl --workers 4
+#
+# 입력은 한 줄에 학생 한 명씩 {"student_id": ..., "grade": 3, "transcript": {completed_data 형식}}.
+# 성적표 테이블이 아직 없으므로 JSONL을 줄 단위로 스트리밍하며, 강의 카탈로그는 DB에서 한 번만 읽어
+# 모든 작업 프로세스가 같은 스냅샷을 공유한다.
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.core import constants
+from app.curriculum.service.credit_ledger import FIELD_PRACTICE, GENERAL_TYPES, MAJOR_REQUIRED_TYPES, MAJOR_TYPES
+from app.lecture.lecture_catalog import CatalogSnapshot
+from app.lecture.lecture_record import grade_level
+
+REQUIRED_TYPES = ("MR", "GR")
+
+
+# 작업 프로세스에 한 번 전달되는 필수 과목 테이블
+class AuditTables(NamedTuple):
+    required_codes: Tuple[str, ...]
+    required_names: Tuple[str, ...]
+    required_is_mr: np.ndarray
+    required_grades: np.ndarray
+    # 이수 코드 -> 충족되는 필수 과목 열 번호 (대체 교과목 포함)
+    code_to_required: Dict[str, Tuple[int, ...]]
+
+
+def build_audit_tables(snapshot: CatalogSnapshot) -> AuditTables:
+    required = []
+    seen = set()
+    for lecture_type in REQUIRED_TYPES:
+        for lecture in snapshot.by_type.get(lecture_type, ()):
+            if lecture.code not in seen and grade_level(lecture.grade) is not None:
+                seen.add(lecture.code)
+                required.append(lecture)
+
+    code_to_required: Dict[str, List[int]] = {}
+    for column, lecture in enumerate(required):
+        for code in snapshot.replacement_index.equivalents(lecture.code):
+            code_to_required.setdefault(code, []).append(column)
+
+    return AuditTables(
+        required_codes=tuple(lecture.code for lecture in required),
+        required_names=tuple(lecture.name for lecture in required),
+        required_is_mr=np.array([lecture.type == "MR" for lecture in required], dtype=bool),
+        required_grades=np.array([grade_level(lecture.grade) for lecture in required], dtype=np.int16),
+        code_to_required={code: tuple(columns) for code, columns in code_to_required.items()},
+    )
+
+
+_tables: Optional[AuditTables] = None
+
+
+def _init_worker(tables: AuditTables):
+    global _tables
+    _tables = tables
+
+
+# 학생 묶음 단위 점검 (학점 합계는 bincount, 미이수 필수 과목은 불리언 행렬 연산)
+def audit_chunk(records: List[Dict], tables: Optional[AuditTables] = None) -> List[Dict]:
+    tables = tables or _tables
+    count = len(records)
+    columns = len(tables.required_codes)
+
+    student_idx, credits, type_idx, field_rows = [], [], [], []
+    completed_rows, completed_cols = [], []
+    type_ids: Dict[str, int] = {}
+    code_to_required = tables.code_to_required
+    for i, record in enumerate(records):
+        # 같은 코드가 여러 학기에 있으면 마지막 것만 인정 (CreditLedger와 동일)
+        lectures = {
+            code: (name, credit, lecture_type)
+            for lectures_by_type in record["transcript"].values()
+            for lecture_type, lectures_list in lectures_by_type.items()
+            for code, name, credit, _ in lectures_list
+        }
+        for code, (name, credit, lecture_type) in lectures.items():
+            student_idx.append(i)
+            credits.append(credit)
+            type_idx.append(type_ids.setdefault(lecture_type, len(type_ids)))
+            if FIELD_PRACTICE in name:
+                field_rows.append(i)
+            columns_done = code_to_required.get(code)
+            if columns_done:
+                completed_rows.extend([i] * len(columns_done))
+                completed_cols.extend(columns_done)
+
+    # 유형별 (전공, 교양, 전공필수) 여부 표를 강의별로 펼쳐 학생별 합계 계산
+    type_table = np.array(
+        [[t in MAJOR_TYPES, t in GENERAL_TYPES, t in MAJOR_REQUIRED_TYPES] for t in type_ids] or [[False] * 3],
+        dtype=np.int64
+    )
+    student_idx = np.array(student_idx, dtype=np.int64)
+    credits = np.array(credits, dtype=np.int64)
+    categories = type_table[np.array(type_idx, dtype=np.int64)] * credits[:, None]
+
+    total = np.bincount(student_idx, weights=credits, minlength=count).astype(np.int64)
+    major, general, major_required = (
+        np.bincount(student_idx, weights=categories[:, k], minlength=count).astype(np.int64) for k in range(3)
+    )
+    field = np.bincount(np.array(field_rows, dtype=np.int64), minlength=count)
+
+    completed = np.zeros((count, columns), dtype=bool)
+    completed[completed_rows, completed_cols] = True
+    grades = np.array([int(record.get("grade", 4)) for record in records], dtype=np.int16)
+    missing = (tables.required_grades[None, :] <= grades[:, None]) & ~completed
+
+    remaining_total = np.maximum(constants.total_graduation_credits - total, 0)
+    remaining_major = np.maximum(constants.major_required_credits - major, 0)
+    remaining_general = np.maximum(constants.general_required_credits - general, 0)
+    remaining_field = np.maximum(constants.field_practice_required - field, 0)
+    ready = (remaining_total + remaining_major + remaining_general + remaining_field == 0) & ~missing.any(axis=1)
+
+    results = []
+    for i, record in enumerate(records):
+        missing_columns = np.flatnonzero(missing[i])
+        results.append({
+            "student_id": record["student_id"],
+            "total_credits": int(total[i]),
+            "major_credits": int(major[i]),
+            "general_credits": int(general[i]),
+            "field_practice": int(field[i]),
+            "major_required_credits": int(major_required[i]),
+            "remaining": {
+                "total": int(remaining_total[i]),
+                "major": int(remaining_major[i]),
+                "general": int(remaining_general[i]),
+                "field_practice": int(remaining_field[i]),
+            },
+            "missing_mr": [tables.required_names[c] for c in missing_columns if tables.required_is_mr[c]],
+            "missing_gr": [tables.required_names[c] for c in missing_columns if not tables.required_is_mr[c]],
+            "graduation_ready": bool(ready[i]),
+        })
+    return results
+
+
+def iter_lines(path: str, chunk_size: int) -> Iterator[List[str]]:
+    chunk = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                chunk.append(line)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+
+# JSON 파싱/직렬화까지 작업 프로세스에서 처리하고 부모는 결과 묶음을 그대로 기록
+def audit_lines(lines: List[str], tables: Optional[AuditTables] = None) -> Tuple[int, str]:
+    results = audit_chunk([json.loads(line) for line in lines], tables)
+    return len(results), "".join(json.dumps(result, ensure_ascii=False) + "\n" for result in results)
+
+
+# 입력을 묶음 단위로 작업 프로세스에 분배하고 결과를 묶음 단위로 기록 (동시 처리 묶음 수 제한)
+def run_audit(tables: AuditTables, input_path: str, output_path: str, workers: int, chunk_size: int = 500) -> int:
+    processed = 0
+    with open(output_path, "w", encoding="utf-8") as out:
+        if workers <= 1:
+            for lines in iter_lines(input_path, chunk_size):
+                count, text = audit_lines(lines, tables)
+                out.write(text)
+                processed += count
+            return processed
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as pool:
+            pending = []
+            for lines in iter_lines(input_path, chunk_size):
+                pending.append(pool.submit(audit_lines, lines))
+                if len(pending) >= workers * 2:
+                    count, text = pending.pop(0).result()
+                    out.write(text)
+                    processed += count
+            for future in pending:
+                count, text = future.result()
+                out.write(text)
+                processed += count
+    return processed
+
+
+async def load_tables() -> AuditTables:
+    from app.database.connection import AsyncSessionLocal, close_db
+    from app.lecture.lecture_catalog import lecture_catalog
+
+    async with AsyncSessionLocal() as db:
+        snapshot = await lecture_catalog.refresh(db)
+    await close_db()
+    return build_audit_tables(snapshot)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 학생 졸업 요건 일괄 점검")
+    parser.add_argument("--input", required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    tables = asyncio.run(load_tables())
+    processed = run_audit(tables, args.input, args.output, args.workers, args.chunk_size)
+    print(f"[졸업 요건 점검] {processed}명 처리 -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
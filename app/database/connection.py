@@ -1,11 +1,18 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from app.core.config import settings
+from app.core.observability import InstrumentedAsyncQueuePool, instrument_engine
 
-# 비동기 엔진 생성
+# 비동기 엔진 생성 (체크아웃 대기 시간을 기록하는 큐 풀 사용)
 async_engine = create_async_engine(
     settings.database_url,
-    echo=settings.DEBUG
+    echo=settings.DEBUG,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW
 )
+instrument_engine(async_engine.sync_engine)
 
 # 비동기 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
@@ -21,9 +28,19 @@ async def get_db():
         finally:
             await session.close()
 
-async def init_db():
-    async with async_engine.begin() as conn:
-        pass
+# 풀 연결을 동시에 열어 확인 후 반납 (첫 요청들이 연결 생성 비용을 내지 않도록)
+async def init_db(connections: int = 1):
+    conns = [async_engine.connect() for _ in range(max(connections, 1))]
+    results = await asyncio.gather(*(conn.start() for conn in conns), return_exceptions=True)
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(conn.exec_driver_sql("SELECT 1") for conn in conns))
+    finally:
+        await asyncio.gather(*(
+            conn.close() for conn, result in zip(conns, results) if not isinstance(result, BaseException)
+        ))
 
 async def close_db():
     await async_engine.dispose()
\ No newline at end of file
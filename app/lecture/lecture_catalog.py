@@ -0,0 +1,211 @@
+import asyncio
+import time
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
+
+from app.core.config import settings
+from app.lecture.lecture_models import LectureCode, RecentLecture, LectureReplacement, Lectures
+from app.lecture.lecture_record import LectureRecord, grade_level
+from app.professor.professor_models import Professor
+from app.professor.professor_lecture_index import ProfessorLectureIndex
+from app.lecture.replacement_index import ReplacementIndex
+from app.lecture.lecture_name_index import LectureNameIndex
+from app.lecture.lecture_text_index import LectureTextIndex
+
+
+REQUIRED_TYPES = ("MR", "GR")
+
+
+# 한 시점의 강의 카탈로그 (생성 후 변경하지 않음)
+class CatalogSnapshot:
+    def __init__(
+            self,
+            version: int,
+            lectures: List[LectureRecord],
+            code_id_map: Dict[str, int],
+            replacements: List[Tuple[str, str]],
+            lecture_texts: List[Tuple[str, str, str]] = (),
+            professor_index: Optional[ProfessorLectureIndex] = None
+    ):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.lectures = tuple(lectures)
+        self.code_id_map = code_id_map
+        self.replacements = tuple(replacements)
+        self.lecture_texts = tuple(lecture_texts)
+        self.replacement_index = ReplacementIndex(self.replacements)
+        self.professor_index = professor_index or ProfessorLectureIndex(())
+
+        self.by_name: Dict[str, LectureRecord] = {}
+        self.by_code: Dict[str, LectureRecord] = {}
+        self.by_type: Dict[str, Tuple[LectureRecord, ...]] = {}
+        self.by_grade: Dict[str, Tuple[LectureRecord, ...]] = {}
+
+        by_type: Dict[str, List[LectureRecord]] = {}
+        by_grade: Dict[str, List[LectureRecord]] = {}
+        for lec in self.lectures:
+            self.by_name.setdefault(lec.name, lec)
+            self.by_code.setdefault(lec.code, lec)
+            by_type.setdefault(lec.type, []).append(lec)
+            by_grade.setdefault(lec.grade, []).append(lec)
+
+        self.by_type = {key: tuple(value) for key, value in by_type.items()}
+        self.by_grade = {key: tuple(value) for key, value in by_grade.items()}
+        self.required_by_grade = self._build_required_by_grade()
+
+    # 필수(MR/GR) 유형별로 학년 g 이하 필수 과목을 미리 누적 (required_by_grade[유형][g - 1], 학년 기준은 grade_level)
+    def _build_required_by_grade(self) -> Dict[str, Tuple[Tuple[LectureRecord, ...], ...]]:
+        required_by_grade = {}
+        for lecture_type in REQUIRED_TYPES:
+            graded = []
+            for lec in self.by_type.get(lecture_type, ()):
+                grade = grade_level(lec.grade)
+                if grade is not None:
+                    graded.append((grade, lec))
+
+            max_grade = max((grade for grade, _ in graded), default=1)
+            required_by_grade[lecture_type] = tuple(
+                tuple(lec for grade, lec in graded if grade <= limit)
+                for limit in range(1, max(max_grade, 1) + 1)
+            )
+        return required_by_grade
+
+    # 학년 이하의 필수 과목 (카탈로그 순서 유지)
+    def required_lectures(self, lecture_type: str, student_grade: int) -> Tuple[LectureRecord, ...]:
+        levels = self.required_by_grade.get(lecture_type, ())
+        if not levels or student_grade < 1:
+            return ()
+        return levels[min(student_grade, len(levels)) - 1]
+
+    # 전체 강의명 (요청마다 새 목록을 만들지 않도록 스냅샷당 한 번 생성)
+    @cached_property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(lec.name for lec in self.lectures)
+
+    # 강의명 퍼지 매칭 인덱스 (스냅샷 버전당 한 번 생성)
+    @cached_property
+    def name_index(self) -> LectureNameIndex:
+        return LectureNameIndex(lec.name for lec in self.lectures)
+
+    # 강의 개요/목표 BM25 검색 인덱스 (스냅샷 버전당 한 번 생성)
+    @cached_property
+    def description_index(self) -> LectureTextIndex:
+        return LectureTextIndex(
+            (name, f"{description or ''} {objectives or ''}")
+            for name, description, objectives in self.lecture_texts
+        )
+
+    # 지연 생성 인덱스를 미리 생성 (기동 시 첫 요청 전에 호출)
+    def prewarm(self):
+        _ = self.names, self.name_index, self.description_index
+
+
+# 버전 관리되는 프로세스 내 강의 카탈로그
+class LectureCatalog:
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._version = 0
+        self._invalidated = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version if self._snapshot else 0
+
+    # 재적재 필요 여부 판단
+    def is_stale(self) -> bool:
+        if self._snapshot is None or self._invalidated:
+            return True
+        if self.ttl_seconds <= 0:
+            return False
+        return time.monotonic() - self._snapshot.loaded_at >= self.ttl_seconds
+
+    # 다음 조회 시 재적재하도록 표시
+    def invalidate(self):
+        self._invalidated = True
+
+    # DB에서 카탈로그를 다시 읽어 새 버전으로 교체
+    async def refresh(self, db: AsyncSession) -> CatalogSnapshot:
+        async with self._lock:
+            return await self._reload(db)
+
+    # 최신 스냅샷 조회 (만료 시 재적재)
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        if self.is_stale():
+            async with self._lock:
+                if self.is_stale():
+                    await self._reload(db)
+        return self._snapshot
+
+    async def _reload(self, db: AsyncSession) -> CatalogSnapshot:
+        self._invalidated = False
+        snapshot = await self._load(db, self._version + 1)
+        self._version = snapshot.version
+        self._snapshot = snapshot
+        return snapshot
+
+    @staticmethod
+    async def _load(db: AsyncSession, version: int) -> CatalogSnapshot:
+        lecture_stmt = select(
+            RecentLecture.code, RecentLecture.name, RecentLecture.credits, RecentLecture.type,
+            RecentLecture.grade, RecentLecture.semester, RecentLecture.major, RecentLecture.team_project
+        ).order_by(RecentLecture.id)
+        lectures = [LectureRecord(*row) for row in await db.execute(lecture_stmt)]
+
+        code_stmt = select(
+            LectureCode.code, LectureCode.id, LectureCode.name,
+            LectureCode.lecture_description, LectureCode.lecture_objectives
+        )
+        code_id_map = {}
+        lecture_texts = []
+        for row in await db.execute(code_stmt):
+            code_id_map[row.code] = row.id
+            lecture_texts.append((row.name, row.lecture_description, row.lecture_objectives))
+
+        replacement_stmt = select(LectureReplacement.original_code, LectureReplacement.replacement_code)
+        replacements = [(row.original_code, row.replacement_code) for row in await db.execute(replacement_stmt)]
+
+        # 교수별 담당 강의 (lectures 관계를 selectinload로 한 번에 적재)
+        professor_stmt = select(Professor).options(
+            load_only(Professor.id, Professor.name),
+            selectinload(Professor.lectures).load_only(
+                Lectures.id, Lectures.code, Lectures.name, Lectures.credits, Lectures.type,
+                Lectures.grade, Lectures.semester, Lectures.year
+            )
+        ).order_by(Professor.id)
+        professor_index = ProfessorLectureIndex((await db.execute(professor_stmt)).scalars().all())
+
+        return CatalogSnapshot(version, lectures, code_id_map, replacements, lecture_texts, professor_index)
+
+
+lecture_catalog = LectureCatalog(settings.CATALOG_TTL_SECONDS)
+
+
+# 카탈로그 테이블을 이 프로세스의 ORM으로 변경하면 카탈로그 무효화
+# (ORM을 거치지 않은 변경은 감지하지 못하며 CATALOG_TTL_SECONDS 이내에 반영됨)
+@event.listens_for(RecentLecture, "after_insert")
+@event.listens_for(RecentLecture, "after_update")
+@event.listens_for(RecentLecture, "after_delete")
+@event.listens_for(LectureCode, "after_insert")
+@event.listens_for(LectureCode, "after_update")
+@event.listens_for(LectureCode, "after_delete")
+@event.listens_for(LectureReplacement, "after_insert")
+@event.listens_for(LectureReplacement, "after_update")
+@event.listens_for(LectureReplacement, "after_delete")
+@event.listens_for(Lectures, "after_insert")
+@event.listens_for(Lectures, "after_update")
+@event.listens_for(Lectures, "after_delete")
+@event.listens_for(Professor, "after_insert")
+@event.listens_for(Professor, "after_update")
+@event.listens_for(Professor, "after_delete")
+def _invalidate_on_catalog_change(mapper, connection, target):
+    lecture_catalog.invalidate()
@@ -20,7 +20,7 @@ class RecentLecture(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     code = Column(String(50), ForeignKey("lecture_code.code"))
-    name = Column(String(255), nullable=False)
+    name = Column(String(255), nullable=False, index=True)
     credits = Column(Integer, nullable=False)
     type = Column(String(10))
     grade = Column(String(10))
@@ -35,8 +35,8 @@ class LectureReplacement(Base):
     __tablename__ = "lecture_replacement"
 
     id = Column(Integer, primary_key=True, index=True)
-    original_code = Column(String(50), nullable=False)
-    replacement_code = Column(String(50), nullable=False)
+    original_code = Column(String(50), nullable=False, index=True)
+    replacement_code = Column(String(50), nullable=False, index=True)
 
 
 class Lectures(Base):
@@ -45,11 +45,12 @@ class Lectures(Base):
     id = Column(Integer, primary_key=True, index=True)
     code = Column(String(50), nullable=False)
     name = Column(String(255), nullable=False)
-    professor_id = Column(Integer, ForeignKey("professors.id"))
+    professor_id = Column(Integer, ForeignKey("professors.id"), index=True)
     credits = Column(Integer, nullable=False)
     type = Column(String(10))
     grade = Column(String(10))
     semester = Column(String(10))
     year = Column(String(10))
 
-    professor = relationship("Professor", back_populates="lectures")
\ No newline at end of file
+    professor = relationship("Professor", back_populates="lectures")
+
@@ -0,0 +1,135 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_MEDIALS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_FINALS = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+           "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+_NON_WORD = re.compile(r"[^\w]+")
+# 강의명 뒤에 붙는 조사 (예: "자료구조를", "파이썬은")
+_PARTICLE = re.compile(r"(으로|에서|이랑|랑|하고|은|는|이|가|을|를|도|만|과|와|로)$")
+
+# 최상위 점수가 이 값 이상이고 2위와 충분히 차이 나면 확정 매칭으로 간주
+CONFIDENT_SCORE = 0.68
+AMBIGUITY_MARGIN = 0.08
+# 허용 편집 거리 (자모 길이 대비 비율)
+MAX_DISTANCE_RATIO = 0.34
+
+
+# 한글 음절을 초성/중성/종성 자모로 분해
+def decompose(text: str) -> str:
+    result = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            result.append(_INITIALS[offset // 588])
+            result.append(_MEDIALS[(offset % 588) // 28])
+            result.append(_FINALS[offset % 28])
+        else:
+            result.append(char.lower())
+    return "".join(result)
+
+
+def _compact(text: str) -> str:
+    return _NON_WORD.sub("", text).lower()
+
+
+def _bigrams(text: str) -> Set[str]:
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+# 질의 전체가 대상 문자열의 어느 부분 문자열과 정렬되는 최소 편집 거리 (bound 초과 시 None)
+def bounded_substring_distance(query: str, target: str, bound: int) -> Optional[int]:
+    previous = [0] * (len(target) + 1)
+    for i in range(1, len(query) + 1):
+        current = [i] + [0] * len(target)
+        q = query[i - 1]
+        for j in range(1, len(target) + 1):
+            cost = 0 if q == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+        if min(current) > bound:
+            return None
+        previous = current
+    distance = min(previous)
+    return distance if distance <= bound else None
+
+
+# 자모 분해 + n-gram + 제한 편집 거리 기반 강의명 퍼지 매칭 인덱스
+class LectureNameIndex:
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(dict.fromkeys(name for name in names if name))
+        self._exact: Dict[str, str] = {}
+        self._jamo: List[str] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+        for idx, name in enumerate(self.names):
+            compact = _compact(name)
+            self._exact.setdefault(compact, name)
+            jamo = decompose(compact)
+            self._jamo.append(jamo)
+            for gram in _bigrams(jamo):
+                self._postings.setdefault(gram, set()).add(idx)
+
+    # 입력 문장에서 강의명 후보가 될 수 있는 구간 (인접 어절 최대 3개 결합)
+    @staticmethod
+    def _windows(user_input: str) -> List[str]:
+        tokens = [_PARTICLE.sub("", token) if len(token) > 2 else token
+                  for token in _NON_WORD.sub(" ", user_input).lower().split()]
+        tokens = [token for token in tokens if token]
+        windows = []
+        for size in (1, 2, 3):
+            for start in range(len(tokens) - size + 1):
+                windows.append("".join(tokens[start:start + size]))
+        return list(dict.fromkeys(windows))
+
+    # 입력과 유사한 강의명을 점수 순으로 반환
+    def search(self, user_input: str, limit: int = 5, allowed: Optional[Set[str]] = None) -> List[Tuple[str, float]]:
+        windows = self._windows(user_input)
+
+        # 강의명과 정확히 일치하는 구간이 있으면 가장 긴 구간을 우선
+        for window in sorted(windows, key=len, reverse=True):
+            exact = self._exact.get(window)
+            if exact and (allowed is None or exact in allowed):
+                return [(exact, 1.0)]
+
+        scores: Dict[int, float] = {}
+        for window in windows:
+            window_jamo = decompose(window)
+            if len(window_jamo) < 2:
+                continue
+            grams = _bigrams(window_jamo)
+            candidates: Set[int] = set()
+            for gram in grams:
+                candidates |= self._postings.get(gram, set())
+
+            bound = int(len(window_jamo) * MAX_DISTANCE_RATIO)
+            for idx in candidates:
+                if allowed is not None and self.names[idx] not in allowed:
+                    continue
+                name_jamo = self._jamo[idx]
+                distance = bounded_substring_distance(window_jamo, name_jamo, bound)
+                if distance is None:
+                    continue
+                similarity = 1 - distance / len(window_jamo)
+                coverage = min(len(window_jamo) / len(name_jamo), 1.0)
+                score = similarity * (0.7 + 0.3 * coverage)
+                if score > scores.get(idx, 0.0):
+                    scores[idx] = score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self.names[idx], round(score, 4)) for idx, score in ranked]
+
+    # 확정 가능한 매칭이면 강의명, 애매하면 None
+    @staticmethod
+    def confident_match(matches: List[Tuple[str, float]]) -> Optional[str]:
+        if not matches or matches[0][1] < CONFIDENT_SCORE:
+            return None
+        if len(matches) > 1 and matches[0][1] - matches[1][1] < AMBIGUITY_MARGIN:
+            return None
+        return matches[0][0]
@@ -0,0 +1,60 @@
+import sys
+from typing import Optional
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# 필수 과목 학년 기준 (숫자면 그 학년, "전학년"이나 빈 문자열처럼 숫자가 아닌 값은 0 = 모든 학년 필수,
+# 학년 정보가 없으면(NULL) None = 제외). 카탈로그 학년별 필수 과목과 졸업 요건 일괄 점검이 같은 규칙을 사용.
+# 예전 SQL 문자열 비교(grade <= '3')는 빈 문자열은 포함하고 "전학년"은 제외했으나, 지금은 둘 다 포함
+def grade_level(grade) -> Optional[int]:
+    if grade is None:
+        return None
+    grade = str(grade).strip()
+    return int(grade) if grade.isdigit() else 0
+
+
+# 강의 한 건 (저장소 공용 반환 타입, 반복되는 짧은 문자열은 intern해 카탈로그 메모리 절감)
+class LectureRecord:
+    __slots__ = ("code", "name", "credits", "type", "grade", "semester", "major", "team_project",
+                 "year", "professor_id")
+
+    def __init__(
+            self,
+            code: str,
+            name: str,
+            credits: int,
+            type: str,
+            grade: str,
+            semester: str,
+            major: str = "",
+            team_project: str = "",
+            year: Optional[str] = None,
+            professor_id: Optional[int] = None
+    ):
+        self.code = _intern(code)
+        self.name = name
+        self.credits = credits
+        self.type = _intern(type)
+        self.grade = _intern(grade)
+        self.semester = _intern(semester)
+        self.major = _intern(major)
+        self.team_project = _intern(team_project)
+        self.year = _intern(year)
+        self.professor_id = professor_id
+
+    def _key(self) -> tuple:
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LectureRecord):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"LectureRecord(code={self.code!r}, name={self.name!r}, credits={self.credits!r}, type={self.type!r})"
@@ -1,62 +1,41 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.lecture.lecture_models import LectureCode, RecentLecture, LectureReplacement
-from typing import List, Optional, Set
+from app.lecture.lecture_catalog import lecture_catalog
+from app.lecture.lecture_record import LectureRecord
+from typing import List, Optional, Sequence, Set
 
 
 class LectureCrud:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    # 강의명으로 강의 정보 조회
-    async def get_lecture_by_name(self, name: str) -> Optional[tuple]:
-        stmt = select(RecentLecture).where(RecentLecture.name == name)
-        result = await self.db.execute(stmt)
-        lecture = result.scalar_one_or_none()
-
-        if lecture:
-            return (lecture.name, lecture.credits, lecture.type,
-                    lecture.grade, lecture.semester, '', '', lecture.code, lecture.major)
-        return None
+    # 강의명으로 강의 정보 조회 (카탈로그의 레코드를 복사 없이 반환)
+    async def get_lecture_by_name(self, name: str) -> Optional[LectureRecord]:
+        catalog = await lecture_catalog.get(self.db)
+        return catalog.by_name.get(name)
 
 
     # 전체 강의 목록 조회
-    async def get_lecture_list(self) -> List[tuple]:
-        stmt = select(RecentLecture)
-        result = await self.db.execute(stmt)
-        lectures = result.scalars().all()
+    async def get_lecture_list(self) -> Sequence[LectureRecord]:
+        catalog = await lecture_catalog.get(self.db)
+        return catalog.lectures
+
 
-        return [(lec.name, lec.credits, lec.type, lec.grade, lec.semester,
-                 '', '', '', lec.code, lec.major, '') for lec in lectures]
+    # 전체 강의명 조회
+    async def get_lecture_names(self) -> Sequence[str]:
+        catalog = await lecture_catalog.get(self.db)
+        return catalog.names
 
 
     # 강의 코드-ID 매핑 조회
     async def get_lecture_code_id_map(self) -> dict:
-        stmt = select(LectureCode.code, LectureCode.id)
-        result = await self.db.execute(stmt)
-        return {row.code: row.id for row in result}
+        catalog = await lecture_catalog.get(self.db)
+        return dict(catalog.code_id_map)
 
 
     # 대체 교과목 포함 완료 과목 코드 조회
     async def get_all_completed_codes_with_replacement(self, original_codes: Set[str]) -> Set[str]:
-        all_codes = set(original_codes)
-
-        for code in original_codes:
-            stmt = select(LectureReplacement.replacement_code).where(
-                LectureReplacement.original_code == code
-            )
-            result = await self.db.execute(stmt)
-            replacements = [row.replacement_code for row in result]
-            all_codes.update(replacements)
-
-            stmt = select(LectureReplacement.original_code).where(
-                LectureReplacement.replacement_code == code
-            )
-            result = await self.db.execute(stmt)
-            originals = [row.original_code for row in result]
-            all_codes.update(originals)
-
-        return all_codes
+        catalog = await lecture_catalog.get(self.db)
+        return catalog.replacement_index.expand(original_codes)
 
 
     # 미이수 필수 과목 조회
@@ -64,35 +43,23 @@ class LectureCrud:
         uncompleted_mr = []
         uncompleted_gr = []
 
-        # MR, GR 타입의 강의만 조회
-        stmt = select(RecentLecture).where(
-            RecentLecture.type.in_(['MR', 'GR']),
-            RecentLecture.code.notin_(completed_codes),
-            RecentLecture.grade <= str(student_grade)
-        )
-        result = await self.db.execute(stmt)
-        lectures = result.scalars().all()
-
-        for lecture in lectures:
-            if lecture.type == 'MR':
-                uncompleted_mr.append(lecture.name)
-            else:
-                uncompleted_gr.append(lecture.name)
+        # 스냅샷에 미리 만든 학년별 MR, GR 필수 과목에서 이수 과목 제외
+        catalog = await lecture_catalog.get(self.db)
+
+        for lecture_type, uncompleted in (('MR', uncompleted_mr), ('GR', uncompleted_gr)):
+            uncompleted.extend(
+                lecture.name for lecture in catalog.required_lectures(lecture_type, student_grade)
+                if lecture.code not in completed_codes
+            )
 
         return uncompleted_mr, uncompleted_gr
 
 
     # 대체 교과목 조회
     async def get_replacement_codes_by_original(self, original_code: str) -> List[str]:
-        stmt = select(LectureReplacement.replacement_code).where(
-            LectureReplacement.original_code == original_code
-        )
-        result = await self.db.execute(stmt)
-        return [row.replacement_code for row in result]
+        catalog = await lecture_catalog.get(self.db)
+        return list(catalog.replacement_index.replacements_by_original.get(original_code, ()))
 
     async def get_original_codes_by_replacement(self, replacement_code: str) -> List[str]:
-        stmt = select(LectureReplacement.original_code).where(
-            LectureReplacement.replacement_code == replacement_code
-        )
-        result = await self.db.execute(stmt)
-        return [row.original_code for row in result]
\ No newline at end of file
+        catalog = await lecture_catalog.get(self.db)
+        return list(catalog.replacement_index.originals_by_replacement.get(replacement_code, ()))
@@ -0,0 +1,115 @@
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_NON_WORD = re.compile(r"[^\w]+")
+# 관심 분야 입력에서 의미 없이 반복되는 표현
+_QUERY_STOPWORDS = {"관심", "분야", "있어", "있어요", "있습니다", "싶어", "싶어요", "공부", "강의", "수업", "배우고", "관련", "그리고"}
+
+K1 = 1.2
+B = 0.75
+# 명확한 선택으로 인정할 최고 점수 하한 (n-gram 한두 개만 겹친 경우는 대략 1~3점)
+CLEAR_CUT_MIN_SCORE = 4.0
+
+
+# 어절 단위 문자 2~3-gram 추출
+def char_ngrams(text: str, sizes: Tuple[int, ...] = (2, 3)) -> List[str]:
+    grams = []
+    for word in _NON_WORD.sub(" ", text.lower()).split():
+        if len(word) < min(sizes):
+            grams.append(word)
+            continue
+        for size in sizes:
+            grams.extend(word[i:i + size] for i in range(len(word) - size + 1))
+    return grams
+
+
+# 강의 개요/목표 텍스트에 대한 BM25 검색 인덱스 (문자 n-gram, NumPy 점수 계산)
+class LectureTextIndex:
+    def __init__(self, documents: Iterable[Tuple[str, str]]):
+        self.names: List[str] = []
+        self._positions: Dict[str, int] = {}
+        term_freqs: List[Dict[str, int]] = []
+
+        for name, text in documents:
+            if not name or name in self._positions:
+                continue
+            self._positions[name] = len(self.names)
+            self.names.append(name)
+            freqs: Dict[str, int] = {}
+            for gram in char_ngrams(f"{name} {text or ''}"):
+                freqs[gram] = freqs.get(gram, 0) + 1
+            term_freqs.append(freqs)
+
+        doc_count = len(self.names)
+        lengths = np.array([sum(freqs.values()) for freqs in term_freqs], dtype=np.float32)
+        avg_length = float(lengths.mean()) if doc_count else 0.0
+
+        # 용어별 (문서 번호 배열, BM25 가중치 배열) 포스팅
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for doc_id, freqs in enumerate(term_freqs):
+            for gram, freq in freqs.items():
+                docs, tfs = postings.setdefault(gram, ([], []))
+                docs.append(doc_id)
+                tfs.append(freq)
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for gram, (docs, tfs) in postings.items():
+            doc_ids = np.array(docs, dtype=np.int32)
+            tf = np.array(tfs, dtype=np.float32)
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = K1 * (1 - B + B * lengths[doc_ids] / avg_length)
+            self._postings[gram] = (doc_ids, (idf * tf * (K1 + 1) / (tf + norm)).astype(np.float32))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    # 질의에 대한 전체 문서 점수 벡터
+    def score(self, query: str) -> np.ndarray:
+        scores = np.zeros(len(self.names), dtype=np.float32)
+        terms = {gram for gram in char_ngrams(query) if gram not in _QUERY_STOPWORDS}
+        for gram in terms:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                doc_ids, weights = posting
+                scores[doc_ids] += weights
+        return scores
+
+    # 질의와 관련도가 높은 순으로 (강의명, 점수) 반환 (restrict 지정 시 해당 강의만)
+    def rank(self, query: str, restrict: Optional[Iterable[str]] = None, top_k: Optional[int] = None) -> List[Tuple[str, float]]:
+        scores = self.score(query)
+        if restrict is not None:
+            doc_ids = np.array([self._positions[name] for name in restrict if name in self._positions], dtype=np.int32)
+        else:
+            doc_ids = np.arange(len(self.names), dtype=np.int32)
+        if doc_ids.size == 0:
+            return []
+
+        order = doc_ids[np.argsort(-scores[doc_ids], kind="stable")]
+        if top_k is not None:
+            order = order[:top_k]
+        return [(self.names[doc_id], float(scores[doc_id])) for doc_id in order]
+
+
+# 점수 분포가 명확하면 관련 강의 목록, 애매하면 None
+# 후보가 하나뿐이거나 최고 점수가 하한 미만이면 상대 비교로는 판단할 수 없으므로 None
+def clear_cut_selection(
+        ranked: List[Tuple[str, float]],
+        keep_ratio: float = 0.5,
+        drop_ratio: float = 0.1,
+        min_score: float = CLEAR_CUT_MIN_SCORE,
+        min_candidates: int = 2
+) -> Optional[List[str]]:
+    if len(ranked) < min_candidates or ranked[0][1] < min_score:
+        return None
+    top = ranked[0][1]
+    selected = [name for name, score in ranked if score >= top * keep_ratio]
+    rest = [score for _, score in ranked if score < top * keep_ratio]
+    if any(score > top * drop_ratio for score in rest):
+        return None
+    return selected
@@ -0,0 +1,50 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+# 대체 교과목 동치 관계 인덱스 (union-find 기반, 연쇄 대체 A→B→C 포함)
+class ReplacementIndex:
+    def __init__(self, pairs: Iterable[Tuple[str, str]]):
+        self._parent: Dict[str, str] = {}
+        self.replacements_by_original: Dict[str, List[str]] = {}
+        self.originals_by_replacement: Dict[str, List[str]] = {}
+
+        for original, replacement in pairs:
+            self.replacements_by_original.setdefault(original, []).append(replacement)
+            self.originals_by_replacement.setdefault(replacement, []).append(original)
+            self._union(original, replacement)
+
+        # 루트별 동치류를 미리 계산해 조회 시 한 번의 dict 접근으로 끝나게 함
+        classes: Dict[str, Set[str]] = {}
+        for code in self._parent:
+            classes.setdefault(self._find(code), set()).add(code)
+        self._classes: Dict[str, frozenset] = {}
+        for members in classes.values():
+            frozen = frozenset(members)
+            for code in members:
+                self._classes[code] = frozen
+
+    def _find(self, code: str) -> str:
+        parent = self._parent.setdefault(code, code)
+        while parent != self._parent[parent]:
+            self._parent[parent] = self._parent[self._parent[parent]]
+            parent = self._parent[parent]
+        self._parent[code] = parent
+        return parent
+
+    def _union(self, a: str, b: str):
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            self._parent[root_b] = root_a
+
+    # 과목 코드와 동치인 전체 코드 집합
+    def equivalents(self, code: str) -> frozenset:
+        return self._classes.get(code, frozenset((code,)))
+
+    # 완료 과목 코드 집합을 대체 교과목까지 확장
+    def expand(self, codes: Iterable[str]) -> Set[str]:
+        expanded = set()
+        for code in codes:
+            if code in expanded:
+                continue
+            expanded.update(self._classes.get(code, (code,)))
+        return expanded
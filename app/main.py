@@ -1,13 +1,44 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager, suppress
 from app.core.config import settings
-from app.database.connection import init_db, close_db
+from app.core.metrics import metrics_registry
+from app.core.observability import ObservabilityMiddleware, update_pool_gauges
+from app.core.readiness import startup_state, warm_up
+from app.database.connection import init_db, close_db, AsyncSessionLocal, async_engine
+from app.lecture.lecture_catalog import lecture_catalog
+from app.chat.chat_router import router as chat_router
+from app.chat.chat_log_writer import chat_log_writer
+from app.chat.conversation_state_store import conversation_state_store
+from app.recommendation.service.llm_gateway import llm_gateway
 
+# 카탈로그 적재 후 이름/개요 검색 인덱스까지 생성 (인덱스 생성은 이벤트 루프 밖에서)
+async def warm_catalog():
+    async with AsyncSessionLocal() as db:
+        snapshot = await lecture_catalog.refresh(db)
+    await asyncio.to_thread(snapshot.prewarm)
+
+# openai 모듈 import와 HTTP 클라이언트 생성을 이벤트 루프 밖에서 미리 수행
+async def warm_llm_client():
+    await asyncio.to_thread(lambda: llm_gateway.client)
+
+# DB 연결 확인까지는 기동을 막고, 카탈로그/클라이언트 준비는 백그라운드로 진행 (/ready로 확인)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
+    await startup_state.run_step("db_pool", lambda: init_db(settings.DB_WARM_CONNECTIONS))
+    await chat_log_writer.start()
+    warmup = asyncio.create_task(warm_up(startup_state, {
+        "catalog": warm_catalog,
+        "llm_client": warm_llm_client,
+    }))
     yield
+    warmup.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup
+    await conversation_state_store.flush()
+    await chat_log_writer.stop()
     await close_db()
 
 app = FastAPI(
@@ -24,7 +55,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+app.add_middleware(ObservabilityMiddleware)
+
+app.include_router(chat_router)
 
 @app.get("/")
 async def root():
@@ -34,6 +69,20 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "curriculum-chatbot"}
 
+# 기동 준비 완료 여부 (카탈로그/인덱스/LLM 클라이언트 준비 전에는 503)
+@app.get("/ready")
+async def readiness():
+    report = startup_state.report()
+    report["chat_log_writer"] = chat_log_writer.running
+    ready = startup_state.ready and chat_log_writer.running
+    return JSONResponse(report, status_code=200 if ready else 503)
+
+# Prometheus 수집용 메트릭
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    update_pool_gauges(async_engine.sync_engine)
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
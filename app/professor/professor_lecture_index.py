@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.lecture.lecture_record import LectureRecord
+
+
+# 교수 -> 담당 강의 역색인 (연도/학기별 조회 포함, 생성 후 변경하지 않음)
+class ProfessorLectureIndex:
+    def __init__(self, professors: Iterable):
+        """
+        professors는 lectures 관계가 이미 적재된 Professor 객체 목록 (selectinload).
+        """
+        self.names: Dict[int, str] = {}
+        self.ids_by_name: Dict[str, int] = {}
+        self.by_professor: Dict[int, Tuple[LectureRecord, ...]] = {}
+        by_term: Dict[Tuple[int, Optional[str], Optional[str]], List[LectureRecord]] = {}
+
+        for professor in professors:
+            self.names[professor.id] = professor.name
+            self.ids_by_name.setdefault(professor.name, professor.id)
+            lectures = tuple(
+                LectureRecord(lec.code, lec.name, lec.credits, lec.type, lec.grade, lec.semester,
+                              year=lec.year, professor_id=professor.id)
+                for lec in sorted(professor.lectures, key=lambda lec: lec.id)
+            )
+            self.by_professor[professor.id] = lectures
+            for lec in lectures:
+                for key in ((professor.id, lec.year, lec.semester),
+                            (professor.id, lec.year, None),
+                            (professor.id, None, lec.semester)):
+                    by_term.setdefault(key, []).append(lec)
+
+        self.by_term = {key: tuple(value) for key, value in by_term.items()}
+
+    def __len__(self) -> int:
+        return len(self.by_professor)
+
+    # 교수별 담당 강의 (연도/학기 지정 시 해당 학기만)
+    def lectures(
+            self,
+            professor_ids: Iterable[int],
+            year: Optional[str] = None,
+            semester: Optional[str] = None
+    ) -> List[LectureRecord]:
+        result = []
+        for professor_id in professor_ids:
+            if year is None and semester is None:
+                result.extend(self.by_professor.get(professor_id, ()))
+            else:
+                result.extend(self.by_term.get((professor_id, year, semester), ()))
+        return result
+
+    def codes(
+            self,
+            professor_ids: Iterable[int],
+            year: Optional[str] = None,
+            semester: Optional[str] = None
+    ) -> Set[str]:
+        return {lec.code for lec in self.lectures(professor_ids, year, semester)}
@@ -7,7 +7,7 @@ class Professor(Base):
     __tablename__ = "professors"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False, index=True)
     department = Column(String(100))
 
     lectures = relationship("Lectures", back_populates="professor")
\ No newline at end of file
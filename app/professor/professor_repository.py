@@ -1,7 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.professor.professor_models import Professor
-from app.lecture.lecture_models import Lectures
+from app.lecture.lecture_catalog import lecture_catalog
+from app.lecture.lecture_record import LectureRecord
 from typing import List, Optional
 
 
@@ -9,14 +10,15 @@ class ProfessorCrud:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    # 교수 ID로 강의 목록 조회
-    async def get_lectures_by_professor_ids(self, professor_ids: List[int]) -> List[tuple]:
-        stmt = select(Lectures).where(Lectures.professor_id.in_(professor_ids))
-        result = await self.db.execute(stmt)
-        lectures = result.scalars().all()
-
-        return [(lec.name, lec.credits, lec.type, lec.grade, lec.semester,
-                 '', '', lec.code, '') for lec in lectures]
+    # 교수 ID로 강의 목록 조회 (카탈로그와 함께 갱신되는 교수별 강의 색인 사용)
+    async def get_lectures_by_professor_ids(
+            self,
+            professor_ids: List[int],
+            year: Optional[str] = None,
+            semester: Optional[str] = None
+    ) -> List[LectureRecord]:
+        catalog = await lecture_catalog.get(self.db)
+        return catalog.professor_index.lectures(professor_ids, year, semester)
 
     # ID로 교수 조회
     async def get_professor_by_id(self, professor_id: int) -> Optional[Professor]:
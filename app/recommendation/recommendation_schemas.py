@@ -0,0 +1,10 @@
+from typing import List
+from pydantic import BaseModel
+
+
+# 추천 목록 수정 단계의 한 턴 분석 결과 (GPT JSON 응답 검증용)
+class TurnAnalysis(BaseModel):
+    end: bool = False
+    alternative: bool = False
+    add: List[str] = []
+    remove: List[str] = []
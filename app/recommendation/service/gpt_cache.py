@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.core.metrics import metrics_registry
+
+cache_lookups = metrics_registry.counter(
+    "gpt_cache_lookups_total", "GPT 응답 캐시 조회 결과 (memory_hit, disk_hit, miss)", ["result"]
+)
+cache_memory_entries = metrics_registry.gauge("gpt_cache_memory_entries", "메모리에 있는 GPT 응답 캐시 항목 수")
+
+
+# 결정적(temperature=0) GPT 응답 캐시: 메모리 LRU + SQLite 디스크 저장소
+class GPTResponseCache:
+    # 디스크 용량 정리 주기 (저장 횟수 기준)
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path: str, ttl_seconds: int, max_memory_entries: int, max_disk_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._writes_since_prune = 0
+
+    # (model, messages, params) 정규화 키 생성
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], params: Dict) -> str:
+        normalized_messages = [
+            {"role": msg["role"], "content": " ".join(msg["content"].split())}
+            for msg in messages
+        ]
+        payload = json.dumps(
+            {"model": model, "messages": normalized_messages, "params": params},
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, content = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                cache_lookups.inc(result="memory_hit")
+                return content
+            del self._memory[key]
+            cache_memory_entries.set(len(self._memory))
+
+        entry = await asyncio.to_thread(self._disk_get, key, now)
+        if entry is not None:
+            expires_at, content = entry
+            self._remember(key, expires_at, content)
+            cache_lookups.inc(result="disk_hit")
+            return content
+
+        cache_lookups.inc(result="miss")
+        return None
+
+    async def set(self, key: str, content: str):
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, expires_at, content)
+        await asyncio.to_thread(self._disk_set, key, expires_at, content)
+
+    def close(self):
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, expires_at: float, content: str):
+        self._memory[key] = (expires_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+        cache_memory_entries.set(len(self._memory))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS gpt_cache ("
+                "key TEXT PRIMARY KEY, content TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_gpt_cache_accessed_at ON gpt_cache (accessed_at)")
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[tuple]:
+        with self._conn_lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT expires_at, content FROM gpt_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] <= now:
+                conn.execute("DELETE FROM gpt_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute("UPDATE gpt_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return row
+
+    def _disk_set(self, key: str, expires_at: float, content: str):
+        with self._conn_lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO gpt_cache (key, content, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, content, expires_at, time.time())
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.PRUNE_INTERVAL:
+                self._writes_since_prune = 0
+                self._prune(conn)
+            conn.commit()
+
+    # 만료 항목 삭제 후 최대 개수 초과분을 오래 사용되지 않은 순으로 삭제
+    def _prune(self, conn: sqlite3.Connection):
+        conn.execute("DELETE FROM gpt_cache WHERE expires_at <= ?", (time.time(),))
+        (count,) = conn.execute("SELECT COUNT(*) FROM gpt_cache").fetchone()
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM gpt_cache WHERE key IN "
+                "(SELECT key FROM gpt_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
@@ -1,14 +1,150 @@
+import asyncio
 import json
-import re
-from typing import List, Tuple
-from openai import AsyncOpenAI
-from app.core.config import Settings
+import time
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.observability import current_request_id
+from app.lecture.lecture_catalog import lecture_catalog
+from app.lecture.lecture_name_index import LectureNameIndex
+from app.lecture.lecture_text_index import LectureTextIndex, clear_cut_selection
+from app.recommendation.service.gpt_cache import GPTResponseCache
+from app.recommendation.service.intent_classifier import LocalIntentClassifier
+from app.recommendation.service.prompt_builder import PromptBuilder
+from app.recommendation.recommendation_schemas import TurnAnalysis
+from app.recommendation.service.llm_gateway import LLMGateway, llm_gateway
+from app.recommendation.service.model_router import ModelRouter, ModelTier, model_router
+
+
+gpt_call_seconds = metrics_registry.histogram("gpt_call_seconds", "GPTService 메서드별 OpenAI 호출 시간", ["call_site"])
+gpt_first_token_seconds = metrics_registry.histogram(
+    "gpt_first_token_seconds", "GPTService 스트리밍 메서드의 첫 토큰까지 시간", ["call_site"]
+)
+gpt_calls = metrics_registry.counter("gpt_calls_total", "GPTService 메서드별 호출 수 (결과별)", ["call_site", "outcome"])
+gpt_errors = metrics_registry.counter("gpt_errors_total", "GPTService 메서드별 OpenAI 오류 수", ["call_site", "error"])
+gpt_tokens = metrics_registry.counter("gpt_tokens_total", "GPTService 메서드별 토큰 사용량", ["call_site", "kind"])
+
+gpt_response_cache = GPTResponseCache(
+    path=settings.GPT_CACHE_PATH,
+    ttl_seconds=settings.GPT_CACHE_TTL_SECONDS,
+    max_memory_entries=settings.GPT_CACHE_MEMORY_ENTRIES,
+    max_disk_entries=settings.GPT_CACHE_DISK_ENTRIES
+) if settings.GPT_CACHE_ENABLED else None
+
+# 진행 중인 섀도 비교 호출 (작업이 끝나기 전에 가비지 컬렉션되지 않도록 참조 유지)
+_shadow_tasks: Set[asyncio.Task] = set()
+
+# JSON 모드 응답 요청 (응답이 하나의 JSON 객체임을 보장)
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+
+# 응답 텍스트에서 첫 JSON 객체 추출 (코드 블록이나 앞뒤 설명이 섞여 있어도 처리, 없으면 None)
+def extract_json_object(text: str) -> Optional[Dict]:
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(text, start)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start = text.find("{", start + 1)
+    return None
 
-settings = Settings()
 
 class GPTService:
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, gateway: Optional[LLMGateway] = None, router: Optional[ModelRouter] = None):
+        self.gateway = gateway or llm_gateway
+        self.router = router or model_router
+        self.intent_classifier = LocalIntentClassifier(settings.INTENT_CONFIDENCE_THRESHOLD)
+        self.description_top_k = settings.DESCRIPTION_PREFILTER_TOP_K
+
+    # GPT 호출 (temperature=0 요청은 응답 캐시 사용, 동일 동시 요청은 게이트웨이에서 병합)
+    # call_site(호출한 메서드명)별로 지연 시간, 토큰 사용량, 오류 수를 기록
+    # 모델은 라우터가 call_site별 등급 체인으로 정하며, 등급이 실패하거나 응답 예산을 넘기면 다음 등급으로 대체
+    async def _complete(
+            self,
+            call_site: str,
+            messages: List[dict],
+            max_tokens: int,
+            temperature: float,
+            response_format: Optional[Dict] = None
+    ) -> str:
+        params = {"max_tokens": max_tokens, "temperature": temperature}
+        if response_format is not None:
+            params["response_format"] = response_format
+        chain = self.router.chain(call_site)
+        request_key = GPTResponseCache.make_key(chain[0].model, messages, params)
+        cacheable = gpt_response_cache is not None and temperature == 0
+        if cacheable:
+            cached = await gpt_response_cache.get(request_key)
+            if cached is not None:
+                gpt_calls.inc(call_site=call_site, outcome="cache_hit")
+                return cached
+
+        start = time.perf_counter()
+        for position, tier in enumerate(chain):
+            tier_start = time.perf_counter()
+            try:
+                response = await self.gateway.create(
+                    coalesce_key=GPTResponseCache.make_key(tier.model, messages, params),
+                    deadline=tier.latency_budget_seconds,
+                    model=tier.model,
+                    messages=messages,
+                    **params
+                )
+                break
+            except Exception as e:
+                gpt_errors.inc(call_site=call_site, error=type(e).__name__)
+                if position == len(chain) - 1:
+                    self.router.record(call_site, tier, "error", time.perf_counter() - tier_start)
+                    gpt_calls.inc(call_site=call_site, outcome="error")
+                    raise
+                self.router.record(call_site, tier, "fallback", time.perf_counter() - tier_start)
+                print(f"[{current_request_id()}] [모델 대체] {call_site}: {tier.name}({tier.model}) 실패, "
+                      f"{chain[position + 1].name}로 재시도 ({e!r})")
+        self.router.record(call_site, tier, "success", time.perf_counter() - tier_start)
+        gpt_call_seconds.observe(time.perf_counter() - start, call_site=call_site)
+        gpt_calls.inc(call_site=call_site, outcome="success")
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            gpt_tokens.inc(usage.prompt_tokens, call_site=call_site, kind="prompt")
+            gpt_tokens.inc(usage.completion_tokens, call_site=call_site, kind="completion")
+        content = response.choices[0].message.content or ""
+
+        # 캐시 키는 첫 등급 모델 기준이므로 대체 등급의 응답은 저장하지 않음
+        if cacheable and position == 0:
+            await gpt_response_cache.set(request_key, content)
+        # 결정적인(temperature=0) 응답만 기준 등급과 비교할 의미가 있음
+        reference = self.router.shadow_tier(tier) if temperature == 0 else None
+        if reference is not None:
+            task = asyncio.create_task(self._shadow(call_site, tier, reference, messages, params, content))
+            _shadow_tasks.add(task)
+            task.add_done_callback(_shadow_tasks.discard)
+        return content
+
+    # 기준 등급으로 같은 요청을 보내 응답 일치 여부 기록 (사용자 응답과 무관하게 백그라운드에서 실행)
+    async def _shadow(
+            self,
+            call_site: str,
+            tier: ModelTier,
+            reference: ModelTier,
+            messages: List[dict],
+            params: Dict,
+            content: str
+    ):
+        try:
+            response = await self.gateway.create(
+                deadline=reference.latency_budget_seconds,
+                model=reference.model,
+                messages=messages,
+                **params
+            )
+        except Exception as e:
+            print(f"[{current_request_id()}] [섀도 비교 실패] {call_site}: {reference.model} ({type(e).__name__})")
+            return
+        self.router.record_agreement(call_site, tier, content, response.choices[0].message.content or "")
 
     # 강의 개요 기반 추천 강의 필터링
     async def filter_recommended_lectures_by_description(
@@ -20,10 +156,21 @@ class GPTService:
         if not recommended:
             return []
 
+        # 로컬 BM25 점수로 후보를 좁히고, 점수 분포가 명확하면 GPT 호출 생략
+        candidates = recommended
+        if self.description_top_k > 0:
+            text_index = self._lecture_text_index(recommended, lecture_infos)
+            ranked = text_index.rank(user_input, restrict=recommended)
+            selected = clear_cut_selection(ranked)
+            if selected is not None:
+                return [name for name in recommended if name in selected]
+            if ranked:
+                candidates = [name for name, _ in ranked[:self.description_top_k]]
+
         lecture_info_dict = {
             name: (desc, obj)
             for name, desc, obj in lecture_infos
-            if name in recommended
+            if name in candidates
         }
 
         filter_prompt = f"""
@@ -31,7 +178,7 @@ class GPTService:
         - {user_input}
 
         아래는 추천된 강의 리스트입니다:
-        {chr(10).join(f"- {name}" for name in recommended)}
+        {chr(10).join(f"- {name}" for name in candidates)}
 
         각 강의에 대한 설명은 다음과 같습니다:
         {chr(10).join(f"{name}: {desc or ''} {obj or ''}" for name, (desc, obj) in lecture_info_dict.items())}
@@ -40,14 +187,14 @@ class GPTService:
         강의명만 줄바꿈으로 출력하고, 다른 설명은 절대 포함하지 마세요.
         """
 
-        response = await self.client.chat.completions.create(
-            model="gpt-4-turbo",
+        content = await self._complete(
+            call_site="filter_recommended_lectures_by_description",
             messages=[{"role": "user", "content": filter_prompt}],
             max_tokens=200,
             temperature=0.5,
         )
 
-        filtered_text = response.choices[0].message.content.strip()
+        filtered_text = content.strip()
         return [
             line.strip()
             for line in filtered_text.split("\n")
@@ -55,15 +202,49 @@ class GPTService:
         ]
 
 
-    # GPT 기반 유사 강의 검색
+    # 후보 강의명에 대한 퍼지 매칭 인덱스 (카탈로그 인덱스 재사용 가능 시 재사용)
+    @staticmethod
+    def _lecture_name_index(candidate_lectures: List[str]) -> Tuple[LectureNameIndex, Optional[Set[str]]]:
+        snapshot = lecture_catalog.snapshot
+        allowed = set(candidate_lectures)
+        if snapshot is not None and allowed <= snapshot.by_name.keys():
+            return snapshot.name_index, allowed
+        return LectureNameIndex(candidate_lectures), None
+
+
+    # 강의 개요 검색 인덱스 (카탈로그 인덱스 재사용 가능 시 재사용)
+    @staticmethod
+    def _lecture_text_index(recommended: List[str], lecture_infos: List[Tuple]) -> LectureTextIndex:
+        snapshot = lecture_catalog.snapshot
+        if snapshot is not None:
+            text_index = snapshot.description_index
+            if all(name in text_index for name in recommended):
+                return text_index
+        return LectureTextIndex(
+            (name, f"{desc or ''} {obj or ''}")
+            for name, desc, obj in lecture_infos
+            if name in recommended
+        )
+
+
+    # GPT 기반 유사 강의 검색 (로컬 퍼지 매칭이 확실하면 GPT 생략)
     async def find_similar_lecture_by_gpt(
             self,
             user_input: str,
             candidate_lectures: List[str]
     ) -> str:
+        name_index, allowed = self._lecture_name_index(candidate_lectures)
+        matches = name_index.search(user_input, limit=10, allowed=allowed)
+        confident = name_index.confident_match(matches)
+        if confident:
+            return confident
+
+        # 애매한 경우 로컬 상위 후보만 GPT에 전달
+        prompt_candidates = [name for name, _ in matches] if len(matches) > 1 else candidate_lectures
+
         prompt = f"""
         아래는 강의명 후보 리스트입니다:
-        {chr(10).join(f"- {name}" for name in candidate_lectures)}
+        {chr(10).join(f"- {name}" for name in prompt_candidates)}
 
         사용자가 입력한 강의 관련 요청: "{user_input}"
 
@@ -71,20 +252,18 @@ class GPTService:
         다른 설명 없이 강의명 하나만 정확하게 출력하세요.
         """
 
-        response = await self.client.chat.completions.create(
-            model="gpt-4-turbo",
+        content = await self._complete(
+            call_site="find_similar_lecture_by_gpt",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=20,
             temperature=0.3
         )
 
-        result = response.choices[0].message.content.strip()
-        matched = next(
-            (lec for lec in candidate_lectures
-             if result.replace(" ", "").lower() in lec.replace(" ", "").lower()),
-            None
-        )
-        return matched if matched else result
+        result = content.strip()
+        if result in candidate_lectures:
+            return result
+        matched = name_index.search(result, limit=1, allowed=allowed)
+        return matched[0][0] if matched else result
 
 
     # GPT로 추가/삭제 요청 분석
@@ -97,50 +276,122 @@ class GPTService:
     ) -> Tuple[List[str], List[str]]:
         previously_removed = previously_removed or []
 
-        prompt = f"""
-        다른 설명, 분석 과정은 절대 출력하지 말고, JSON만 출력하세요.
+        def template(sections):
+            return f"""
+            다른 설명, 분석 과정은 절대 출력하지 말고, JSON만 출력하세요.
 
-        현재 추천된 강의 목록:
-        {chr(10).join(f"- {lec}" for lec in current_lectures)}
+            현재 추천된 강의 목록:
+            {chr(10).join(f"- {lec}" for lec in current_lectures)}
 
-        추가 가능한 전체 강의 목록:
-        {chr(10).join(f"- {lec}" for lec in available_lectures)}
+            추가 가능한 전체 강의 목록:
+            {chr(10).join(f"- {lec}" for lec in sections["available_lectures"])}
 
-        사용자 입력: "{user_input}"
+            사용자 입력: "{user_input}"
 
-        [분석 기준]
-        - 만약 입력한 강의명이 추천 리스트에 존재한다면 삭제 대상으로 간주하세요.
-        - 입력한 강의명이 추천 리스트에 없고 전체 강의 목록에는 있다면 추가 대상으로 간주하세요.
+            [분석 기준]
+            - 만약 입력한 강의명이 추천 리스트에 존재한다면 삭제 대상으로 간주하세요.
+            - 입력한 강의명이 추천 리스트에 없고 전체 강의 목록에는 있다면 추가 대상으로 간주하세요.
 
-        [출력 포맷]
-        반드시 JSON 형식으로 출력하세요:
-        {{
-            "add": ["추가할 강의명1", "추가할 강의명2"],
-            "remove": ["삭제할 강의명1", "삭제할 강의명2"]
-        }}
-        """
+            [출력 포맷]
+            반드시 JSON 형식으로 출력하세요:
+            {{
+                "add": ["추가할 강의명1", "추가할 강의명2"],
+                "remove": ["삭제할 강의명1", "삭제할 강의명2"]
+            }}
+            """
+
+        prompt = PromptBuilder("parse_add_remove_lectures", settings.PROMPT_TOKEN_BUDGET).candidates(
+            "available_lectures", available_lectures, user_input, current_lectures
+        ).render(template)
 
-        response = await self.client.chat.completions.create(
-            model="gpt-4-turbo",
+        content = await self._complete(
+            call_site="parse_add_remove_lectures",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
-            max_tokens=100
+            max_tokens=100,
+            response_format=JSON_RESPONSE_FORMAT
         )
 
-        text = response.choices[0].message.content.strip()
-        match = re.search(r"\{(?:[^{}]|(?R))*}", text)
-
-        if not match:
-            print(f"JSON 패턴 매칭 실패: {text}")
+        result = extract_json_object(content)
+        if result is None:
+            print(f"[{current_request_id()}] JSON 디코딩 실패: {content.strip()}")
             return [], []
+        return result.get("add", []), result.get("remove", [])
+
+
+    # 수정 단계 한 턴의 의도(종료, 대체 추천, 추가/삭제)를 JSON 모드 GPT 호출 한 번으로 분석
+    # (로컬 분류기가 종료를 확신하면 GPT 생략, 호출 실패나 스키마 불일치 시 개별 판단을 동시에 호출)
+    async def analyze_turn(
+            self,
+            user_input: str,
+            current_lectures: List[str],
+            available_lectures: List[str],
+            deleted_lectures: List[str] = None
+    ) -> TurnAnalysis:
+        deleted_lectures = deleted_lectures or []
+        local_end = self.intent_classifier.classify_no_more_modification(user_input)
+        if self.intent_classifier.is_confident(local_end) and local_end.value:
+            return TurnAnalysis(end=True)
+        local_alternative = self.intent_classifier.classify_alternative_request(user_input, deleted_lectures)
+
+        def template(sections):
+            return f"""
+            다른 설명, 분석 과정은 절대 출력하지 말고, JSON만 출력하세요.
+            현재는 사용자가 추천된 강의 목록을 수정(추가/삭제)하는 단계입니다.
+
+            현재 추천된 강의 목록:
+            {chr(10).join(f"- {lec}" for lec in current_lectures)}
+
+            사용자가 삭제한 강의 목록:
+            {chr(10).join(f"- {lec}" for lec in deleted_lectures)}
+
+            추가 가능한 전체 강의 목록:
+            {chr(10).join(f"- {lec}" for lec in sections["available_lectures"])}
+
+            사용자 입력: "{user_input}"
+
+            [분석 기준]
+            - end: 더 이상 수정할 의도가 없고 커리큘럼 생성을 시작해도 된다는 경우 true
+            - alternative: 삭제한 강의를 빼고 다른 강의를 추천해달라는 의도이면 true
+            - remove: 입력한 강의명이 현재 추천 목록에 있으면 삭제 대상
+            - add: 입력한 강의명이 현재 추천 목록에 없고 전체 강의 목록에 있으면 추가 대상
+
+            [출력 포맷]
+            {{"end": false, "alternative": false, "add": ["추가할 강의명"], "remove": ["삭제할 강의명"]}}
+            """
+
+        prompt = PromptBuilder("analyze_turn", settings.PROMPT_TOKEN_BUDGET).candidates(
+            "available_lectures", available_lectures, user_input, current_lectures
+        ).render(template)
 
-        json_text = match.group()
         try:
-            result = json.loads(json_text)
-            return result.get("add", []), result.get("remove", [])
-        except json.JSONDecodeError:
-            print(f"JSON 디코딩 실패: {json_text}")
-            return [], []
+            content = await self._complete(
+                call_site="analyze_turn",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=150,
+                temperature=0,
+                response_format=JSON_RESPONSE_FORMAT
+            )
+            analysis = TurnAnalysis.model_validate(extract_json_object(content))
+        except Exception as e:
+            print(f"[{current_request_id()}] [GPT 턴 분석 응답 오류, 개별 판단으로 대체] {e}")
+            end, alternative, (add, remove) = await asyncio.gather(
+                self.is_no_more_modification(user_input),
+                self.is_requesting_alternative_recommendation(user_input, deleted_lectures),
+                self.parse_add_remove_lectures(user_input, current_lectures, available_lectures, deleted_lectures)
+            )
+            analysis = TurnAnalysis(end=end, alternative=alternative, add=add, remove=remove)
+
+        # 로컬 분류기가 확신한 항목은 로컬 결과 사용, 목록에 없는 강의명은 제외
+        if self.intent_classifier.is_confident(local_end):
+            analysis.end = local_end.value
+        if self.intent_classifier.is_confident(local_alternative):
+            analysis.alternative = local_alternative.value
+        current = set(current_lectures)
+        available = set(available_lectures)
+        analysis.add = [name for name in analysis.add if name in available and name not in current]
+        analysis.remove = [name for name in analysis.remove if name in current]
+        return analysis
 
 
     # 삭제된 강의 제외 추천 판단
@@ -149,6 +400,10 @@ class GPTService:
             user_input: str,
             deleted_lectures: List[str]
     ) -> bool:
+        local = self.intent_classifier.classify_alternative_request(user_input, deleted_lectures)
+        if self.intent_classifier.is_confident(local):
+            return local.value
+
         prompt = f"""
         사용자의 입력: "{user_input}"
 
@@ -163,19 +418,58 @@ class GPTService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo",
+            content = await self._complete(
+                call_site="is_requesting_alternative_recommendation",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=3,
                 temperature=0
             )
-            result = response.choices[0].message.content.strip()
+            result = content.strip()
             return result.upper() == "YES"
         except Exception as e:
-            print(f"[GPT 대체 추천 판단 예외 발생] {e}")
+            print(f"[{current_request_id()}] [GPT 대체 추천 판단 예외 발생] {e}")
             return False
 
 
+    # 삭제된 강의 제외 유사 강의 추천 메시지 구성
+    @staticmethod
+    def _similar_lectures_messages(
+            user_input: str,
+            deleted_lectures: List[str],
+            interest: List[str],
+            available_lectures: List[str]
+    ) -> List[dict]:
+        def template(sections):
+            return f"""
+            사용자는 관심 분야로 "{user_input}"을 선택했습니다.
+            그러나 다음 강의들은 제외하고 싶어 합니다:
+            {chr(10).join(f"- {name}" for name in deleted_lectures)}
+
+            관심 분야 키워드:
+            {chr(10).join(f"- {kw}" for kw in interest)}
+
+            전체 강의 후보 목록은 다음과 같습니다:
+            {chr(10).join(f"- {lec}" for lec in sections["available_lectures"])}
+
+            위 정보들을 기반으로 제외된 강의 외에 관심 분야와 관련된 강의명을 3개 추천하세요.
+            출력은 강의명만 줄바꿈으로, 다른 설명은 포함하지 마세요.
+            """
+
+        # 제외된 강의는 후보에서 미리 빼고 관심 분야 기준으로 예산에 맞춤
+        deleted = set(deleted_lectures)
+        prompt = PromptBuilder("suggest_other_similar_lectures", settings.PROMPT_TOKEN_BUDGET).candidates(
+            "available_lectures",
+            [lec for lec in available_lectures if lec not in deleted],
+            user_input,
+            interest
+        ).render(template)
+
+        return [
+            {"role": "system", "content": "너는 대학생의 강의 선택을 돕는 AI 챗봇이야."},
+            {"role": "user", "content": prompt}
+        ]
+
+
     # 삭제된 강의 제외 유사 강의 추천
     async def suggest_other_similar_lectures(
             self,
@@ -184,38 +478,78 @@ class GPTService:
             interest: List[str],
             available_lectures: List[str]
     ) -> List[str]:
-        prompt = f"""
-        사용자는 관심 분야로 "{user_input}"을 선택했습니다.
-        그러나 다음 강의들은 제외하고 싶어 합니다:
-        {chr(10).join(f"- {name}" for name in deleted_lectures)}
-
-        관심 분야 키워드:
-        {chr(10).join(f"- {kw}" for kw in interest)}
-
-        전체 강의 후보 목록은 다음과 같습니다:
-        {chr(10).join(f"- {lec}" for lec in available_lectures)}
-
-        위 정보들을 기반으로 제외된 강의 외에 관심 분야와 관련된 강의명을 3개 추천하세요.
-        출력은 강의명만 줄바꿈으로, 다른 설명은 포함하지 마세요.
-        """
-
-        response = await self.client.chat.completions.create(
-            model="gpt-4-turbo",
-            messages=[
-                {"role": "system", "content": "너는 대학생의 강의 선택을 돕는 AI 챗봇이야."},
-                {"role": "user", "content": prompt}
-            ],
+        content = await self._complete(
+            call_site="suggest_other_similar_lectures",
+            messages=self._similar_lectures_messages(user_input, deleted_lectures, interest, available_lectures),
             max_tokens=200,
             temperature=0.5
         )
 
         return [
             line.strip()
-            for line in response.choices[0].message.content.strip().split("\n")
+            for line in content.strip().split("\n")
             if line.strip()
         ]
 
 
+    # 삭제된 강의 제외 유사 강의 추천 (스트리밍: 토큰과 완성된 강의명을 순서대로 전달)
+    async def stream_other_similar_lectures(
+            self,
+            user_input: str,
+            deleted_lectures: List[str],
+            interest: List[str],
+            available_lectures: List[str]
+    ) -> AsyncIterator[Tuple[str, str]]:
+        messages = self._similar_lectures_messages(user_input, deleted_lectures, interest, available_lectures)
+        buffer = ""
+        async for delta in self._stream(
+                "stream_other_similar_lectures",
+                messages=messages,
+                max_tokens=200,
+                temperature=0.5
+        ):
+            yield "token", delta
+            buffer += delta
+            while "\n" in buffer:
+                line, buffer = buffer.split("\n", 1)
+                if line.strip():
+                    yield "lecture", line.strip()
+
+        if buffer.strip():
+            yield "lecture", buffer.strip()
+
+
+    # 스트리밍 GPT 호출 (첫 토큰/전체 시간과 오류를 call_site별로 기록, 스트리밍 응답에는 usage가 없어 토큰 수는 미집계)
+    # 첫 토큰을 받기 전에 실패한 경우에만 다음 모델 등급으로 대체 (이미 전달한 토큰은 되돌릴 수 없음)
+    async def _stream(self, call_site: str, **params) -> AsyncIterator[str]:
+        chain = self.router.chain(call_site)
+        start = time.perf_counter()
+        first_token = True
+        for position, tier in enumerate(chain):
+            tier_start = time.perf_counter()
+            try:
+                async for delta in self.gateway.stream(
+                        deadline=tier.latency_budget_seconds, model=tier.model, **params
+                ):
+                    if first_token:
+                        gpt_first_token_seconds.observe(time.perf_counter() - start, call_site=call_site)
+                        first_token = False
+                    yield delta
+                break
+            except Exception as e:
+                gpt_errors.inc(call_site=call_site, error=type(e).__name__)
+                if not first_token or position == len(chain) - 1:
+                    self.router.record(call_site, tier, "error", time.perf_counter() - tier_start)
+                    gpt_calls.inc(call_site=call_site, outcome="error")
+                    raise
+                self.router.record(call_site, tier, "fallback", time.perf_counter() - tier_start)
+                print(f"[{current_request_id()}] [모델 대체] {call_site}: {tier.name}({tier.model}) 실패, "
+                      f"{chain[position + 1].name}로 재시도 ({e!r})")
+        self.router.record(call_site, tier, "success", time.perf_counter() - tier_start)
+        gpt_call_seconds.observe(time.perf_counter() - start, call_site=call_site)
+        gpt_calls.inc(call_site=call_site, outcome="success")
+
+
     # 관심 분야 명확성 판단
     async def resolve_unclear_interest(self, user_input: str) -> Tuple[List[str], bool]:
         prompt = f"""
@@ -235,13 +569,13 @@ class GPTService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo",
+            content = await self._complete(
+                call_site="resolve_unclear_interest",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=100,
                 temperature=0
             )
-            result = response.choices[0].message.content.strip()
+            result = content.strip()
 
             if "YES:" in result:
                 start = result.index("YES:") + 4
@@ -254,12 +588,16 @@ class GPTService:
                 return [user_input], False
 
         except Exception as e:
-            print(f"[GPT 관심 분야 처리 오류] {e}")
+            print(f"[{current_request_id()}] [GPT 관심 분야 처리 오류] {e}")
             return [user_input], False
 
 
     # 추천 강의 목록 수정 종료 판단
     async def is_no_more_modification(self, user_input: str) -> bool:
+        local = self.intent_classifier.classify_no_more_modification(user_input)
+        if self.intent_classifier.is_confident(local):
+            return local.value
+
         prompt = f"""
         현재는 사용자가 추천된 강의 목록을 수정(추가/삭제)하는 단계입니다.
 
@@ -272,21 +610,25 @@ class GPTService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo",
+            content = await self._complete(
+                call_site="is_no_more_modification",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=10,
                 temperature=0
             )
-            result = response.choices[0].message.content.strip().replace('"', '').strip()
+            result = content.strip().replace('"', '').strip()
             return result == "종료"
         except Exception as e:
-            print(f"[GPT 판단 오류] {e}")
+            print(f"[{current_request_id()}] [GPT 판단 오류] {e}")
             return False
 
 
     # 커리큘럼 설계 조건 판단
     async def parse_conditions_with_gpt(self, user_input: str) -> List[str]:
+        local = self.intent_classifier.classify_conditions(user_input)
+        if self.intent_classifier.is_confident(local):
+            return local.value
+
         condition_keys = ["graduation", "no_team_project", "preferred_professor", "retake"]
 
         prompt = f"""
@@ -306,13 +648,13 @@ class GPTService:
         {user_input}
         """
 
-        response = await self.client.chat.completions.create(
-            model="gpt-4o",
+        content = await self._complete(
+            call_site="parse_conditions_with_gpt",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=40,
             temperature=0,
         )
-        result = response.choices[0].message.content.strip()
+        result = content.strip()
 
         try:
             parsed = eval(result)
@@ -325,6 +667,10 @@ class GPTService:
 
     # 커리큘럼 설계 요청 판단
     async def is_curriculum_request(self, user_input: str) -> bool:
+        local = self.intent_classifier.classify_curriculum_request(user_input)
+        if self.intent_classifier.is_confident(local):
+            return local.value
+
         prompt = f"""
         사용자의 입력: "{user_input}"
 
@@ -335,14 +681,14 @@ class GPTService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4-turbo",
+            content = await self._complete(
+                call_site="is_curriculum_request",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=3,
                 temperature=0
             )
-            result = response.choices[0].message.content.strip().upper()
+            result = content.strip().upper()
             return result == "YES"
         except Exception as e:
-            print(f"[GPT 커리큘럼 요청 판단 오류] {e}")
+            print(f"[{current_request_id()}] [GPT 커리큘럼 요청 판단 오류] {e}")
             return False
\ No newline at end of file
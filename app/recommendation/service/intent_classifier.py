@@ -0,0 +1,212 @@
+import re
+from typing import Any, List, NamedTuple
+
+
+class IntentResult(NamedTuple):
+    value: Any
+    confidence: float
+
+
+# 확신할 수 없는 경우 (GPT로 위임)
+UNSURE = IntentResult(None, 0.0)
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+# 어절 단위 어미 정규화 규칙 (존댓말/구어체 → 기본형)
+_ENDING_RULES = [
+    (re.compile(r"(해\s?주세요|해\s?주실래요|해\s?주실 수 있나요|해\s?줄래|해\s?줄래요|해\s?줘요|해주라)$"), "해줘"),
+    (re.compile(r"(주세요|주실래요|줄래요|줄래|줘요|주라)$"), "줘"),
+    (re.compile(r"(합니다|할게요|할께요|할께|하겠습니다|할래요)$"), "할게"),
+    (re.compile(r"(됐어요|됐습니다|되었습니다|되었어요|됬어|됬어요)$"), "됐어"),
+    (re.compile(r"(싫어요|싫습니다|싫은데요|싫은데)$"), "싫어"),
+    (re.compile(r"(좋아요|좋습니다|좋네요|좋은데요)$"), "좋아"),
+    (re.compile(r"(괜찮아요|괜찮습니다|괜찮네요)$"), "괜찮아"),
+    (re.compile(r"(없어요|없습니다|없네요)$"), "없어"),
+    (re.compile(r"(예요|이에요|에요|입니다)$"), ""),
+    (re.compile(r"(?<=[가-힣])요$"), ""),
+]
+
+# 단독 긍정 답변은 질문에 따라 뜻이 달라지므로 종료 판단에 단독으로는 쓰지 않음 (종료 표현 앞의 말로만 허용)
+_YES_WORDS = {"네", "넵", "예", "응", "ㅇㅇ", "yes", "ok", "오케이", "웅", "넹"}
+_END_WORDS = (
+    "종료", "그만", "끝", "됐어", "충분", "이대로", "이걸로", "이거로", "만족", "완료", "괜찮아",
+    "좋아", "진행", "넘어가", "수정 없", "더 없", "없어", "확정", "생성해", "만들어"
+)
+# 종료 표현은 문장 끝에 있을 때만 인정 ("네트워크 강의가 좋아", "진행 방식이 어때" 같은 입력 제외)
+_END_PHRASE = re.compile(
+    r"(?<!\S)(종료|그만|끝|끝내|됐어|충분|만족|완료|괜찮아|좋아|진행|넘어가|넘어가자|확정|생성|만들어|이대로|그대로)"
+    r"(\s?(해|하자|할게|할래|해도\s?돼|하면\s?돼))?(\s?줘)?$"
+)
+# "없어"는 수정할 것이 없다는 표현일 때만 종료로 인정 ("더 없어", "파이썬 없어"는 강의 검색일 수 있음)
+_NOTHING_TO_CHANGE = re.compile(
+    r"(?<!\S)(수정|바꿀|고칠|변경|추가|뺄|삭제)(할)?\s?(거|것|게|건|사항|부분)?\s?(더\s?)?없어$"
+)
+# 종료 표현 앞에 와도 되는 말 (그 외 강의명/주제가 함께 있으면 GPT로 위임)
+_END_FILLERS = _YES_WORDS | {
+    "이대로", "이걸로", "이거로", "그대로", "그냥", "이제", "그럼", "다", "더", "수정", "수정은", "수정할", "거", "것",
+    "이", "정도면", "이정도면", "충분히", "바로", "진짜", "정말", "좋아", "괜찮아", "됐어", "커리큘럼", "커리큘럼으로",
+    "다음", "단계로", "시작", "없이"
+}
+_QUESTION = re.compile(r"(\?|어때|뭐|뭘|왜|어떻게|언제|어디|까|니|냐|나요|는지)\s*[.!~]*$")
+_CONTINUE_WORDS = (
+    "추가", "삭제", "빼", "넣어", "바꿔", "변경", "교체", "다른", "말고", "대신", "제외", "더 추천", "수정해"
+)
+_CURRICULUM_NOUNS = ("커리큘럼", "시간표", "수강계획", "수강 계획", "이수계획", "이수 계획", "학업계획", "학업 계획", "로드맵")
+# 새로 만드는 동사만 인정 ("커리큘럼 삭제해줘", "시간표 보여줘"처럼 다른 동작을 요청하는 문장 제외)
+_CURRICULUM_VERB = re.compile(r"(짜(?!증)|만들|설계|생성|구성|세워|세우|작성)")
+_CURRICULUM_OTHER_ACTIONS = (
+    "삭제", "지워", "취소", "설명", "보여", "알려", "확인", "조회", "저장", "수정", "변경", "바꿔", "비교", "평가"
+)
+_GREETING_WORDS = ("안녕", "고마워", "감사", "반가워", "ㅎㅇ", "하이")
+_NEGATION_WORDS = ("말고", "싫", "안 ", "안해", "하지마", "하지 마", "필요없", "필요 없", "괜찮아")
+_ALTERNATIVE_WORDS = ("다른", "대신", "말고", "빼고", "제외", "대체", "비슷한", "유사한")
+_REQUEST_WORDS = ("추천", "알려", "찾아", "보여", "줘", "해줘")
+
+_TEAM_PROJECT = re.compile(r"(팀플|팀\s?프로젝트|조별\s?과제|조별과제|팀\s?과제)")
+_TEAM_NEGATIVE = re.compile(r"(싫|빼|제외|없는|없이|없었|안\s?하|말고|피하|피해|않)")
+_GRADUATION = re.compile(r"졸업")
+_GRADUATION_NEGATIVE = re.compile(r"졸업\S*\s*(안|않|말고|상관\s?없|신경\s?안)")
+_PROFESSOR = re.compile(r"교수")
+# 교수 뒤에 오는 무관/제외 표현 ("교수님 상관없어", "이상호 교수님 수업은 빼줘")
+_PROFESSOR_NEGATIVE = re.compile(r"(상관\s?없|신경\s?안|아무나|빼|제외|말고|싫|안\s?듣|피하|피해|않)")
+_RETAKE = re.compile(r"(재수강|재이수|다시\s?듣|다시\s?수강)")
+# 재수강 뒤에 오는 제외/거절 표현 ("재수강은 빼줘", "재수강 안 할래", "재수강은 싫어")
+_RETAKE_NEGATIVE = re.compile(r"(빼|제외|말고|싫|안\s?(하|할|해|듣|들)|않|필요\s?없|없이)")
+
+
+# 키워드/정규식 기반 로컬 의도 분류기 (확신도가 낮으면 GPT로 위임)
+class LocalIntentClassifier:
+    def __init__(self, threshold: float = 0.85):
+        self.threshold = threshold
+
+    # 문장 정규화: 소문자화, 문장부호 제거, 어미 정규화
+    @staticmethod
+    def normalize(text: str) -> str:
+        text = _PUNCTUATION.sub(" ", text.lower())
+        tokens = []
+        for token in _WHITESPACE.split(text.strip()):
+            for pattern, replacement in _ENDING_RULES:
+                token = pattern.sub(replacement, token)
+            if token:
+                tokens.append(token)
+        return " ".join(tokens)
+
+    # 로컬 결과를 그대로 사용할 수 있는지 판단
+    def is_confident(self, result: IntentResult) -> bool:
+        return result.value is not None and result.confidence >= self.threshold
+
+    # 추천 강의 목록 수정 종료 판단
+    def classify_no_more_modification(self, user_input: str) -> IntentResult:
+        text = self.normalize(user_input)
+        if not text:
+            return UNSURE
+
+        has_end = any(word in text for word in _END_WORDS)
+        has_continue = any(word in text for word in _CONTINUE_WORDS)
+        end_match = _END_PHRASE.search(text)
+        # 종료 표현이 문장 끝에 있고 앞에는 "네", "이대로", "더" 같은 말만 있는 경우
+        clear_end = end_match is not None and all(
+            token in _END_FILLERS for token in text[:end_match.start()].split()
+        )
+        nothing_match = _NOTHING_TO_CHANGE.search(text)
+
+        # "추가할 거 없어", "더 수정할 거 없어"는 계속 표현(추가/삭제)을 포함하지만 종료
+        if nothing_match and not _QUESTION.search(user_input.strip()) and all(
+                token in _END_FILLERS for token in text[:nothing_match.start()].split()
+        ):
+            return IntentResult(True, 0.95)
+        if has_end and has_continue:
+            return IntentResult(None, 0.3)
+        if has_continue:
+            return IntentResult(False, 0.9)
+        # "파이썬 없어?", "운영체제 좋아 보이는데 어때?" 같은 질문은 종료로 보지 않고 GPT로 위임
+        if _QUESTION.search(user_input.strip()):
+            return IntentResult(None, 0.3)
+        if clear_end:
+            return IntentResult(True, 0.95)
+        if has_end:
+            return IntentResult(None, 0.5)
+        return UNSURE
+
+    # 커리큘럼 설계 요청 판단
+    def classify_curriculum_request(self, user_input: str) -> IntentResult:
+        text = self.normalize(user_input)
+        if not text:
+            return UNSURE
+
+        has_noun = any(noun in text for noun in _CURRICULUM_NOUNS)
+        has_verb = _CURRICULUM_VERB.search(text) is not None
+        has_negation = any(word in text for word in _NEGATION_WORDS)
+        has_other_action = any(word in text for word in _CURRICULUM_OTHER_ACTIONS)
+
+        if has_noun and has_verb and not has_negation and not has_other_action:
+            return IntentResult(True, 0.95)
+        if has_noun:
+            return IntentResult(None, 0.5)
+        if any(word in text for word in _GREETING_WORDS):
+            return IntentResult(False, 0.9)
+        return IntentResult(False, 0.6)
+
+    # 삭제된 강의 제외 추천 판단
+    def classify_alternative_request(self, user_input: str, deleted_lectures: List[str]) -> IntentResult:
+        compact = user_input.replace(" ", "").lower()
+        mentioned = any(
+            name.replace(" ", "").lower() in compact
+            for name in deleted_lectures
+            if name
+        )
+        # 삭제된 강의명이 입력에 없으면 GPT 기준으로도 항상 NO
+        if not mentioned:
+            return IntentResult(False, 0.95)
+
+        text = self.normalize(user_input)
+        has_alternative = any(word in text for word in _ALTERNATIVE_WORDS)
+        has_request = any(word in text for word in _REQUEST_WORDS)
+        if has_alternative and has_request:
+            return IntentResult(True, 0.9)
+        return UNSURE
+
+    # 커리큘럼 설계 조건 추출
+    def classify_conditions(self, user_input: str) -> IntentResult:
+        text = self.normalize(user_input)
+        if not text:
+            return IntentResult([], 0.9)
+
+        conditions: List[str] = []
+        confidence = 0.9
+
+        if _GRADUATION.search(text):
+            if _GRADUATION_NEGATIVE.search(text):
+                confidence = 0.0
+            else:
+                conditions.append("graduation")
+
+        team_match = _TEAM_PROJECT.search(text)
+        if team_match:
+            window = text[team_match.start():team_match.end() + 12]
+            if _TEAM_NEGATIVE.search(window):
+                conditions.append("no_team_project")
+            else:
+                confidence = 0.0
+
+        professor_match = _PROFESSOR.search(text)
+        if professor_match:
+            window = text[professor_match.start():professor_match.end() + 12]
+            if _PROFESSOR_NEGATIVE.search(window):
+                confidence = 0.0
+            else:
+                conditions.append("preferred_professor")
+
+        retake_match = _RETAKE.search(text)
+        if retake_match:
+            window = text[retake_match.start():retake_match.end() + 12]
+            if _RETAKE_NEGATIVE.search(window):
+                confidence = 0.0
+            else:
+                conditions.append("retake")
+
+        if not conditions:
+            return IntentResult(None, 0.4)
+        return IntentResult(conditions, confidence) if confidence else UNSURE
+
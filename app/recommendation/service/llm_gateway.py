@@ -0,0 +1,215 @@
+import asyncio
+import random
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# openai/httpx는 import 비용이 커서 클라이언트를 만들 때 가져옴
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+from app.core.metrics import metrics_registry
+
+llm_requests = metrics_registry.counter(
+    "llm_gateway_requests_total", "LLM 게이트웨이 요청 수 (결과별)", ["outcome"]
+)
+llm_retries = metrics_registry.counter("llm_gateway_retries_total", "LLM 재시도 횟수", ["reason"])
+llm_coalesced = metrics_registry.counter("llm_gateway_coalesced_total", "동일 요청 병합으로 생략된 호출 수")
+llm_inflight = metrics_registry.gauge("llm_gateway_inflight", "현재 진행 중인 LLM 호출 수")
+llm_semaphore_wait = metrics_registry.histogram(
+    "llm_gateway_semaphore_wait_seconds", "동시성 제한 대기 시간"
+)
+
+# 재시도 대상 오류 (429, 5xx, 타임아웃, 연결 오류)
+@lru_cache(maxsize=None)
+def retryable_errors() -> Tuple[type, ...]:
+    import openai
+    return (
+        openai.RateLimitError,
+        openai.InternalServerError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        asyncio.TimeoutError,
+    )
+
+
+class LLMDeadlineExceeded(Exception):
+    pass
+
+
+# 프로세스 공용 OpenAI 호출 게이트웨이 (동시성 제한, 기한, 지터 재시도, 동일 요청 병합)
+class LLMGateway:
+    def __init__(
+            self,
+            client: Optional["AsyncOpenAI"] = None,
+            max_concurrency: int = settings.LLM_MAX_CONCURRENCY,
+            timeout_seconds: float = settings.LLM_TIMEOUT_SECONDS,
+            max_retries: int = settings.LLM_MAX_RETRIES,
+            backoff_base_seconds: float = settings.LLM_BACKOFF_BASE_SECONDS,
+            backoff_max_seconds: float = settings.LLM_BACKOFF_MAX_SECONDS
+    ):
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    # 공용 클라이언트 (SDK 자체 재시도는 끄고 게이트웨이에서 처리)
+    @property
+    def client(self) -> "AsyncOpenAI":
+        if self._client is None:
+            import httpx
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL or None,
+                max_retries=0,
+                timeout=self.timeout_seconds,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency
+                    ),
+                    timeout=self.timeout_seconds
+                )
+            )
+        return self._client
+
+    @client.setter
+    def client(self, client: "AsyncOpenAI"):
+        self._client = client
+
+    # chat completion 호출 (coalesce_key가 같은 동시 요청은 한 번만 호출)
+    # 공유 호출은 별도 태스크로 실행하고 모든 요청이 shield로 기다림 (한 요청이 취소돼도 나머지는 결과를 받음,
+    # 기다리는 요청이 모두 취소된 경우에만 공유 호출 취소)
+    async def create(self, coalesce_key: Optional[str] = None, deadline: Optional[float] = None, **params) -> Any:
+        timeout = deadline if deadline is not None else self.timeout_seconds
+        if coalesce_key is None:
+            return await self._create_with_retry(params, timeout)
+
+        task = self._inflight.get(coalesce_key)
+        if task is None:
+            task = asyncio.ensure_future(self._create_with_retry(params, timeout))
+            self._inflight[coalesce_key] = task
+            task.add_done_callback(lambda done: self._finish(coalesce_key, done))
+        else:
+            llm_coalesced.inc()
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+
+    def _finish(self, coalesce_key: str, task: asyncio.Task):
+        if self._inflight.get(coalesce_key) is task:
+            del self._inflight[coalesce_key]
+        # 대기자가 모두 떠난 뒤 실패하면 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    # stream=True 호출로 응답 토큰을 도착 즉시 전달 (첫 토큰 전까지만 재시도)
+    async def stream(self, deadline: Optional[float] = None, **params) -> AsyncIterator[str]:
+        timeout = deadline if deadline is not None else self.timeout_seconds
+        deadline_at = time.monotonic() + timeout
+        wait_start = time.monotonic()
+        async with self._semaphore:
+            llm_semaphore_wait.observe(time.monotonic() - wait_start)
+            llm_inflight.inc()
+            try:
+                attempt = 0
+                while True:
+                    try:
+                        remaining = max(deadline_at - time.monotonic(), 0.001)
+                        response = await asyncio.wait_for(
+                            self.client.chat.completions.create(stream=True, **params),
+                            timeout=remaining
+                        )
+                        break
+                    except retryable_errors() as e:
+                        delay = self._backoff(attempt, e)
+                        if attempt >= self.max_retries or time.monotonic() + delay >= deadline_at:
+                            llm_requests.inc(outcome="error")
+                            raise
+                        llm_retries.inc(reason=type(e).__name__)
+                        attempt += 1
+                        await asyncio.sleep(delay)
+
+                async for chunk in response:
+                    if time.monotonic() > deadline_at:
+                        llm_requests.inc(outcome="deadline")
+                        raise LLMDeadlineExceeded(f"LLM 스트리밍 기한 초과 ({timeout:.1f}s)")
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+                llm_requests.inc(outcome="success")
+            finally:
+                llm_inflight.dec()
+
+    async def _create_with_retry(self, params: Dict[str, Any], timeout: float) -> Any:
+        deadline_at = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                llm_requests.inc(outcome="deadline")
+                raise LLMDeadlineExceeded(f"LLM 호출 기한 초과 ({timeout:.1f}s)")
+
+            try:
+                result = await self._create_once(params, remaining)
+                llm_requests.inc(outcome="success")
+                return result
+            except retryable_errors() as e:
+                if attempt >= self.max_retries:
+                    llm_requests.inc(outcome="error")
+                    raise
+                delay = self._backoff(attempt, e)
+                if time.monotonic() + delay >= deadline_at:
+                    llm_requests.inc(outcome="deadline")
+                    raise
+                llm_retries.inc(reason=type(e).__name__)
+                attempt += 1
+                await asyncio.sleep(delay)
+            except Exception:
+                llm_requests.inc(outcome="error")
+                raise
+
+    async def _create_once(self, params: Dict[str, Any], timeout: float) -> Any:
+        wait_start = time.monotonic()
+        async with self._semaphore:
+            llm_semaphore_wait.observe(time.monotonic() - wait_start)
+            llm_inflight.inc()
+            try:
+                return await asyncio.wait_for(
+                    self.client.chat.completions.create(**params),
+                    timeout=max(timeout - (time.monotonic() - wait_start), 0.001)
+                )
+            finally:
+                llm_inflight.dec()
+
+    # 지수 백오프 + full jitter (Retry-After 헤더가 있으면 우선)
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max_seconds)
+            except ValueError:
+                pass
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+llm_gateway = LLMGateway()
@@ -0,0 +1,133 @@
+import json
+import random
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+llm_tier_call_seconds = metrics_registry.histogram(
+    "llm_tier_call_seconds", "모델 등급별 OpenAI 호출 시간 (성공한 호출)", ["tier", "model"]
+)
+llm_tier_calls = metrics_registry.counter(
+    "llm_tier_calls_total", "호출 지점/모델 등급별 호출 수 (success, fallback, error)", ["call_site", "tier", "outcome"]
+)
+llm_tier_agreement = metrics_registry.counter(
+    "llm_tier_agreement_total", "섀도 비교에서 기준 등급 응답과의 일치 여부", ["call_site", "tier", "agreed"]
+)
+
+# 호출 지점별 기본 경로 (예/아니오 판단과 짧은 JSON 추출은 빠른 모델, 목록 생성은 큰 모델)
+DEFAULT_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "is_no_more_modification": ("fast", "standard"),
+    "is_curriculum_request": ("fast", "standard"),
+    "is_requesting_alternative_recommendation": ("fast", "standard"),
+    "resolve_unclear_interest": ("fast", "standard"),
+    "parse_conditions_with_gpt": ("fast", "standard"),
+    "parse_add_remove_lectures": ("fast", "standard"),
+    "analyze_turn": ("fast", "standard"),
+    "filter_recommended_lectures_by_description": ("large", "standard"),
+    "find_similar_lecture_by_gpt": ("large", "standard"),
+    "suggest_other_similar_lectures": ("large", "standard"),
+    "stream_other_similar_lectures": ("large", "standard"),
+}
+DEFAULT_ROUTE: Tuple[str, ...] = ("large",)
+
+
+# 모델 등급 (이름, 모델명, 이 등급에서 응답을 기다릴 최대 시간)
+class ModelTier(NamedTuple):
+    name: str
+    model: str
+    latency_budget_seconds: float
+
+
+# "fast=gpt-4o-mini:8,large=gpt-4-turbo:30" 형식의 등급 설정 파싱
+def parse_tiers(spec: str) -> Dict[str, ModelTier]:
+    tiers = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        model, _, budget = value.rpartition(":")
+        if not name or not model:
+            raise ValueError(f"모델 등급 설정 형식 오류: {item}")
+        tiers[name.strip()] = ModelTier(name.strip(), model.strip(), float(budget))
+    return tiers
+
+
+# "analyze_turn=fast>standard,*=large" 형식의 경로 설정 파싱 (*는 등록되지 않은 호출 지점)
+def parse_routes(spec: str) -> Dict[str, Tuple[str, ...]]:
+    routes = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        call_site, _, chain = item.partition("=")
+        tiers = tuple(tier.strip() for tier in chain.split(">") if tier.strip())
+        if not call_site or not tiers:
+            raise ValueError(f"모델 경로 설정 형식 오류: {item}")
+        routes[call_site.strip()] = tiers
+    return routes
+
+
+# 응답 비교용 정규화 (JSON이면 파싱 결과, 아니면 공백을 정리한 문자열)
+def _normalize(content: str):
+    text = " ".join(content.split())
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+# 호출 지점 → 모델 등급 체인 라우팅 (앞 등급이 실패하거나 예산을 넘기면 다음 등급으로 대체)
+# 일부 호출은 기준 등급으로도 호출해 응답 일치율을 기록 (빠른 등급으로 내려도 되는지 판단 근거)
+class ModelRouter:
+    def __init__(
+            self,
+            tiers: Dict[str, ModelTier],
+            routes: Dict[str, Tuple[str, ...]],
+            reference_tier: str,
+            shadow_rate: float = 0.0,
+            seed: Optional[int] = None
+    ):
+        default_route = routes.get("*", DEFAULT_ROUTE)
+        for call_site, chain in list(routes.items()) + [("*", default_route)]:
+            unknown = [tier for tier in chain if tier not in tiers]
+            if unknown:
+                raise ValueError(f"{call_site} 경로에 정의되지 않은 모델 등급: {', '.join(unknown)}")
+        if shadow_rate > 0 and reference_tier not in tiers:
+            raise ValueError(f"정의되지 않은 기준 모델 등급: {reference_tier}")
+
+        self.tiers = tiers
+        self.routes = {call_site: chain for call_site, chain in routes.items() if call_site != "*"}
+        self.default_route = default_route
+        self.reference_tier = reference_tier
+        self.shadow_rate = shadow_rate
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_settings(cls) -> "ModelRouter":
+        routes = dict(DEFAULT_ROUTES)
+        routes.update(parse_routes(settings.LLM_MODEL_ROUTES))
+        return cls(
+            parse_tiers(settings.LLM_MODEL_TIERS),
+            routes,
+            settings.LLM_REFERENCE_TIER,
+            settings.LLM_ROUTING_SHADOW_RATE
+        )
+
+    def chain(self, call_site: str) -> List[ModelTier]:
+        return [self.tiers[name] for name in self.routes.get(call_site, self.default_route)]
+
+    def record(self, call_site: str, tier: ModelTier, outcome: str, seconds: float):
+        llm_tier_calls.inc(call_site=call_site, tier=tier.name, outcome=outcome)
+        if outcome == "success":
+            llm_tier_call_seconds.observe(seconds, tier=tier.name, model=tier.model)
+
+    # 응답한 등급이 기준 등급이 아니면 shadow_rate 확률로 비교할 기준 등급 반환
+    def shadow_tier(self, tier: ModelTier) -> Optional[ModelTier]:
+        if self.shadow_rate <= 0 or tier.name == self.reference_tier:
+            return None
+        if self.random.random() >= self.shadow_rate:
+            return None
+        return self.tiers[self.reference_tier]
+
+    def record_agreement(self, call_site: str, tier: ModelTier, content: str, reference_content: str):
+        agreed = _normalize(content) == _normalize(reference_content)
+        llm_tier_agreement.inc(call_site=call_site, tier=tier.name, agreed=str(agreed).lower())
+
+
+model_router = ModelRouter.from_settings()
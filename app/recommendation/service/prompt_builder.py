@@ -0,0 +1,127 @@
+from typing import Callable, Dict, List, Sequence
+
+from app.core.metrics import metrics_registry
+from app.lecture.lecture_catalog import lecture_catalog
+from app.lecture.lecture_name_index import LectureNameIndex
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODING = None
+
+TOKEN_BUCKETS = (100, 250, 500, 1000, 1500, 2000, 3000, 4000, 6000, 8000, 12000)
+
+prompt_tokens = metrics_registry.histogram(
+    "gpt_prompt_tokens", "프롬프트 토큰 수 (호출 지점별)", ["call_site"], TOKEN_BUCKETS
+)
+prompt_section_tokens = metrics_registry.counter(
+    "gpt_prompt_section_tokens_total", "프롬프트 구간별 누적 토큰 수", ["call_site", "section"]
+)
+pruned_candidates = metrics_registry.counter(
+    "gpt_prompt_pruned_candidates_total", "토큰 예산 초과로 제외된 후보 수", ["call_site", "section"]
+)
+
+
+# 토큰 수 계산 (tiktoken 미설치 시 한글 음절당 1토큰, 그 외 4자당 1토큰으로 근사)
+def count_tokens(text: str) -> int:
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    hangul = sum(1 for char in text if "가" <= char <= "힣")
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def bullet_list(items: Sequence[str]) -> str:
+    return "\n".join(f"- {item}" for item in items)
+
+
+# 입력/현재 강의/관심 분야와의 관련도 점수 (강의명 퍼지 매칭 + 강의 개요 BM25)
+def relevance_scores(items: List[str], user_input: str, context: Sequence[str] = ()) -> Dict[str, float]:
+    scores = {item: 0.0 for item in items}
+    allowed = set(items)
+    snapshot = lecture_catalog.snapshot
+
+    if snapshot is not None and allowed <= snapshot.by_name.keys():
+        name_index, name_allowed = snapshot.name_index, allowed
+    else:
+        name_index, name_allowed = LectureNameIndex(items), None
+    for name, score in name_index.search(user_input, limit=len(items), allowed=name_allowed):
+        scores[name] += 2 * score
+
+    if snapshot is not None:
+        query = " ".join([user_input, *context])
+        ranked = snapshot.description_index.rank(query, restrict=items)
+        top = ranked[0][1] if ranked else 0.0
+        if top > 0:
+            for name, score in ranked:
+                scores[name] += score / top
+
+    return scores
+
+
+# 구간별 토큰 수를 세고, 호출별 토큰 예산을 넘으면 후보 목록을 관련도 순으로 줄이는 프롬프트 빌더
+class PromptBuilder:
+    def __init__(self, call_site: str, budget: int):
+        self.call_site = call_site
+        self.budget = budget
+        self._candidates: Dict[str, List[str]] = {}
+        self._queries: Dict[str, tuple] = {}
+
+    # 예산 초과 시 줄일 수 있는 후보 구간 등록
+    def candidates(self, section: str, items: List[str], user_input: str, context: Sequence[str] = ()) -> "PromptBuilder":
+        self._candidates[section] = list(items)
+        self._queries[section] = (user_input, tuple(context))
+        return self
+
+    # 템플릿에 후보 구간을 채워 프롬프트 생성 (예산 초과 시 후보 축소)
+    def render(self, template: Callable[[Dict[str, List[str]]], str]) -> str:
+        sections = dict(self._candidates)
+        prompt = template(sections)
+        total = count_tokens(prompt)
+
+        if total > self.budget and sections:
+            sections = self._prune(template, sections)
+            prompt = template(sections)
+            total = count_tokens(prompt)
+
+        prompt_tokens.observe(total, call_site=self.call_site)
+        candidate_total = 0
+        for section, items in sections.items():
+            section_tokens = count_tokens(bullet_list(items))
+            candidate_total += section_tokens
+            prompt_section_tokens.inc(section_tokens, call_site=self.call_site, section=section)
+        prompt_section_tokens.inc(max(total - candidate_total, 0), call_site=self.call_site, section="template")
+        return prompt
+
+    def _prune(self, template: Callable[[Dict[str, List[str]]], str], sections: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        empty = {section: [] for section in sections}
+        remaining = self.budget - count_tokens(template(empty))
+
+        # 구간별 예산은 원래 후보 토큰 수에 비례해 분배
+        item_tokens = {
+            section: [count_tokens(f"- {item}\n") for item in items]
+            for section, items in sections.items()
+        }
+        section_totals = {section: sum(tokens) or 1 for section, tokens in item_tokens.items()}
+        grand_total = sum(section_totals.values())
+
+        pruned: Dict[str, List[str]] = {}
+        for section, items in sections.items():
+            allowance = max(remaining, 0) * section_totals[section] / grand_total
+            user_input, context = self._queries[section]
+            scores = relevance_scores(items, user_input, context)
+            order = sorted(range(len(items)), key=lambda i: scores[items[i]], reverse=True)
+
+            kept, used = set(), 0
+            for i in order:
+                if used + item_tokens[section][i] > allowance:
+                    continue
+                kept.add(i)
+                used += item_tokens[section][i]
+
+            pruned[section] = [item for i, item in enumerate(items) if i in kept]
+            removed = len(items) - len(pruned[section])
+            if removed:
+                pruned_candidates.inc(removed, call_site=self.call_site, section=section)
+        return pruned
+
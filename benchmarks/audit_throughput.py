@@ -0,0 +1,88 @@
+# 졸업 요건 일괄 점검 처리량 벤치마크 (초당 학생 수)
+#
+# 사용법:
+#   python -m benchmarks.audit_throughput --students 20000 --workers 4
+#
+# 합성 카탈로그/성적표 JSONL을 만들어 학생별 순차 계산(CreditLedger + 필수 과목 집합 비교)과
+# graduation_audit의 묶음 연산(단일 프로세스, 프로세스 풀)을 비교한다.
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from app.curriculum.service.credit_ledger import CreditLedger
+from app.curriculum.service.graduation_audit import build_audit_tables, run_audit
+from app.lecture.lecture_catalog import CatalogSnapshot
+from benchmarks.planner_bench import build_catalog, build_transcript
+
+
+def baseline(snapshot: CatalogSnapshot, input_path: str, output_path: str) -> int:
+    processed = 0
+    with open(input_path, encoding="utf-8") as f, open(output_path, "w", encoding="utf-8") as out:
+        for line in f:
+            record = json.loads(line)
+            ledger = CreditLedger.from_lecture_data(record["transcript"])
+            completed = snapshot.replacement_index.expand(ledger.completed_codes)
+            grade_limit = str(record["grade"])
+            missing = [
+                lecture.name
+                for lecture_type in ("MR", "GR")
+                for lecture in snapshot.by_type.get(lecture_type, ())
+                if lecture.code not in completed and lecture.grade <= grade_limit
+            ]
+            out.write(json.dumps({
+                "student_id": record["student_id"],
+                "remaining": ledger.remaining(),
+                "missing": missing,
+                "graduation_ready": ledger.is_graduation_ready() and not missing,
+            }, ensure_ascii=False) + "\n")
+            processed += 1
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="졸업 요건 일괄 점검 처리량")
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--lectures-per-term", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = build_catalog(args.lectures_per_term, args.seed)
+    replacements = [(f"OLD{i}", lec.code) for i, lec in enumerate(catalog[::10])]
+    snapshot = CatalogSnapshot(1, catalog, {}, replacements)
+    tables = build_audit_tables(snapshot)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "transcripts.jsonl")
+        output_path = os.path.join(tmp, "audit.jsonl")
+        with open(input_path, "w", encoding="utf-8") as f:
+            for student_id in range(args.students):
+                terms_done = rng.randint(1, 8)
+                record = {
+                    "student_id": student_id,
+                    "grade": (terms_done - 1) // 2 + 1,
+                    "transcript": build_transcript(catalog, terms_done, rng),
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        report = {"students": args.students, "workers": args.workers}
+        start = time.perf_counter()
+        baseline(snapshot, input_path, output_path)
+        report["baseline_students_per_sec"] = round(args.students / (time.perf_counter() - start))
+
+        for label, workers in (("batch_single_process", 1), ("batch_process_pool", args.workers)):
+            start = time.perf_counter()
+            processed = run_audit(tables, input_path, output_path, workers, args.chunk_size)
+            assert processed == args.students
+            report[f"{label}_students_per_sec"] = round(args.students / (time.perf_counter() - start))
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# 강의 개요 기반 필터링의 로컬 BM25 사전 필터링 전/후 프롬프트 토큰과 지연 시간 비교
+#
+# 사용법:
+#   python -m benchmarks.description_prefilter --lectures 300 --runs 50
+#
+# GPT 응답은 가짜 클라이언트로 대체하며, GPT 지연 시간은
+# base_ms + prompt_tokens * per_token_ms 로 모델링해 로컬 처리 시간에 더한다.
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import types
+from typing import Dict, List, Tuple
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("GPT_CACHE_ENABLED", "False")
+
+from app.recommendation.service.gpt_service import GPTService  # noqa: E402
+from app.recommendation.service.llm_gateway import LLMGateway  # noqa: E402
+from app.recommendation.service.prompt_builder import count_tokens  # noqa: E402
+
+TOPICS = {
+    "인공지능": ["머신러닝", "딥러닝", "신경망", "인공지능", "강화학습", "컴퓨터비전"],
+    "웹 개발": ["웹", "HTML", "자바스크립트", "서버", "프론트엔드", "REST"],
+    "데이터베이스": ["SQL", "데이터베이스", "트랜잭션", "인덱스", "정규화", "질의"],
+    "보안": ["암호", "보안", "네트워크보안", "해킹", "인증", "취약점"],
+    "임베디드": ["마이크로프로세서", "센서", "펌웨어", "임베디드", "회로", "실시간"],
+}
+FILLER = ["이론", "실습", "프로젝트", "기초", "응용", "설계", "분석", "구현", "개념", "방법론"]
+
+
+def build_catalog(count: int, seed: int) -> List[Tuple[str, str, str]]:
+    rng = random.Random(seed)
+    topics = list(TOPICS)
+    infos = []
+    for i in range(count):
+        topic = topics[i % len(topics)]
+        words = rng.sample(TOPICS[topic], 3) + rng.sample(FILLER, 4)
+        infos.append((f"{topic}{i}", f"{' '.join(words)}을 다루는 강의", f"{rng.choice(FILLER)} 역량 향상"))
+    return infos
+
+
+class FakeCompletions:
+    def __init__(self, base_ms: float, per_token_ms: float):
+        self.base_ms = base_ms
+        self.per_token_ms = per_token_ms
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.modeled_ms = 0.0
+
+    async def create(self, **kwargs):
+        prompt = "".join(message["content"] for message in kwargs["messages"])
+        tokens = count_tokens(prompt)
+        self.calls += 1
+        self.prompt_tokens += tokens
+        self.modeled_ms += self.base_ms + tokens * self.per_token_ms
+        message = types.SimpleNamespace(content="")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+async def run_mode(service: GPTService, fake: FakeCompletions, infos, runs: int, top_k: int, seed: int) -> Dict:
+    service.description_top_k = top_k
+    rng = random.Random(seed)
+    names = [name for name, _, _ in infos]
+    latencies = []
+    tokens = []
+    calls = 0
+    for _ in range(runs):
+        recommended = rng.sample(names, min(len(names), 40))
+        interest = rng.choice(list(TOPICS))
+        fake.reset()
+        start = time.perf_counter()
+        await service.filter_recommended_lectures_by_description(recommended, infos, interest)
+        local_ms = (time.perf_counter() - start) * 1000
+        latencies.append(local_ms + fake.modeled_ms)
+        tokens.append(fake.prompt_tokens)
+        calls += fake.calls
+
+    return {
+        "gpt_calls": calls,
+        "prompt_tokens_mean": round(statistics.mean(tokens), 1),
+        "latency_ms_p50": round(statistics.median(latencies), 2),
+        "latency_ms_mean": round(statistics.mean(latencies), 2),
+    }
+
+
+async def main_async(args) -> Dict:
+    infos = build_catalog(args.lectures, args.seed)
+    fake = FakeCompletions(args.base_ms, args.per_token_ms)
+    service = GPTService(LLMGateway(client=types.SimpleNamespace(chat=types.SimpleNamespace(completions=fake))))
+
+    return {
+        "lectures": args.lectures,
+        "runs": args.runs,
+        "before": await run_mode(service, fake, infos, args.runs, 0, args.seed),
+        "after": await run_mode(service, fake, infos, args.runs, args.top_k, args.seed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강의 개요 사전 필터링 벤치마크")
+    parser.add_argument("--lectures", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--base-ms", type=float, default=600.0)
+    parser.add_argument("--per-token-ms", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main_async(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# 로컬 OpenAI 호환 가짜 서버 (게이트웨이/벤치마크용)
+#
+# 사용법:
+#   python -m benchmarks.fake_openai_server --port 8089 --latency-ms 300 --error-rate 0.1
+#   python -m benchmarks.fake_openai_server --model-latency gpt-4o-mini=80 --model-latency gpt-4-turbo=600
+#   OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=sk-fake uvicorn app.main:app
+#
+# 지연 시간(모델별 지정 가능), 429/500 오류 비율을 설정할 수 있으며, 프롬프트 내용에 따라 각 GPTService
+# 호출 지점이 파싱할 수 있는 형식의 응답을 돌려준다.
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+class FakeOpenAIConfig:
+    def __init__(
+            self,
+            latency_ms: float = 0.0,
+            jitter_ms: float = 0.0,
+            error_rate: float = 0.0,
+            seed: Optional[int] = None,
+            token_interval_ms: float = 20.0,
+            model_latency_ms: Optional[Dict[str, float]] = None
+    ):
+        self.latency_ms = latency_ms
+        self.model_latency_ms = model_latency_ms or {}
+        self.token_interval_ms = token_interval_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    # 모델별 지연 시간이 지정되지 않은 모델은 latency_ms 사용
+    def latency_seconds(self, model: str) -> float:
+        latency_ms = self.model_latency_ms.get(model, self.latency_ms)
+        return max(latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms), 0.0) / 1000
+
+
+# 프롬프트 유형별 응답 생성
+def fake_reply(prompt: str) -> str:
+    if "YES 또는 NO" in prompt or '"YES"' in prompt:
+        return "NO"
+    if '"종료" 또는 "계속"' in prompt:
+        return "계속"
+    if "YES:" in prompt:
+        return "NO: 컴퓨터공학부 학생들이 가장 쉽게 접하는 분야"
+    if '"alternative"' in prompt:
+        return '{"end": false, "alternative": false, "add": [], "remove": []}'
+    if "JSON" in prompt:
+        return '{"add": [], "remove": []}'
+    if "리스트만" in prompt:
+        return "[]"
+    bullets = re.findall(r"^\s*- (.+)$", prompt, flags=re.MULTILINE)
+    return "\n".join(bullets[-3:])
+
+
+def completion_body(model: str, content: str, prompt_tokens: int) -> Dict:
+    completion_tokens = max(len(content) // 2, 1)
+    return {
+        "id": f"chatcmpl-fake-{time.time_ns()}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+# stream=True 요청에 대한 SSE 청크 (첫 청크까지 latency, 이후 청크 간격 token_interval)
+async def stream_chunks(config: FakeOpenAIConfig, model: str, content: str):
+    base = {"id": f"chatcmpl-fake-{time.time_ns()}", "object": "chat.completion.chunk",
+            "created": int(time.time()), "model": model}
+    pieces = [content[i:i + 2] for i in range(0, len(content), 2)] or [""]
+    for i, piece in enumerate(pieces):
+        if i:
+            await asyncio.sleep(config.token_interval_ms / 1000)
+        chunk = dict(base, choices=[{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+    chunk = dict(base, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+    yield f"data: {json.dumps(chunk)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def create_app(config: FakeOpenAIConfig) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI")
+    app.state.config = config
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "gpt-4-turbo")
+        messages: List[Dict] = body.get("messages", [])
+        prompt = "\n".join(message.get("content", "") for message in messages)
+
+        config.requests += 1
+        config.concurrent += 1
+        config.max_concurrent = max(config.max_concurrent, config.concurrent)
+        try:
+            await asyncio.sleep(config.latency_seconds(model))
+            if config.random.random() < config.error_rate:
+                status = config.random.choice([429, 500])
+                return JSONResponse(
+                    {"error": {"message": "fake failure", "type": "server_error", "code": status}},
+                    status_code=status
+                )
+            if body.get("stream"):
+                return StreamingResponse(
+                    stream_chunks(config, model, fake_reply(prompt)), media_type="text/event-stream"
+                )
+            return completion_body(model, fake_reply(prompt), len(prompt) // 2)
+        finally:
+            config.concurrent -= 1
+
+    return app
+
+
+# 현재 이벤트 루프에서 서버를 백그라운드로 실행 (stop_fake_server로 종료)
+async def start_fake_server(config: FakeOpenAIConfig, host: str = "127.0.0.1", port: int = 8089) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(create_app(config), host=host, port=port, log_level="warning", lifespan="off"))
+    server.serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server
+
+
+async def stop_fake_server(server: uvicorn.Server):
+    server.should_exit = True
+    await server.serve_task
+
+
+def parse_model_latency(items: List[str]) -> Dict[str, float]:
+    latency = {}
+    for item in items:
+        model, _, ms = item.partition("=")
+        latency[model] = float(ms)
+    return latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-interval-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=MS",
+                        help="모델별 응답 지연 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    config = FakeOpenAIConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.seed, args.token_interval_ms,
+                              parse_model_latency(args.model_latency))
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# LLM 게이트웨이 부하 확인 (가짜 OpenAI 서버 대상)
+#
+# 사용법:
+#   python -m benchmarks.gateway_load --requests 200 --distinct 20 --concurrency 8 --error-rate 0.1
+#
+# 동시성 제한이 지켜지는지(서버 측 최대 동시 요청 수), 동일 요청 병합 수, 재시도 후 성공률과
+# 지연 시간 분포를 출력한다.
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-fake")
+
+import httpx  # noqa: E402
+from openai import AsyncOpenAI  # noqa: E402
+
+from app.recommendation.service.llm_gateway import (  # noqa: E402
+    LLMGateway, llm_coalesced, llm_requests, llm_retries
+)
+from benchmarks.fake_openai_server import FakeOpenAIConfig, start_fake_server, stop_fake_server  # noqa: E402
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+async def main_async(args) -> dict:
+    config = FakeOpenAIConfig(args.latency_ms, args.jitter_ms, args.error_rate, seed=1)
+    server = await start_fake_server(config, port=args.port)
+
+    client = AsyncOpenAI(
+        api_key="sk-fake",
+        base_url=f"http://127.0.0.1:{args.port}/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(limits=httpx.Limits(max_connections=args.concurrency))
+    )
+    gateway = LLMGateway(
+        client=client,
+        max_concurrency=args.concurrency,
+        timeout_seconds=args.deadline,
+        backoff_base_seconds=0.05,
+        backoff_max_seconds=0.5
+    )
+
+    async def one(i: int):
+        prompt = f"요청 {i % args.distinct}: YES 또는 NO"
+        start = time.perf_counter()
+        try:
+            await gateway.create(
+                coalesce_key=prompt,
+                model="gpt-4-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=3,
+                temperature=0
+            )
+            return time.perf_counter() - start, None
+        except Exception as e:
+            return time.perf_counter() - start, type(e).__name__
+
+    try:
+        results = await asyncio.gather(*(one(i) for i in range(args.requests)))
+    finally:
+        await stop_fake_server(server)
+
+    latencies = [latency * 1000 for latency, error in results if error is None]
+    errors = [error for _, error in results if error is not None]
+    return {
+        "requests": args.requests,
+        "server_requests": config.requests,
+        "server_max_concurrent": config.max_concurrent,
+        "coalesced": llm_coalesced.value(),
+        "retries": sum(llm_retries.value(reason=reason) for reason in ("RateLimitError", "InternalServerError", "APITimeoutError", "APIConnectionError", "TimeoutError")),
+        "succeeded": llm_requests.value(outcome="success"),
+        "failed": len(errors),
+        "latency_ms_p50": round(statistics.median(latencies), 1) if latencies else None,
+        "latency_ms_p95": round(percentile(latencies, 0.95), 1) if latencies else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 게이트웨이 부하 확인")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--distinct", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    parser.add_argument("--deadline", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8089)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# 로컬 의도 분류기와 GPT 응답의 일치율 오프라인 평가
+#
+# 사용법:
+#   python -m benchmarks.intent_agreement --samples benchmarks/data/intent_samples.jsonl
+#   python -m benchmarks.intent_agreement --live --record benchmarks/data/intent_recorded.jsonl
+#   python -m benchmarks.intent_agreement --min-agreement 1.0
+#
+# 각 샘플의 "gpt" 필드에 기록된 GPT 응답과 비교하고, 기록이 없으면 "expected" 정답 라벨과 비교한다.
+# --live 지정 시 기록이 없는 샘플은 로컬 분류기를 끈 GPTService로 직접 질의하며, --record로 GPT 응답을
+# 저장해 다음 평가에 재사용한다. --min-agreement 미달 시 종료 코드 1 (tests/test_intent_agreement.py).
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+from app.recommendation.service.intent_classifier import IntentResult, LocalIntentClassifier
+
+DEFAULT_SAMPLES = "benchmarks/data/intent_samples.jsonl"
+
+
+def load_samples(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def classify_locally(classifier: LocalIntentClassifier, sample: Dict[str, Any]) -> IntentResult:
+    intent = sample["intent"]
+    user_input = sample["input"]
+    if intent == "no_more_modification":
+        return classifier.classify_no_more_modification(user_input)
+    if intent == "curriculum_request":
+        return classifier.classify_curriculum_request(user_input)
+    if intent == "alternative_request":
+        return classifier.classify_alternative_request(user_input, sample.get("deleted_lectures", []))
+    if intent == "conditions":
+        return classifier.classify_conditions(user_input)
+    raise ValueError(f"알 수 없는 intent: {intent}")
+
+
+async def ask_gpt(service, sample: Dict[str, Any]) -> Any:
+    intent = sample["intent"]
+    user_input = sample["input"]
+    if intent == "no_more_modification":
+        return await service.is_no_more_modification(user_input)
+    if intent == "curriculum_request":
+        return await service.is_curriculum_request(user_input)
+    if intent == "alternative_request":
+        return await service.is_requesting_alternative_recommendation(user_input, sample.get("deleted_lectures", []))
+    return await service.parse_conditions_with_gpt(user_input)
+
+
+def same_answer(local: Any, gpt: Any) -> bool:
+    if isinstance(local, list) or isinstance(gpt, list):
+        return set(local or []) == set(gpt or [])
+    return local == gpt
+
+
+async def evaluate(samples: List[Dict[str, Any]], threshold: float, live: bool) -> Dict[str, Any]:
+    classifier = LocalIntentClassifier(threshold)
+    service = None
+    if live:
+        from app.recommendation.service.gpt_service import GPTService
+        service = GPTService()
+        # GPT 기준 응답을 얻기 위해 서비스 내부의 로컬 분류기는 비활성화
+        service.intent_classifier.threshold = float("inf")
+
+    report: Dict[str, Dict[str, Any]] = {}
+    disagreements = []
+    for sample in samples:
+        stats = report.setdefault(sample["intent"], {
+            "samples": 0, "answered_locally": 0, "compared": 0, "agreed": 0
+        })
+        stats["samples"] += 1
+
+        local = classify_locally(classifier, sample)
+        gpt: Optional[Any] = sample.get("gpt")
+        if gpt is None and service is not None:
+            gpt = await ask_gpt(service, sample)
+            sample["gpt"] = gpt
+        # GPT 응답이 없으면 정답 라벨 기준
+        reference = gpt if gpt is not None else sample.get("expected")
+
+        if not classifier.is_confident(local):
+            continue
+        stats["answered_locally"] += 1
+        if reference is None:
+            continue
+        stats["compared"] += 1
+        if same_answer(local.value, reference):
+            stats["agreed"] += 1
+        else:
+            disagreements.append({"intent": sample["intent"], "input": sample["input"],
+                                  "local": local.value, "reference": reference})
+
+    for stats in report.values():
+        stats["coverage"] = round(stats["answered_locally"] / stats["samples"], 3)
+        stats["agreement"] = round(stats["agreed"] / stats["compared"], 3) if stats["compared"] else None
+
+    return {"threshold": threshold, "intents": report, "disagreements": disagreements}
+
+
+# 일치율이 기준 미만이거나 비교한 샘플이 없는 의도 목록
+def below_agreement(result: Dict[str, Any], minimum: float) -> List[str]:
+    return [
+        intent for intent, stats in result["intents"].items()
+        if stats["agreement"] is None or stats["agreement"] < minimum
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 의도 분류기 / GPT 일치율 평가")
+    parser.add_argument("--samples", default=DEFAULT_SAMPLES)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--live", action="store_true", help="기록되지 않은 GPT 응답을 실제 API로 조회")
+    parser.add_argument("--record", help="GPT 응답을 포함한 샘플을 저장할 경로")
+    parser.add_argument("--min-agreement", type=float, help="의도별 일치율이 이 값보다 낮으면 종료 코드 1")
+    args = parser.parse_args()
+
+    samples = load_samples(args.samples)
+    result = asyncio.run(evaluate(samples, args.threshold, args.live))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as f:
+            for sample in samples:
+                f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+
+    if args.min_agreement is not None and below_agreement(result, args.min_agreement):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
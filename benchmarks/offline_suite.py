@@ -0,0 +1,437 @@
+# 오프라인 벤치마크 스위트 (MySQL 대신 aiosqlite, OpenAI 대신 가짜 서버)
+#
+# 사용법:
+#   python -m benchmarks.offline_suite --lectures-per-term 60 --iterations 200 --output .cache/bench/head.json
+#   python -m benchmarks.offline_suite --compare .cache/bench/base.json --fail-threshold 1.2
+#   python -m benchmarks.offline_suite --only GPTService --model-latency gpt-4o-mini=80 --model-latency gpt-4-turbo=600
+#
+# 모델 라우팅 비교는 같은 --model-latency로 LLM_MODEL_TIERS/LLM_MODEL_ROUTES만 바꿔 두 번 실행한다.
+# (예: LLM_MODEL_TIERS="fast=gpt-4-turbo:30,standard=gpt-4-turbo:30,large=gpt-4-turbo:30"이면 라우팅 이전과 같음)
+#
+# 합성 카탈로그로 채운 SQLite DB에 FastAPI app을 lifespan째 띄우고, 가짜 OpenAI 서버(별도 프로세스)를
+# OPENAI_BASE_URL로 연결한 뒤 저장소 메서드, GPTService 호출 경로, HTTP 엔드포인트별
+# p50/p95/p99 지연 시간과 tracemalloc 기준 호출당 메모리 할당량을 JSON으로 기록한다.
+# --compare로 이전 커밋 결과와 p95를 비교한다 (--fail-threshold 초과 시 종료 코드 1).
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+TOPIC_WORDS = ["머신러닝", "딥러닝", "웹", "서버", "SQL", "트랜잭션", "암호", "네트워크", "센서", "펌웨어",
+               "알고리즘", "자료구조", "그래프", "컴파일러", "운영체제", "클라우드"]
+
+
+class Case(NamedTuple):
+    name: str
+    group: str
+    run: Callable[[int], Awaitable[Any]]
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# 가짜 OpenAI 서버를 별도 프로세스로 실행 (같은 이벤트 루프에서 돌면 지연/할당 측정에 섞임)
+def start_fake_openai(
+        port: int,
+        latency_ms: float,
+        token_interval_ms: float,
+        model_latency: List[str] = ()
+) -> subprocess.Popen:
+    process = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.fake_openai_server", "--port", str(port),
+        "--latency-ms", str(latency_ms), "--token-interval-ms", str(token_interval_ms), "--seed", "1",
+        *(f"--model-latency={item}" for item in model_latency)
+    ])
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("가짜 OpenAI 서버가 시작되지 않았습니다.")
+
+
+# 앱 모듈이 설정을 읽기 전에 DB/OpenAI 환경 변수 지정 (app을 가져오는 모듈은 이후에 import)
+def configure_environment(db_path: str, openai_port: int):
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{openai_port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    # 응답 캐시를 켜면 두 번째 반복부터 캐시 적중만 측정됨
+    os.environ["GPT_CACHE_ENABLED"] = "False"
+
+
+async def seed(session_factory, args) -> Dict[str, Any]:
+    from sqlalchemy import insert
+
+    from app.chat.chat_models import ChatLog, ChatSession
+    from app.curriculum.curriculum_models import CurriLecture, Curriculum
+    from app.lecture.lecture_models import LectureCode, LectureReplacement, Lectures, RecentLecture
+    from app.professor.professor_models import Professor
+    from benchmarks.planner_bench import build_catalog
+
+    rng = random.Random(args.seed)
+    catalog = build_catalog(args.lectures_per_term, args.seed)
+    professors = max(len(catalog) // 6, 1)
+
+    async with session_factory() as db:
+        await db.execute(insert(LectureCode), [
+            {"code": lec.code, "name": lec.name,
+             "lecture_description": " ".join(rng.sample(TOPIC_WORDS, 4)) + f" {lec.name} 개요",
+             "lecture_objectives": " ".join(rng.sample(TOPIC_WORDS, 2))}
+            for lec in catalog
+        ])
+        await db.execute(insert(RecentLecture), [
+            {"code": lec.code, "name": lec.name, "credits": lec.credits, "type": lec.type, "grade": lec.grade,
+             "semester": lec.semester, "major": lec.major, "team_project": lec.team_project}
+            for lec in catalog
+        ])
+        await db.execute(insert(LectureReplacement), [
+            {"original_code": f"OLD{i}", "replacement_code": lec.code} for i, lec in enumerate(catalog[::10])
+        ])
+        await db.execute(insert(Professor), [
+            {"id": i + 1, "name": f"교수{i + 1}", "department": "컴퓨터공학부"} for i in range(professors)
+        ])
+        await db.execute(insert(Lectures), [
+            {"code": lec.code, "name": lec.name, "professor_id": i % professors + 1, "credits": lec.credits,
+             "type": lec.type, "grade": lec.grade, "semester": lec.semester, "year": year}
+            for year in ("2024", "2025") for i, lec in enumerate(catalog)
+        ])
+        await db.commit()
+
+        code_ids = {code: i + 1 for i, code in enumerate(lec.code for lec in catalog)}
+        await db.execute(insert(Curriculum), [
+            {"id": user * 3 + n + 1, "user_id": user + 1, "name": f"커리큘럼 {n + 1}", "total_credits": 60,
+             "description": ""}
+            for user in range(args.users) for n in range(3)
+        ])
+        await db.execute(insert(CurriLecture), [
+            {"curri_id": curri_id, "lect_id": code_ids[lec.code], "name": lec.name, "credits": lec.credits,
+             "type": lec.type, "grade": lec.grade, "semester": lec.semester}
+            for curri_id in range(1, args.users * 3 + 1) for lec in rng.sample(catalog, 20)
+        ])
+
+        base = datetime(2026, 1, 1)
+        sessions = max(args.chat_logs // 20, 1)
+        await db.execute(insert(ChatSession), [
+            {"id": i + 1, "user_id": i % args.users + 1, "session_type": "recommendation",
+             "started_at": base + timedelta(minutes=i)}
+            for i in range(sessions)
+        ])
+        for start in range(0, args.chat_logs, 5000):
+            await db.execute(insert(ChatLog), [
+                {"session_id": i % sessions + 1, "chat_type": "UB"[i % 2], "message": f"메시지 {i}",
+                 "timestamp": base + timedelta(seconds=i)}
+                for i in range(start, min(start + 5000, args.chat_logs))
+            ])
+        await db.commit()
+
+    return {"catalog": catalog, "professors": professors, "sessions": sessions, "users": args.users}
+
+
+def build_cases(session_factory, client, data: Dict[str, Any]) -> List[Case]:
+    from app.chat.chat_repository import ChatCrud
+    from app.curriculum.curriculum_repository import CurriculumCrud, CurriculumDraft
+    from app.curriculum.service.curriculum_manager import CurriculumService
+    from app.lecture.lecture_catalog import lecture_catalog
+    from app.lecture.lecture_repository import LectureCrud
+    from app.professor.professor_repository import ProfessorCrud
+    from app.recommendation.service.gpt_service import GPTService
+    from benchmarks.planner_bench import build_transcript
+
+    catalog = data["catalog"]
+    names = [lec.name for lec in catalog]
+    codes = [lec.code for lec in catalog]
+    rng = random.Random(7)
+    transcript = build_transcript(catalog, 4, rng)
+    professor_ids = list(range(1, min(data["professors"], 5) + 1))
+    lecture_infos = list(lecture_catalog.snapshot.lecture_texts)
+    gpt = GPTService()
+
+    def repository(call: Callable[[Any, int], Awaitable[Any]]) -> Callable[[int], Awaitable[Any]]:
+        async def run(i: int):
+            async with session_factory() as db:
+                return await call(db, i)
+        return run
+
+    async def drain(events):
+        return [event async for event in events]
+
+    def user(i: int) -> int:
+        return i % data["users"] + 1
+
+    # 로컬 분류기가 모두 판단을 보류하는 수정 단계 입력 (삭제한 강의 언급, 종료/대체 표현 없음)
+    def turn_input(i: int) -> str:
+        return f"{names[0]} 음 {names[i % 20 + 6]} 어때요"
+
+    # analyze_turn 이전 방식: 종료, 대체 추천, 추가/삭제 판단을 순서대로 호출
+    async def sequential_turn(i: int):
+        text = turn_input(i)
+        if await gpt.is_no_more_modification(text):
+            return
+        if await gpt.is_requesting_alternative_recommendation(text, names[:1]):
+            return
+        return await gpt.parse_add_remove_lectures(text, names[1:6], names, names[:1])
+
+    cases = [
+        Case("LectureCrud.get_lecture_by_name", "repository",
+             repository(lambda db, i: LectureCrud(db).get_lecture_by_name(names[i % len(names)]))),
+        Case("LectureCrud.get_lecture_names", "repository", repository(lambda db, i: LectureCrud(db).get_lecture_names())),
+        Case("LectureCrud.get_all_completed_codes_with_replacement", "repository",
+             repository(lambda db, i: LectureCrud(db).get_all_completed_codes_with_replacement(set(codes[:40])))),
+        Case("LectureCrud.get_uncompleted_required_lectures", "repository",
+             repository(lambda db, i: LectureCrud(db).get_uncompleted_required_lectures(set(codes[:40]), 3))),
+        Case("CurriculumCrud.get_curriculum_names_by_user", "repository",
+             repository(lambda db, i: CurriculumCrud(db).get_curriculum_names_by_user(user(i)))),
+        Case("CurriculumCrud.get_curri_lectures", "repository",
+             repository(lambda db, i: CurriculumCrud(db).get_curri_lectures(i % (data["users"] * 3) + 1))),
+        Case("CurriculumCrud.save_curricula", "repository",
+             repository(lambda db, i: CurriculumCrud(db).save_curricula(
+                 [CurriculumDraft(user(i), f"벤치마크 {i}", 60, catalog[i % 50:i % 50 + 20])]))),
+        Case("CurriculumCrud.delete_curriculum_by_name", "repository",
+             repository(lambda db, i: CurriculumCrud(db).delete_curriculum_by_name(user(i), f"벤치마크 {i}"))),
+        Case("ProfessorCrud.get_lectures_by_professor_ids", "repository",
+             repository(lambda db, i: ProfessorCrud(db).get_lectures_by_professor_ids(professor_ids, "2025", "1"))),
+        Case("ProfessorCrud.get_professor_by_name", "repository",
+             repository(lambda db, i: ProfessorCrud(db).get_professor_by_name(f"교수{i % data['professors'] + 1}"))),
+        Case("ChatCrud.get_chat_session_by_id", "repository",
+             repository(lambda db, i: ChatCrud(db).get_chat_session_by_id(i % data["sessions"] + 1))),
+        Case("ChatCrud.get_chat_logs_page", "repository",
+             repository(lambda db, i: ChatCrud(db).get_chat_logs_page(i % data["sessions"] + 1, 0, 50))),
+        Case("ChatCrud.get_chat_logs_after", "repository",
+             repository(lambda db, i: ChatCrud(db).get_chat_logs_after(i % data["sessions"] + 1, 0, 200))),
+        Case("ChatCrud.save_chat_log", "repository",
+             repository(lambda db, i: ChatCrud(db).save_chat_log(i % data["sessions"] + 1, "U", f"벤치마크 {i}"))),
+        Case("CurriculumService.plan_curriculum", "service",
+             repository(lambda db, i: CurriculumService(db).plan_curriculum(
+                 3, 1, ["graduation", "no_team_project"], transcript))),
+
+        Case("GPTService.filter_recommended_lectures_by_description", "gpt",
+             lambda i: gpt.filter_recommended_lectures_by_description(names[i % 40:i % 40 + 12], lecture_infos, "서버 개발")),
+        Case("GPTService.find_similar_lecture_by_gpt", "gpt",
+             lambda i: gpt.find_similar_lecture_by_gpt("데이터 다루는 수업 비슷한 거", names)),
+        Case("GPTService.parse_add_remove_lectures", "gpt",
+             lambda i: gpt.parse_add_remove_lectures(f"{names[i % 20]} 추가하고 {names[0]} 빼줘", names[:5], names)),
+        Case("GPTService.is_requesting_alternative_recommendation", "gpt",
+             lambda i: gpt.is_requesting_alternative_recommendation("음 이건 좀 그렇네요", names[:3])),
+        Case("GPTService.suggest_other_similar_lectures", "gpt",
+             lambda i: gpt.suggest_other_similar_lectures("다른 강의 추천해줘", names[:3], ["인공지능"], names)),
+        Case("GPTService.stream_other_similar_lectures", "gpt",
+             lambda i: drain(gpt.stream_other_similar_lectures("다른 강의 추천해줘", names[:3], ["인공지능"], names))),
+        Case("GPTService.analyze_turn", "gpt",
+             lambda i: gpt.analyze_turn(turn_input(i), names[1:6], names, names[:1])),
+        Case("GPTService.analyze_turn (sequential baseline)", "gpt", lambda i: sequential_turn(i)),
+        Case("GPTService.resolve_unclear_interest", "gpt", lambda i: gpt.resolve_unclear_interest("잘 모르겠어요")),
+        Case("GPTService.is_no_more_modification", "gpt", lambda i: gpt.is_no_more_modification("흠 글쎄요")),
+        Case("GPTService.parse_conditions_with_gpt", "gpt",
+             lambda i: gpt.parse_conditions_with_gpt("졸업도 해야 하고 팀플은 싫어요")),
+        Case("GPTService.is_curriculum_request", "gpt", lambda i: gpt.is_curriculum_request("이번 학기 뭐 듣지")),
+
+        Case("GET /health", "http", lambda i: client.get("/health")),
+        Case("GET /chat/logs", "http", lambda i: client.get("/chat/logs", params={"limit": 100})),
+        Case("POST /chat/recommendations/stream", "http",
+             lambda i: client.post("/chat/recommendations/stream", json={"user_input": "인공지능 강의 추천해줘"})),
+    ]
+    return cases
+
+
+# 지연 시간 측정 후 tracemalloc으로 호출당 최대/잔류 할당량 측정 (추적 비용이 지연 시간에 섞이지 않도록 분리)
+async def measure(case: Case, iterations: int, warmup: int, alloc_iterations: int) -> Dict[str, Any]:
+    for i in range(warmup):
+        await case.run(i)
+
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await case.run(warmup + i)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for i in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await case.run(warmup + iterations + i)
+            after, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(after - before)
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(latencies)
+    return {
+        "group": case.group,
+        "iterations": iterations,
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "alloc_peak_kib": round(sorted(peaks)[len(peaks) // 2] / 1024, 1) if peaks else None,
+        "alloc_retained_kib": round(sorted(retained)[len(retained) // 2] / 1024, 1) if retained else None,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# 설정된 DATABASE_URL에 스키마 생성 후 합성 데이터 적재
+async def prepare_database(args) -> Tuple[Any, Dict[str, Any]]:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    import app.chat.chat_models  # noqa: F401
+    import app.curriculum.curriculum_models  # noqa: F401
+    import app.lecture.lecture_models  # noqa: F401
+    import app.professor.professor_models  # noqa: F401
+    from app.database.base import Base
+    from app.database.connection import async_engine
+
+    # 모든 모델을 등록한 뒤 스키마 생성
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    return session_factory, await seed(session_factory, args)
+
+
+async def run_suite(args) -> Dict[str, Any]:
+    from app.core.readiness import startup_state
+    from app.database.connection import close_db
+    from app.main import app
+
+    # 실패해도 풀 연결을 정리해야 aiosqlite 연결 스레드가 남아 프로세스가 끝나지 않는 일이 없음
+    try:
+        return await _run_suite(args, app, startup_state)
+    finally:
+        await close_db()
+
+
+async def _run_suite(args, app, startup_state) -> Dict[str, Any]:
+    import httpx
+
+    from app.core.config import settings
+
+    session_factory, data = await prepare_database(args)
+
+    results = {}
+    # lifespan까지 실행해 카탈로그 적재, 채팅 로그 저장기 시작 등 실제 기동 경로를 그대로 사용
+    # (카탈로그/LLM 클라이언트 준비는 백그라운드에서 진행되므로 준비 완료 후 측정)
+    async with app.router.lifespan_context(app):
+        while not startup_state.ready:
+            if startup_state.errors:
+                raise RuntimeError(f"기동 준비 실패: {startup_state.errors}")
+            await asyncio.sleep(0.01)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for case in build_cases(session_factory, client, data):
+                if args.only and not any(pattern in case.name for pattern in args.only):
+                    continue
+                iterations = args.gpt_iterations if case.group == "gpt" else args.iterations
+                # 실패한 항목은 오류만 기록하고 나머지 측정은 계속
+                try:
+                    results[case.name] = await measure(case, iterations, args.warmup, args.alloc_iterations)
+                except Exception as e:
+                    results[case.name] = {"group": case.group, "error": f"{type(e).__name__}: {e}"}
+                    print(f"{case.name}: 실패 ({results[case.name]['error']})", file=sys.stderr)
+                    continue
+                print(f"{case.name}: p50 {results[case.name]['p50_ms']}ms, p95 {results[case.name]['p95_ms']}ms",
+                      file=sys.stderr)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+            "catalog_lectures": len(data["catalog"]),
+            "model_tiers": settings.LLM_MODEL_TIERS,
+            "model_routes": settings.LLM_MODEL_ROUTES,
+        },
+        "results": results,
+    }
+
+
+# 기준 결과 대비 p95 비율 출력, threshold 초과 항목 수 반환
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: Optional[float]) -> int:
+    regressions = 0
+    print(f"기준 {baseline['meta'].get('commit')} -> 현재 {current['meta'].get('commit')}", file=sys.stderr)
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None or not before.get("p95_ms") or "p95_ms" not in result:
+            continue
+        ratio = result["p95_ms"] / before["p95_ms"]
+        flag = threshold is not None and ratio > threshold
+        regressions += flag
+        print(f"{'REGRESSION' if flag else 'ok':>10}  {name}: p95 {before['p95_ms']} -> {result['p95_ms']}ms "
+              f"(x{ratio:.2f})", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 스위트")
+    parser.add_argument("--lectures-per-term", type=int, default=60, help="학년/학기별 합성 강의 수 (전체는 x8)")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--chat-logs", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--gpt-iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--alloc-iterations", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="가짜 OpenAI 서버 응답 지연")
+    parser.add_argument("--token-interval-ms", type=float, default=5.0, help="가짜 OpenAI 스트리밍 청크 간격")
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=MS",
+                        help="가짜 OpenAI 서버의 모델별 응답 지연 (여러 번 지정 가능)")
+    parser.add_argument("--only", nargs="*", help="이름에 해당 문자열이 포함된 항목만 실행")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값은 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--fail-threshold", type=float, help="p95 비율이 이 값을 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    port = free_port()
+    fake_openai = start_fake_openai(port, args.latency_ms, args.token_interval_ms, args.model_latency)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_environment(os.path.join(tmp, "bench.db"), port)
+            report = asyncio.run(run_suite(args))
+    finally:
+        fake_openai.terminate()
+        fake_openai.wait()
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        sys.exit(1 if compare(baseline, report, args.fail_threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
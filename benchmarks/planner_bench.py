@@ -0,0 +1,112 @@
+# 로컬 커리큘럼 플래너 벤치마크 (합성 강의 카탈로그/성적표)
+#
+# 사용법:
+#   python -m benchmarks.planner_bench --transcripts 500 --lectures-per-term 30
+#
+# 학기 수가 다른 합성 성적표마다 계획 생성 시간과 졸업 요건 충족 비율을 출력한다.
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from app.core import constants
+from app.curriculum.service.curriculum_manager import CurriculumService
+from app.curriculum.service.curriculum_planner import CurriculumPlanner
+from app.lecture.lecture_record import LectureRecord
+from app.lecture.replacement_index import ReplacementIndex
+
+CONDITIONS = ["graduation", "no_team_project", "preferred_professor", "retake"]
+SCORES = ["A+", "A0", "B+", "B0", "C+", "C0", "D+", "F"]
+
+
+def build_catalog(lectures_per_term: int, seed: int) -> List[LectureRecord]:
+    rng = random.Random(seed)
+    lectures = []
+    for grade in range(1, 5):
+        for semester in (1, 2):
+            for i in range(lectures_per_term):
+                if i < 3:
+                    lecture_type = "MR"
+                elif i < 5 and grade <= 2:
+                    lecture_type = "GR"
+                elif i % 2:
+                    lecture_type = "ME"
+                else:
+                    lecture_type = "GE"
+                name = f"현장실습{grade}{semester}" if (grade >= 3 and i == lectures_per_term - 1) else f"강의{grade}{semester}{i}"
+                lectures.append(LectureRecord(
+                    code=f"S{grade}{semester}{i:03d}",
+                    name=name,
+                    credits=rng.choice((2, 3, 3, 3)),
+                    type=lecture_type,
+                    grade=str(grade),
+                    semester=str(semester),
+                    major="컴퓨터공학부",
+                    team_project=rng.choice(("Y", "N", "N")),
+                ))
+    return lectures
+
+
+def build_transcript(catalog: List[LectureRecord], terms_done: int, rng: random.Random) -> Dict:
+    transcript = {}
+    for term in range(terms_done):
+        grade, semester = term // 2 + 1, term % 2 + 1
+        offered = [lec for lec in catalog if lec.grade == str(grade) and lec.semester == str(semester)]
+        taken = [lec for lec in offered if lec.type in ("MR", "GR")]
+        taken += rng.sample([lec for lec in offered if lec.type not in ("MR", "GR")], 4)
+        by_type: Dict[str, list] = {}
+        for lec in taken:
+            by_type.setdefault(lec.type, []).append((lec.code, lec.name, lec.credits, rng.choice(SCORES)))
+        transcript[f"{grade}학년 {semester}학기"] = by_type
+    return transcript
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커리큘럼 플래너 벤치마크")
+    parser.add_argument("--transcripts", type=int, default=500)
+    parser.add_argument("--lectures-per-term", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = build_catalog(args.lectures_per_term, args.seed)
+    replacements = [(f"OLD{i}", lec.code) for i, lec in enumerate(catalog[::10])]
+    planner = CurriculumPlanner(catalog, ReplacementIndex(replacements))
+    service = CurriculumService(None)
+    preferred_codes = {lec.code for lec in rng.sample(catalog, len(catalog) // 10)}
+
+    latencies = []
+    satisfied = 0
+    for _ in range(args.transcripts):
+        terms_done = rng.randint(0, 6)
+        transcript = build_transcript(catalog, terms_done, rng)
+        conditions = [condition for condition in CONDITIONS if rng.random() < 0.5]
+
+        start = time.perf_counter()
+        plan = planner.plan(
+            service.calculate_credits(transcript),
+            terms_done // 2 + 1,
+            terms_done % 2 + 1,
+            conditions,
+            preferred_codes=preferred_codes,
+            retake_codes=service.get_retake_codes(transcript)
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        satisfied += plan.satisfied
+        assert all(semester.credits <= constants.max_semester_credits for semester in plan.semesters)
+
+    ordered = sorted(latencies)
+    print(json.dumps({
+        "transcripts": args.transcripts,
+        "catalog_lectures": len(catalog),
+        "satisfied_ratio": round(satisfied / args.transcripts, 3),
+        "plan_ms_p50": round(statistics.median(latencies), 3),
+        "plan_ms_p95": round(ordered[int(len(ordered) * 0.95)], 3),
+        "plan_ms_max": round(ordered[-1], 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# 저장소 쿼리 실행 계획 회귀 점검 (전체 테이블 스캔이 생기면 실패)
+#
+# 사용법:
+#   alembic upgrade head && python -m benchmarks.query_plans
+#   python -m benchmarks.query_plans --url sqlite+aiosqlite:///.cache/plans.db --create-schema
+#   python -m pytest tests/test_query_plans.py   (SQLite 기준 점검, 테스트 실행 시 항상 수행)
+#
+# 각 저장소 메서드를 실제로 호출해 실행된 SELECT/UPDATE/DELETE 문을 수집하고,
+# 같은 문장과 파라미터로 EXPLAIN(MySQL) / EXPLAIN QUERY PLAN(SQLite)을 실행한다.
+# 카탈로그 전체 적재처럼 의도적으로 전체를 읽는 쿼리는 허용 테이블로 지정한다.
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime
+from typing import Awaitable, Callable, List, NamedTuple, Tuple
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-query-plans")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.chat.chat_repository import ChatCrud  # noqa: E402
+from app.curriculum.curriculum_repository import CurriculumCrud, CurriculumDraft  # noqa: E402
+from app.curriculum.service.curriculum_manager import CurriculumService  # noqa: E402
+from app.database.base import Base  # noqa: E402
+from app.lecture.lecture_catalog import lecture_catalog  # noqa: E402
+from app.professor.professor_repository import ProfessorCrud  # noqa: E402
+
+CATALOG_TABLES = frozenset({"recent_lectures", "lecture_code", "lecture_replacement", "professors", "lectures"})
+
+
+async def _drain(chunks):
+    async for _ in chunks:
+        pass
+
+
+class Scenario(NamedTuple):
+    name: str
+    run: Callable[[AsyncSession], Awaitable]
+    allow_full_scan: frozenset = frozenset()
+
+
+SCENARIOS = [
+    Scenario("lecture_catalog.refresh", lambda db: lecture_catalog.refresh(db), CATALOG_TABLES),
+    Scenario("CurriculumCrud.get_curriculum_names_by_user",
+             lambda db: CurriculumCrud(db).get_curriculum_names_by_user(1)),
+    Scenario("CurriculumCrud.get_curriculum_id_by_name",
+             lambda db: CurriculumCrud(db).get_curriculum_id_by_name(1, "커리큘럼 1")),
+    Scenario("CurriculumCrud.get_curriculum_by_id", lambda db: CurriculumCrud(db).get_curriculum_by_id(1)),
+    Scenario("CurriculumCrud.get_curri_lectures", lambda db: CurriculumCrud(db).get_curri_lectures(1)),
+    Scenario("CurriculumCrud.save_curricula",
+             lambda db: CurriculumCrud(db).save_curricula([CurriculumDraft(1, "점검용 커리큘럼", 0, [])])),
+    Scenario("CurriculumCrud.delete_curriculum_by_name",
+             lambda db: CurriculumCrud(db).delete_curriculum_by_name(1, "점검용 커리큘럼")),
+    Scenario("ChatCrud.get_chat_session_by_id", lambda db: ChatCrud(db).get_chat_session_by_id(1)),
+    Scenario("ChatCrud.end_chat_session", lambda db: ChatCrud(db).end_chat_session(1)),
+    Scenario("ChatCrud.get_chat_logs_page", lambda db: ChatCrud(db).get_chat_logs_page(1, 10, 51)),
+    Scenario("ChatCrud.get_chat_logs_after", lambda db: ChatCrud(db).get_chat_logs_after(1, 10, 51)),
+    Scenario("ChatCrud.stream_chat_logs", lambda db: _drain(ChatCrud(db).stream_chat_logs(
+        datetime(2026, 1, 1), datetime(2026, 2, 1)))),
+    Scenario("ProfessorCrud.get_lectures_by_professor_ids",
+             lambda db: ProfessorCrud(db).get_lectures_by_professor_ids([1, 2, 3])),
+    Scenario("ProfessorCrud.get_professor_by_name", lambda db: ProfessorCrud(db).get_professor_by_name("이상호")),
+    Scenario("CurriculumService.get_preferred_professor_codes",
+             lambda db: CurriculumService(db).get_preferred_professor_codes()),
+]
+
+
+# 시나리오 실행 중 나간 SQL 수집 (INSERT는 제외)
+async def capture(engine: AsyncEngine, scenario: Scenario) -> List[Tuple[str, tuple]]:
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(None, 1)[0].upper() in ("SELECT", "UPDATE", "DELETE") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+            await scenario.run(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+    return statements
+
+
+# 전체 스캔하는 테이블 목록
+async def full_scans(engine: AsyncEngine, statement: str, parameters) -> List[str]:
+    async with engine.connect() as conn:
+        if engine.dialect.name == "mysql":
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            return [row.table for row in result if row.type == "ALL" and row.table]
+
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        scans = []
+        for row in result:
+            detail = row[-1]
+            # "SCAN CONSTANT ROW"는 IN (VALUES ...) 상수 목록
+            if detail.startswith("SCAN ") and "USING" not in detail and "CONSTANT ROW" not in detail:
+                scans.append(detail.split()[1])
+        return scans
+
+
+# 시나리오별 (시나리오명, SQL, 허용되지 않은 전체 스캔 테이블 목록)
+async def check_plans(engine: AsyncEngine) -> List[Tuple[str, str, List[str]]]:
+    checked = []
+    for scenario in SCENARIOS:
+        for statement, parameters in await capture(engine, scenario):
+            scans = [table for table in await full_scans(engine, statement, parameters)
+                     if table not in scenario.allow_full_scan]
+            checked.append((scenario.name, " ".join(statement.split()), scans))
+    return checked
+
+
+async def main_async(args) -> int:
+    url = args.url
+    if not url:
+        from app.core.config import settings
+        url = settings.database_url
+    engine = create_async_engine(url)
+
+    if args.create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    regressions = 0
+    for name, statement, scans in await check_plans(engine):
+        status = "FULL SCAN " + ", ".join(scans) if scans else "ok"
+        regressions += bool(scans)
+        print(f"[{status}] {name}: {statement[:120]}")
+
+    await engine.dispose()
+    print(f"\n전체 스캔 회귀 {regressions}건")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장소 쿼리 실행 계획 회귀 점검")
+    parser.add_argument("--url", help="기본값은 애플리케이션 DB 설정")
+    parser.add_argument("--create-schema", action="store_true", help="모델 기준으로 테이블 생성 (로컬 SQLite 용)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# 기동 시간 벤치마크 (app.main import 시간, 요청 수신까지, 준비 완료까지, 첫 요청 지연 시간)
+#
+# 사용법:
+#   python -m benchmarks.startup_bench --runs 5 --output .cache/bench/startup.json
+#
+# import 시간은 새 프로세스에서 `import app.main`만 반복 측정한다. 기동 시간은 offline_suite와 같은
+# 합성 SQLite DB와 가짜 OpenAI 서버로 uvicorn을 띄워, 프로세스 시작부터 /health 응답(요청 수신)과
+# /ready 200(준비 완료)까지의 시간을 잰다. 첫 요청은 두 방식으로 측정한다.
+#   cold: /health가 응답하자마자 요청 (준비 완료를 기다리지 않는 경우)
+#   warm: /ready가 200이 된 뒤 요청
+# /ready가 없는 이전 버전은 /health 응답 시점을 준비 완료로 간주한다.
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.offline_suite import configure_environment, free_port, prepare_database, start_fake_openai
+
+FIRST_REQUESTS = [
+    ("GET", "/chat/sessions/1/logs", None),
+    ("POST", "/chat/recommendations/stream", {"user_input": "인공지능 강의 추천해줘"}),
+]
+
+
+# 합성 DB 적재 후 이 프로세스의 풀 연결 정리 (aiosqlite 연결 스레드가 남으면 종료되지 않음)
+async def seed_database(args) -> Dict:
+    from app.database.connection import close_db
+
+    _, data = await prepare_database(args)
+    await close_db()
+    return data
+
+
+def measure_import(runs: int) -> Dict:
+    code = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    samples = [
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout) * 1000
+        for _ in range(runs)
+    ]
+    return {"median_ms": round(statistics.median(samples), 1), "min_ms": round(min(samples), 1)}
+
+
+# -X importtime 기준 누적 import 시간 상위 모듈
+def top_imports(limit: int) -> List[Dict]:
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app.main"],
+                            capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append({"module": parts[2].strip(), "cumulative_ms": round(int(parts[1]) / 1000, 1)})
+    return sorted(rows, key=lambda row: row["cumulative_ms"], reverse=True)[:limit]
+
+
+def wait_for(client: httpx.Client, path: str, timeout: float) -> Optional[int]:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            status = client.get(path).status_code
+            if status != 503:
+                return status
+        except httpx.TransportError:
+            pass
+        time.sleep(0.005)
+    return None
+
+
+def request_ms(client: httpx.Client, method: str, path: str, body) -> float:
+    start = time.perf_counter()
+    response = client.request(method, path, json=body)
+    response.read()
+    response.raise_for_status()
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+# uvicorn 프로세스 한 번 기동 후 측정 (wait_ready=False면 요청 수신 직후 첫 요청)
+def measure_startup(port: int, wait_ready: bool, timeout: float) -> Dict:
+    start = time.monotonic()
+    process = subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                                "--log-level", "warning"])
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            if wait_for(client, "/health", timeout) is None:
+                raise RuntimeError("서버가 시작되지 않았습니다.")
+            result = {"listening_ms": round((time.monotonic() - start) * 1000, 1)}
+            if wait_ready:
+                status = wait_for(client, "/ready", timeout)
+                if status not in (200, 404):
+                    raise RuntimeError(f"/ready 실패 ({status})")
+                result["ready_ms"] = round((time.monotonic() - start) * 1000, 1)
+
+            for method, path, body in FIRST_REQUESTS:
+                result[f"{method} {path}"] = {
+                    "first_ms": request_ms(client, method, path, body),
+                    "second_ms": request_ms(client, method, path, body),
+                }
+            return result
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기동 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--lectures-per-term", type=int, default=60)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--chat-logs", type=int, default=20000)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--token-interval-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값은 표준 출력)")
+    args = parser.parse_args()
+
+    openai_port = free_port()
+    fake_openai = start_fake_openai(openai_port, args.latency_ms, args.token_interval_ms)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_environment(os.path.join(tmp, "bench.db"), openai_port)
+            report = {"import": measure_import(args.runs), "top_imports": top_imports(10)}
+            data = asyncio.run(seed_database(args))
+            report["catalog_lectures"] = len(data["catalog"])
+            report["cold"] = [measure_startup(free_port(), False, args.timeout) for _ in range(args.runs)]
+            report["warm"] = [measure_startup(free_port(), True, args.timeout) for _ in range(args.runs)]
+    finally:
+        fake_openai.terminate()
+        fake_openai.wait()
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""add lookup indexes and numeric grade column
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_recent_lectures_name", "recent_lectures", ["name"]),
+    ("ix_recent_lectures_type_grade_num", "recent_lectures", ["type", "grade_num"]),
+    ("ix_lecture_replacement_original_code", "lecture_replacement", ["original_code"]),
+    ("ix_lecture_replacement_replacement_code", "lecture_replacement", ["replacement_code"]),
+    ("ix_curriculums_user_id_name", "curriculums", ["user_id", "name"]),
+    ("ix_curri_lectures_curri_id", "curri_lectures", ["curri_id"]),
+    ("ix_chat_logs_session_id", "chat_logs", ["session_id"]),
+    ("ix_lectures_professor_id", "lectures", ["professor_id"]),
+    ("ix_professors_name", "professors", ["name"]),
+]
+
+
+def upgrade() -> None:
+    op.add_column("recent_lectures", sa.Column("grade_num", sa.SmallInteger(), nullable=True))
+
+    # 숫자로 된 grade만 채움 (그 외는 NULL, MySQL 외에는 로컬 점검용 SQLite 기준)
+    if op.get_bind().dialect.name == "mysql":
+        op.execute(
+            "UPDATE recent_lectures SET grade_num = CAST(TRIM(grade) AS UNSIGNED) "
+            "WHERE TRIM(grade) REGEXP '^[0-9]+$'"
+        )
+    else:
+        op.execute(
+            "UPDATE recent_lectures SET grade_num = CAST(TRIM(grade) AS INTEGER) "
+            "WHERE TRIM(grade) <> '' AND TRIM(grade) NOT GLOB '*[^0-9]*'"
+        )
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+
+    op.drop_column("recent_lectures", "grade_num")
@@ -0,0 +1,26 @@
+"""add chat session state snapshot
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("chat_sessions", sa.Column("state_snapshot", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("chat_sessions", "state_snapshot")
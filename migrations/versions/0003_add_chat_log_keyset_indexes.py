@@ -0,0 +1,30 @@
+"""add chat log keyset and timestamp indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (session_id, id)가 기존 session_id 단일 인덱스를 대체
+    op.create_index("ix_chat_logs_session_id_id", "chat_logs", ["session_id", "id"])
+    op.create_index("ix_chat_logs_timestamp", "chat_logs", ["timestamp"])
+    op.drop_index("ix_chat_logs_session_id", table_name="chat_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_chat_logs_session_id", "chat_logs", ["session_id"])
+    op.drop_index("ix_chat_logs_timestamp", table_name="chat_logs")
+    op.drop_index("ix_chat_logs_session_id_id", table_name="chat_logs")
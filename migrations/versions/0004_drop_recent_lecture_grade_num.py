@@ -0,0 +1,39 @@
+"""drop unused recent_lectures.grade_num
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 필수 과목은 메모리 카탈로그에서 학년별로 조회하므로 (type, grade_num) 조회 경로가 더 이상 없음
+def upgrade() -> None:
+    op.drop_index("ix_recent_lectures_type_grade_num", table_name="recent_lectures")
+    op.drop_column("recent_lectures", "grade_num")
+
+
+def downgrade() -> None:
+    op.add_column("recent_lectures", sa.Column("grade_num", sa.SmallInteger(), nullable=True))
+    if op.get_bind().dialect.name == "mysql":
+        op.execute(
+            "UPDATE recent_lectures SET grade_num = CAST(TRIM(grade) AS UNSIGNED) "
+            "WHERE TRIM(grade) REGEXP '^[0-9]+$'"
+        )
+    else:
+        op.execute(
+            "UPDATE recent_lectures SET grade_num = CAST(TRIM(grade) AS INTEGER) "
+            "WHERE TRIM(grade) <> '' AND TRIM(grade) NOT GLOB '*[^0-9]*'"
+        )
+    op.create_index("ix_recent_lectures_type_grade_num", "recent_lectures", ["type", "grade_num"])
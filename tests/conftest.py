@@ -0,0 +1,74 @@
+import os
+import tempfile
+from types import SimpleNamespace
+from typing import Any, Dict, List, NamedTuple
+
+import pytest
+import pytest_asyncio
+
+# app 모듈이 설정을 읽기 전에 로컬 SQLite와 더미 키로 환경 지정 (MySQL/OpenAI 없이 실행)
+_tmp = tempfile.mkdtemp(prefix="navi-ai-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(_tmp, 'test.db')}")
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+os.environ["GPT_CACHE_ENABLED"] = "False"
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+import app.chat.chat_models  # noqa: E402,F401
+import app.curriculum.curriculum_models  # noqa: E402,F401
+import app.lecture.lecture_models  # noqa: E402,F401
+import app.professor.professor_models  # noqa: E402,F401
+from app.database.base import Base  # noqa: E402
+from app.lecture.lecture_catalog import lecture_catalog  # noqa: E402
+from app.recommendation.service.gpt_service import GPTService  # noqa: E402
+from app.recommendation.service.llm_gateway import LLMGateway  # noqa: E402
+from app.recommendation.service.model_router import ModelRouter, parse_tiers  # noqa: E402
+
+
+class Database(NamedTuple):
+    engine: AsyncEngine
+    session_factory: async_sessionmaker
+
+
+# 테스트마다 새 SQLite 파일에 전체 스키마 생성, 테스트가 끝나면 엔진 정리
+# (aiosqlite 작업 스레드가 남으면 인터프리터 종료 시 멈추므로 반드시 dispose)
+@pytest_asyncio.fixture
+async def database(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield Database(engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+    finally:
+        lecture_catalog.invalidate()
+        await engine.dispose()
+
+
+# 모델명별로 정해 둔 응답을 돌려주는 가짜 OpenAI 클라이언트 (문자열: 응답, 예외: 발생, 코루틴 함수: 호출 결과)
+class FakeLLM:
+    def __init__(self, replies: Dict[str, Any]):
+        self.replies = replies
+        self.calls: List[Dict[str, Any]] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **params):
+        self.calls.append(params)
+        reply = self.replies[params["model"]]
+        if isinstance(reply, BaseException):
+            raise reply
+        if callable(reply):
+            reply = await reply(params)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))], usage=None)
+
+    def models(self) -> List[str]:
+        return [call["model"] for call in self.calls]
+
+    # 호출 지점 "test"를 fast -> standard 순으로 라우팅하는 GPTService (게이트웨이 재시도 없음)
+    def service(self, tiers: str = "fast=fast-model:1,standard=standard-model:1", shadow_rate: float = 0.0):
+        router = ModelRouter(parse_tiers(tiers), {"test": ("fast", "standard"), "*": ("standard",)}, "standard", shadow_rate, seed=0)
+        return GPTService(gateway=LLMGateway(client=self, max_retries=0), router=router)
+
+
+@pytest.fixture
+def fake_llm():
+    return FakeLLM
@@ -0,0 +1,67 @@
+import pytest
+
+from app.recommendation.service.gpt_service import JSON_RESPONSE_FORMAT
+
+CURRENT = ["자료구조", "운영체제"]
+AVAILABLE = ["자료구조", "운영체제", "데이터베이스", "컴퓨터네트워크"]
+# 호출 지점별 max_tokens (analyze_turn, is_no_more_modification, is_requesting_alternative_recommendation,
+# parse_add_remove_lectures)
+TURN, END, ALTERNATIVE, ADD_REMOVE = 150, 10, 3, 100
+
+
+# max_tokens로 호출 지점을 구분해 응답하는 가짜 LLM
+@pytest.fixture
+def turn_llm(fake_llm):
+    def make(replies):
+        async def reply(params):
+            value = replies[params["max_tokens"]]
+            if isinstance(value, BaseException):
+                raise value
+            return value
+
+        return fake_llm({"standard-model": reply})
+
+    return make
+
+
+def call_sites(llm):
+    return [call["max_tokens"] for call in llm.calls]
+
+
+# JSON 모드 한 번의 호출로 분석하고, 목록에 없는 강의나 이미 있는 강의는 제외
+@pytest.mark.parametrize("content", [
+    '{"end": false, "alternative": false, "add": ["데이터베이스", "운영체제", "없는강의"], "remove": ["자료구조", "웹"]}',
+    '```json\n{"add": ["데이터베이스"], "remove": ["자료구조"]}\n```',
+])
+async def test_single_json_call(turn_llm, content):
+    llm = turn_llm({TURN: content})
+    analysis = await llm.service().analyze_turn("데이터베이스 넣고 자료구조 빼줘", CURRENT, AVAILABLE)
+
+    assert (analysis.end, analysis.alternative) == (False, False)
+    assert (analysis.add, analysis.remove) == (["데이터베이스"], ["자료구조"])
+    assert call_sites(llm) == [TURN]
+    assert llm.calls[0]["response_format"] == JSON_RESPONSE_FORMAT
+
+
+# 로컬 분류기가 종료를 확신하면 GPT를 호출하지 않음
+async def test_confident_end_skips_gpt(turn_llm):
+    llm = turn_llm({})
+    analysis = await llm.service().analyze_turn("네 이대로 진행해 주세요", CURRENT, AVAILABLE)
+    assert analysis.end is True
+    assert llm.calls == []
+
+
+# 잘못된 JSON, 스키마 불일치, 호출 실패 시 개별 판단 호출 세 개로 대체
+@pytest.mark.parametrize("turn_reply", ["추가할 강의가 없습니다", '{"end": "maybe"}', RuntimeError("down")])
+async def test_falls_back_to_per_intent_calls(turn_llm, turn_reply):
+    llm = turn_llm({
+        TURN: turn_reply,
+        END: "계속",
+        ALTERNATIVE: "YES",
+        ADD_REMOVE: '{"add": ["컴퓨터네트워크"], "remove": []}',
+    })
+    analysis = await llm.service().analyze_turn("자료구조는 어떨까", CURRENT, AVAILABLE, deleted_lectures=["자료구조"])
+
+    assert (analysis.end, analysis.alternative, analysis.add, analysis.remove) == (False, True, ["컴퓨터네트워크"], [])
+    assert call_sites(llm)[0] == TURN
+    assert sorted(call_sites(llm)[1:]) == sorted([END, ALTERNATIVE, ADD_REMOVE])
@@ -0,0 +1,36 @@
+import json
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI
+
+import app.chat.chat_router as chat_router
+from app.chat.chat_models import ChatLog
+
+
+async def _export(client: httpx.AsyncClient, **params):
+    response = await client.get("/chat/logs/export", params=params)
+    if response.status_code != 200:
+        return response.status_code, response.json()["detail"]
+    return response.status_code, [json.loads(line)["message"] for line in response.text.splitlines()]
+
+
+# 시간대가 지정된 기간도 로컬 시각 기준으로 비교 (end 생략 시 500 대신 정상 응답)
+async def test_export_accepts_timezone_aware_bounds(database, monkeypatch):
+    async with database.session_factory() as db:
+        db.add_all([ChatLog(session_id=1, chat_type="U", message=str(i), timestamp=timestamp)
+                    for i, timestamp in enumerate([datetime(2026, 3, 1, 10), datetime(2026, 3, 1, 12)])])
+        await db.commit()
+    monkeypatch.setattr(chat_router, "AsyncSessionLocal", database.session_factory)
+
+    app = FastAPI()
+    app.include_router(chat_router.router)
+    start = datetime(2026, 3, 1, 11).astimezone()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        assert await _export(client, start=start.isoformat()) == (200, ["1"])
+
+        end = datetime(2026, 3, 1, 11, 30).astimezone()
+        assert await _export(client, start="2026-03-01T09:00:00", end=end.isoformat()) == (200, ["0"])
+
+        status, _ = await _export(client, start=start.isoformat(), end="2026-03-01T10:00:00")
+        assert status == 400
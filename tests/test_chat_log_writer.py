@@ -0,0 +1,70 @@
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.chat.chat_log_writer import ChatLogWriter
+from app.chat.chat_models import ChatLog
+
+
+# 저장한 묶음 크기를 기록하는 저장기
+def make_writer(database, batch_size: int, flush_interval: float):
+    writer = ChatLogWriter(database.session_factory, batch_size, flush_interval, max_queue_size=100)
+    batches = []
+    flush = writer._flush
+
+    async def recording_flush(rows):
+        batches.append(len(rows))
+        await flush(rows)
+
+    writer._flush = recording_flush
+    return writer, batches
+
+
+async def stored_messages(database):
+    async with database.session_factory() as db:
+        return (await db.execute(select(ChatLog.message).order_by(ChatLog.id))).scalars().all()
+
+
+async def wait_for(condition, timeout: float = 1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+# batch_size만큼 모이면 시간 간격을 기다리지 않고 바로 저장
+async def test_flushes_full_batches_immediately(database):
+    writer, batches = make_writer(database, batch_size=3, flush_interval=30)
+    await writer.start()
+    for i in range(7):
+        await writer.enqueue(1, "U", str(i))
+    await wait_for(lambda: batches == [3, 3])
+
+    await writer.stop()
+    assert batches == [3, 3, 1]
+    assert await stored_messages(database) == [str(i) for i in range(7)]
+
+
+# 묶음이 차지 않아도 flush_interval이 지나면 저장
+async def test_flushes_partial_batch_after_interval(database):
+    writer, batches = make_writer(database, batch_size=100, flush_interval=0.05)
+    await writer.start()
+    await writer.enqueue(1, "U", "질문")
+    await writer.enqueue(1, "B", "답변")
+    await wait_for(lambda: batches == [2])
+    assert await stored_messages(database) == ["질문", "답변"]
+    await writer.stop()
+
+
+# 종료 시 큐에 남은 로그를 모두 저장한 뒤 멈춤
+async def test_stop_drains_queue(database):
+    writer, batches = make_writer(database, batch_size=2, flush_interval=30)
+    await writer.start()
+    for i in range(5):
+        await writer.enqueue(1, "U", str(i))
+    await writer.stop()
+
+    assert not writer.running
+    assert sum(batches) == 5 and max(batches) <= 2
+    async with database.session_factory() as db:
+        assert await db.scalar(select(func.count()).select_from(ChatLog)) == 5
@@ -0,0 +1,17 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.chat.chat_router import router
+
+
+# 잘못된 프레임을 받아도 오류 이벤트만 보내고 연결은 유지
+def test_malformed_frames_do_not_close_the_connection():
+    app = FastAPI()
+    app.include_router(router)
+
+    with TestClient(app).websocket_connect("/chat/ws") as websocket:
+        for frame in ("not json", "[1, 2]", '{"interest": "x"}'):
+            websocket.send_text(frame)
+            assert websocket.receive_json()["type"] == "error"
+        websocket.send_bytes(b"\x00")
+        assert websocket.receive_json()["type"] == "error"
@@ -0,0 +1,74 @@
+from app.chat import chat_repository
+from app.chat.chat_models import ChatSession
+from app.chat.chat_repository import ChatCrud
+from app.chat.chat_schemas import ConversationState
+from app.chat.conversation_state_store import ConversationStateStore
+
+
+async def _snapshot(session_factory, session_id: int):
+    async with session_factory() as db:
+        return (await db.get(ChatSession, session_id)).state_snapshot
+
+
+def make_store(session_factory) -> ConversationStateStore:
+    return ConversationStateStore(max_entries=1, max_bytes=1 << 20, idle_ttl_seconds=0,
+                                  session_factory=session_factory)
+
+
+# 용량 초과/유휴 만료로 제거된 상태도 세션 스냅샷으로 저장되어 다시 불러올 수 있어야 함
+async def test_evicted_state_is_written_to_snapshot(database):
+    session_factory = database.session_factory
+    async with session_factory() as db:
+        db.add_all([ChatSession(id=1, user_id=1, session_type="R"),
+                    ChatSession(id=2, user_id=1, session_type="R")])
+        await db.commit()
+
+    store = make_store(session_factory)
+    store.save(ConversationState(session_id=1, recommended=["자료구조"]))
+    store.save(ConversationState(session_id=2))
+    assert 1 not in store
+
+    # 저장이 끝나기 전에 다시 불러와도 제거 직전 상태를 돌려줌
+    async with session_factory() as db:
+        reloaded = await store.load(db, 1)
+    assert reloaded.recommended == ["자료구조"]
+
+    await store.flush()
+    assert store.stats()["pending_snapshots"] == 0
+    snapshot = ConversationState.model_validate_json(await _snapshot(session_factory, 1))
+    assert snapshot.recommended == ["자료구조"]
+    assert ConversationState.model_validate_json(await _snapshot(session_factory, 2)).session_id == 2
+
+
+# 저장 대기 중에 세션이 종료되면 pop이 상태를 넘겨주고 대기 중인 저장은 취소
+async def test_pop_returns_pending_snapshot(database):
+    store = make_store(database.session_factory)
+    store.save(ConversationState(session_id=1, interests=["AI"]))
+    store.save(ConversationState(session_id=2))
+    state = store.pop(1)
+    assert state is not None and state.interests == ["AI"]
+    assert store.pop(1) is None
+    await store.flush()
+
+
+# 없는 세션 ID로 종료하면 메모리의 상태를 버리지 않고, 있는 세션은 상태를 스냅샷으로 저장
+async def test_end_chat_session_only_pops_existing_sessions(database, monkeypatch):
+    store = ConversationStateStore(max_entries=10, max_bytes=1 << 20, idle_ttl_seconds=0,
+                                   session_factory=database.session_factory)
+    monkeypatch.setattr(chat_repository, "conversation_state_store", store)
+    async with database.session_factory() as db:
+        db.add(ChatSession(id=1, user_id=1, session_type="R"))
+        await db.commit()
+    store.save(ConversationState(session_id=1, interests=["AI"]))
+
+    async with database.session_factory() as db:
+        await ChatCrud(db).end_chat_session(2)
+        assert 1 in store
+        store.save(ConversationState(session_id=2, interests=["DB"]))
+        await ChatCrud(db).end_chat_session(2)
+        assert 2 in store
+
+        await ChatCrud(db).end_chat_session(1)
+    assert 1 not in store
+    snapshot = ConversationState.model_validate_json(await _snapshot(database.session_factory, 1))
+    assert snapshot.interests == ["AI"]
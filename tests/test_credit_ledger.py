@@ -0,0 +1,30 @@
+from app.chat.chat_schemas import ConversationState
+from app.curriculum.service.credit_ledger import CreditLedger
+from app.curriculum.service.curriculum_manager import CurriculumService
+from app.utils.completed_data import completed_data
+
+
+# 세션 상태의 장부는 서비스 인스턴스(요청)가 바뀌어도 재사용되고 추가/삭제가 누적됨
+def test_session_ledger_is_reused_across_turns():
+    state = ConversationState(session_id=1)
+    first = CurriculumService(None, state)
+    baseline = first.calculate_credits()[0]
+    first.add_lecture("TEST001", "테스트 강의", 3, "ME")
+
+    second = CurriculumService(None, state)
+    assert second.ledger is first.ledger
+    assert second.calculate_credits()[0] == baseline + 3
+    assert second.remove_lecture("TEST001")
+    assert second.calculate_credits()[0] == baseline
+
+
+# 스냅샷(JSON)으로 저장한 장부를 복원하면 같은 학점/성적 유지
+def test_ledger_survives_state_snapshot():
+    state = ConversationState(session_id=2)
+    service = CurriculumService(None, state)
+    service.add_lecture("TEST002", "테스트 강의", 2, "GE", "C0")
+
+    restored = ConversationState.model_validate_json(state.model_dump_json())
+    assert restored.ledger.as_tuple()[:5] == service.ledger.as_tuple()[:5]
+    assert restored.ledger.get("TEST002").score == "C0"
+    assert len(restored.ledger) == len(CreditLedger.from_lecture_data(completed_data)) + 1
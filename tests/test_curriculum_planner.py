@@ -0,0 +1,87 @@
+from app.core import constants
+from app.curriculum.service.curriculum_planner import CurriculumPlanner
+from app.lecture.lecture_record import LectureRecord
+
+
+def lec(code: str, credits: int = 3, type: str = "ME", grade: str = "4", semester: str = "2",
+        team_project: str = "") -> LectureRecord:
+    return LectureRecord(code, code, credits, type, grade, semester, team_project=team_project)
+
+
+# 전공/교양 부족 학점만 지정한 이수 현황 (calculate_credits 반환 형식)
+def earned(major_left: int = 0, general_left: int = 0, completed=()):
+    return (
+        constants.total_graduation_credits - major_left - general_left,
+        constants.major_required_credits - major_left,
+        constants.general_required_credits - general_left,
+        constants.field_practice_required,
+        0,
+        set(completed),
+    )
+
+
+# 4학년 2학기 한 학기만 남은 계획
+def plan_last_term(lectures, max_semester_credits=21, node_limit=2000, **kwargs):
+    planner = CurriculumPlanner(lectures, max_semester_credits=max_semester_credits, node_limit=node_limit)
+    return planner.plan(kwargs.pop("earned", earned(major_left=3)), 4, 2, **kwargs)
+
+
+def codes(plan):
+    return [[lecture.code for lecture in semester.lectures] for semester in plan.semesters]
+
+
+def test_no_team_project_filter():
+    lectures = [lec("A", team_project="Y"), lec("B", team_project="N")]
+    assert codes(plan_last_term(lectures)) == [["A"]]
+    plan = plan_last_term(lectures, conditions=["no_team_project"])
+    assert codes(plan) == [["B"]]
+    assert plan.satisfied
+
+
+# 재수강 과목은 요건 학점에 포함하지 않고, 필수/선택 과목을 배치한 뒤 남는 학점에 배치
+def test_retake_is_placed_after_requirements():
+    lectures = [lec("R1", type="MR"), lec("E1"), lec("OLD")]
+    need_six = earned(major_left=6)
+
+    full = plan_last_term(lectures, max_semester_credits=6, earned=need_six,
+                          conditions=["retake"], retake_codes=["OLD"])
+    assert codes(full) == [["R1", "E1"]]
+    assert full.satisfied and full.retake_codes == {"OLD"}
+
+    roomy = plan_last_term(lectures, max_semester_credits=9, earned=earned(major_left=9),
+                           conditions=["retake"], retake_codes=["OLD"])
+    assert codes(roomy) == [["R1", "E1", "OLD"]]
+    assert roomy.missing["major"] == 3 and not roomy.satisfied
+
+    # 조건이 없으면 재수강 코드는 무시하고 일반 선택 과목으로 취급
+    assert codes(plan_last_term(lectures, max_semester_credits=9, earned=earned(major_left=9),
+                                retake_codes=["OLD"])) == [["R1", "E1", "OLD"]]
+
+
+def test_semester_credit_cap():
+    lectures = [lec(f"E{i}", semester="") for i in range(10)]
+    planner = CurriculumPlanner(lectures, max_semester_credits=6)
+    plan = planner.plan(earned(major_left=30), 4, 1)
+
+    assert [semester.credits for semester in plan.semesters] == [6, 6]
+    assert plan.missing["major"] == 18 and not plan.satisfied
+
+
+# 백트래킹이 노드 한도에 걸리면 순서대로 채우고, 들어가지 않는 필수 과목은 unscheduled_required로 반환
+def test_required_first_fit_fallback_on_node_limit():
+    required = [lec("R1", type="MR"), lec("R2", type="MR"), lec("R3", type="GR")]
+
+    fits = plan_last_term(required, max_semester_credits=9, node_limit=0, earned=earned())
+    assert sorted(codes(fits)[0]) == ["R1", "R2", "R3"]
+    assert fits.unscheduled_required == () and fits.satisfied
+
+    overfull = plan_last_term(required, max_semester_credits=6, node_limit=0, earned=earned())
+    assert len(codes(overfull)[0]) == 2
+    assert [lecture.code for lecture in overfull.unscheduled_required] == ["R3"]
+    assert not overfull.satisfied
+
+
+# 이미 이수한 필수 과목은 다시 배치하지 않음
+def test_completed_required_lectures_are_skipped():
+    plan = plan_last_term([lec("R1", type="MR"), lec("R2", type="MR")], earned=earned(completed=["R1"]))
+    assert codes(plan) == [["R2"]]
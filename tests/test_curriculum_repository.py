@@ -0,0 +1,30 @@
+from sqlalchemy import select
+
+from app.curriculum.curriculum_models import CurriLecture, Curriculum
+from app.curriculum.curriculum_repository import CurriculumCrud, CurriculumDraft
+from app.lecture.lecture_catalog import lecture_catalog
+from app.lecture.lecture_models import LectureCode
+from app.lecture.lecture_record import LectureRecord
+
+
+def lecture(code: str) -> LectureRecord:
+    return LectureRecord(code, code, 3, "ME", "2", "1")
+
+
+# 같은 이름의 커리큘럼이 이미 있거나 한 번에 여러 개 저장돼도 강의는 각자의 커리큘럼에 연결
+async def test_save_curricula_with_duplicate_names(database):
+    async with database.session_factory() as db:
+        db.add_all([LectureCode(code=code, name=code, lecture_description="", lecture_objectives="")
+                    for code in ("A", "B", "C")])
+        db.add(Curriculum(user_id=1, name="추천", total_credits=0, description=""))
+        await db.commit()
+        lecture_catalog.invalidate()
+
+        ids = await CurriculumCrud(db).save_curricula([
+            CurriculumDraft(1, "추천", 3, [lecture("A")]),
+            CurriculumDraft(1, "추천", 6, [lecture("B"), lecture("C")]),
+        ])
+        rows = sorted((await db.execute(select(CurriLecture.curri_id, CurriLecture.name))).all())
+
+    assert len(set(ids)) == 2 and 1 not in ids
+    assert rows == sorted([(ids[0], "A"), (ids[1], "B"), (ids[1], "C")])
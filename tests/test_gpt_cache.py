@@ -0,0 +1,79 @@
+import pytest
+
+from app.recommendation.service.gpt_cache import GPTResponseCache, cache_lookups
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def make(ttl_seconds: int = 60, max_memory_entries: int = 8) -> GPTResponseCache:
+        cache = GPTResponseCache(str(tmp_path / "gpt.sqlite3"), ttl_seconds, max_memory_entries, max_disk_entries=100)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def lookups() -> dict:
+    return {result: cache_lookups.value(result=result) for result in ("memory_hit", "disk_hit", "miss")}
+
+
+def delta(before: dict) -> dict:
+    return {result: count - before[result] for result, count in lookups().items() if count != before[result]}
+
+
+def test_key_ignores_whitespace_but_not_model():
+    messages = [{"role": "user", "content": "자료구조  추천\n해줘"}]
+    key = GPTResponseCache.make_key("m", messages, {"temperature": 0})
+    assert key == GPTResponseCache.make_key("m", [{"role": "user", "content": "자료구조 추천 해줘"}], {"temperature": 0})
+    assert key != GPTResponseCache.make_key("other", messages, {"temperature": 0})
+
+
+async def test_memory_hit_and_miss_are_counted(make_cache):
+    cache = make_cache()
+    before = lookups()
+    assert await cache.get("k") is None
+    await cache.set("k", "응답")
+    assert await cache.get("k") == "응답"
+    assert delta(before) == {"miss": 1, "memory_hit": 1}
+
+
+# 메모리에 없으면 디스크에서 읽어 메모리에 다시 올림 (재시작 후 첫 조회)
+async def test_disk_fallback_on_memory_miss(make_cache):
+    await make_cache().set("k", "응답")
+    cache = make_cache()
+    before = lookups()
+    assert await cache.get("k") == "응답"
+    assert await cache.get("k") == "응답"
+    assert delta(before) == {"disk_hit": 1, "memory_hit": 1}
+
+
+# 메모리 LRU는 가장 오래 사용하지 않은 항목부터 제거 (디스크에는 남아 있음)
+async def test_memory_lru_eviction(make_cache):
+    cache = make_cache(max_memory_entries=2)
+    await cache.set("a", "A")
+    await cache.set("b", "B")
+    assert await cache.get("a") == "A"
+    await cache.set("c", "C")
+    assert list(cache._memory) == ["a", "c"]
+
+    before = lookups()
+    assert await cache.get("b") == "B"
+    assert delta(before) == {"disk_hit": 1}
+
+
+# TTL이 지난 항목은 메모리/디스크 모두에서 제거되고 miss로 처리
+async def test_expired_entries_are_misses(make_cache, monkeypatch):
+    cache = make_cache(ttl_seconds=10)
+    await cache.set("k", "응답")
+    now = cache._memory["k"][0]
+    monkeypatch.setattr("app.recommendation.service.gpt_cache.time.time", lambda: now + 1)
+
+    before = lookups()
+    assert await cache.get("k") is None
+    assert delta(before) == {"miss": 1}
+    assert "k" not in cache._memory
+    assert cache._disk_get("k", now - 1) is None
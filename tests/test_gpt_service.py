@@ -0,0 +1,49 @@
+import pytest
+
+from app.recommendation.service import gpt_service
+from app.recommendation.service.gpt_cache import GPTResponseCache
+
+MESSAGES = [{"role": "user", "content": "질문"}]
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    cache = GPTResponseCache(str(tmp_path / "gpt.sqlite3"), ttl_seconds=60, max_memory_entries=8, max_disk_entries=8)
+    monkeypatch.setattr(gpt_service, "gpt_response_cache", cache)
+    yield cache
+    cache.close()
+
+
+async def complete(service, temperature: float = 0):
+    return await service._complete(call_site="test", messages=MESSAGES, max_tokens=10, temperature=temperature)
+
+
+# 첫 등급 응답은 캐시에서 재사용
+async def test_primary_answer_is_cached(fake_llm, response_cache):
+    llm = fake_llm({"fast-model": "빠른 응답"})
+    service = llm.service()
+    assert await complete(service) == "빠른 응답"
+    assert await complete(service) == "빠른 응답"
+    assert llm.models() == ["fast-model"]
+
+
+# 대체 등급의 응답은 첫 등급 모델의 캐시 항목으로 저장하지 않음
+async def test_fallback_answer_is_not_cached(fake_llm, response_cache):
+    llm = fake_llm({"fast-model": RuntimeError("down"), "standard-model": "대체 응답"})
+    service = llm.service()
+    assert await complete(service) == "대체 응답"
+
+    llm.replies["fast-model"] = "빠른 응답"
+    assert await complete(service) == "빠른 응답"
+    assert llm.models() == ["fast-model", "standard-model", "fast-model"]
+
+
+# 캐시가 꺼져 있거나 temperature가 0이 아니면 매번 호출
+@pytest.mark.parametrize("temperature", [0, 0.7])
+async def test_uncached_calls(fake_llm, monkeypatch, temperature):
+    monkeypatch.setattr(gpt_service, "gpt_response_cache", None)
+    llm = fake_llm({"fast-model": "응답"})
+    service = llm.service()
+    for _ in range(2):
+        assert await complete(service, temperature) == "응답"
+    assert llm.models() == ["fast-model", "fast-model"]
@@ -0,0 +1,9 @@
+from benchmarks.intent_agreement import DEFAULT_SAMPLES, below_agreement, evaluate, load_samples
+
+
+# 라벨을 붙인 샘플에서 로컬 분류기가 확신한 답은 모두 정답과 일치해야 함
+async def test_local_classifier_matches_labels():
+    result = await evaluate(load_samples(DEFAULT_SAMPLES), 0.85, live=False)
+
+    assert result["disagreements"] == []
+    assert below_agreement(result, 1.0) == []
@@ -0,0 +1,38 @@
+import pytest
+
+from app.recommendation.service.intent_classifier import LocalIntentClassifier
+
+classifier = LocalIntentClassifier(threshold=0.85)
+
+
+# 재수강을 거절/제외하는 문장은 retake로 확신하지 않음
+@pytest.mark.parametrize("text", ["재수강은 빼줘", "재수강 안 할래", "졸업만 하면 돼, 재수강은 싫어"])
+def test_negated_retake_is_not_a_condition(text):
+    result = classifier.classify_conditions(text)
+    assert not (classifier.is_confident(result) and "retake" in result.value)
+
+
+def test_retake_request_is_a_condition():
+    assert classifier.classify_conditions("재수강 포함해줘") == (["retake"], 0.9)
+
+
+# 커리큘럼을 새로 만드는 동사가 아니면 GPT로 위임
+@pytest.mark.parametrize("text", ["커리큘럼 삭제해줘", "커리큘럼 설명해줘", "시간표 보여줘", "커리큘럼 짜증나"])
+def test_other_curriculum_actions_are_not_confident(text):
+    assert not classifier.is_confident(classifier.classify_curriculum_request(text))
+
+
+@pytest.mark.parametrize("text", ["커리큘럼 짜줘", "다음 학기 시간표 만들어 주세요"])
+def test_curriculum_creation_is_confident(text):
+    assert classifier.classify_curriculum_request(text) == (True, 0.95)
+
+
+# 단독 긍정 답변이나 "더 없어"는 종료로 확신하지 않음
+@pytest.mark.parametrize("text", ["어", "네", "응", "더 없어", "파이썬 없어", "수정할 거 없어?"])
+def test_ambiguous_replies_do_not_end_modification(text):
+    assert not classifier.is_confident(classifier.classify_no_more_modification(text))
+
+
+@pytest.mark.parametrize("text", ["더 수정할 거 없어요", "추가할 거 없어", "네 그만", "이대로 좋아요"])
+def test_explicit_end_phrases_end_modification(text):
+    assert classifier.classify_no_more_modification(text) == (True, 0.95)
@@ -0,0 +1,31 @@
+from app.lecture.lecture_catalog import lecture_catalog
+from app.lecture.lecture_models import LectureCode, LectureReplacement, RecentLecture
+
+
+# 카탈로그 테이블을 ORM으로 바꾸면 다음 조회에서 새 버전을 적재
+async def test_orm_changes_invalidate_catalog(database):
+    async with database.session_factory() as db:
+        first = await lecture_catalog.get(db)
+        assert await lecture_catalog.get(db) is first
+
+        for row in (LectureCode(code="A", name="자료구조", lecture_description="", lecture_objectives=""),
+                    RecentLecture(code="A", name="자료구조", credits=3, type="MR", grade="2", semester="1"),
+                    LectureReplacement(original_code="A", replacement_code="B")):
+            db.add(row)
+            await db.commit()
+            assert lecture_catalog.is_stale()
+            snapshot = await lecture_catalog.get(db)
+            assert snapshot.version > first.version
+            first = snapshot
+
+    assert "자료구조" in snapshot.by_name and snapshot.replacement_index.equivalents("A") == {"A", "B"}
+
+
+# TTL이 지나면 무효화 이벤트가 없어도 재적재 (ORM 밖의 변경이 반영되는 상한)
+async def test_ttl_bounds_staleness(database, monkeypatch):
+    async with database.session_factory() as db:
+        snapshot = await lecture_catalog.get(db)
+    monkeypatch.setattr(lecture_catalog, "ttl_seconds", 60)
+    assert not lecture_catalog.is_stale()
+    monkeypatch.setattr("app.lecture.lecture_catalog.time.monotonic", lambda: snapshot.loaded_at + 60)
+    assert lecture_catalog.is_stale()
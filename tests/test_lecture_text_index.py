@@ -0,0 +1,39 @@
+import pytest
+
+from app.lecture.lecture_text_index import LectureTextIndex, clear_cut_selection
+
+DOCUMENTS = [
+    ("인공지능개론", "인공지능의 기본 개념과 탐색, 머신러닝, 신경망을 학습한다"),
+    ("머신러닝", "지도학습 비지도학습 회귀 분류 모델을 실습한다"),
+    ("자료구조", "배열 연결리스트 스택 큐 트리 그래프 자료구조를 학습한다"),
+    ("운영체제", "프로세스 스레드 메모리 관리 파일 시스템"),
+    ("웹프로그래밍", "HTML CSS 자바스크립트로 웹 서비스를 개발한다"),
+]
+
+
+def test_rank_orders_by_relevance():
+    ranked = LectureTextIndex(DOCUMENTS).rank("인공지능이랑 머신러닝에 관심 있어요")
+    assert [name for name, _ in ranked[:2]] == ["인공지능개론", "머신러닝"]
+    assert ranked[2][1] == 0
+
+
+def test_clear_cut_selection_keeps_strong_matches():
+    ranked = LectureTextIndex(DOCUMENTS).rank("프로세스와 메모리 관리")
+    assert clear_cut_selection(ranked) == ["운영체제"]
+
+
+# 후보가 하나뿐이거나 점수가 낮으면 (n-gram 한두 개만 겹침) GPT로 넘김
+@pytest.mark.parametrize("ranked", [
+    [("자료구조", 9.0)],
+    [("자료구조", 0.3), ("운영체제", 0.0), ("머신러닝", 0.0)],
+    [("자료구조", 0.0), ("운영체제", 0.0)],
+    [],
+])
+def test_clear_cut_selection_requires_floor_and_candidates(ranked):
+    assert clear_cut_selection(ranked) is None
+
+
+# 하한을 넘어도 중간 점수가 있으면 애매한 분포
+def test_clear_cut_selection_rejects_ambiguous_scores():
+    assert clear_cut_selection([("a", 10.0), ("b", 4.0), ("c", 0.0)]) is None
+    assert clear_cut_selection([("a", 10.0), ("b", 6.0), ("c", 0.5)]) == ["a", "b"]
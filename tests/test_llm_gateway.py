@@ -0,0 +1,47 @@
+import asyncio
+import types
+
+from app.recommendation.service.llm_gateway import LLMGateway
+
+
+def make_gateway(create) -> LLMGateway:
+    completions = types.SimpleNamespace(create=create)
+    return LLMGateway(client=types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions)))
+
+
+# 병합된 호출을 먼저 시작한 요청이 취소돼도 나머지 요청은 결과를 받음
+async def test_cancelled_leader_does_not_cancel_followers():
+    calls = []
+
+    async def create(**params):
+        calls.append(params)
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    gateway = make_gateway(create)
+    leader = asyncio.create_task(gateway.create(coalesce_key="k", model="m"))
+    await asyncio.sleep(0)
+    followers = [asyncio.create_task(gateway.create(coalesce_key="k", model="m")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == ["ok", "ok", "ok"]
+    assert len(calls) == 1
+    assert gateway._inflight == {} and gateway._waiters == {}
+
+
+# 기다리는 요청이 모두 취소되면 공유 호출도 취소
+async def test_shared_call_cancelled_when_every_waiter_leaves():
+    async def create(**params):
+        await asyncio.sleep(1)
+        return "ok"
+
+    gateway = make_gateway(create)
+    waiter = asyncio.create_task(gateway.create(coalesce_key="k", model="m"))
+    await asyncio.sleep(0)
+    shared = gateway._inflight["k"]
+    waiter.cancel()
+    await asyncio.sleep(0.01)
+
+    assert shared.cancelled()
+    assert gateway._inflight == {}
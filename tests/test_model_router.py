@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.recommendation.service import gpt_service
+from app.recommendation.service.model_router import (
+    ModelRouter, llm_tier_agreement, llm_tier_calls, parse_routes, parse_tiers
+)
+
+MESSAGES = [{"role": "user", "content": "예/아니오로 답하세요"}]
+
+
+def test_parse_settings():
+    tiers = parse_tiers("fast=gpt-4o-mini:8, large=gpt-4-turbo:30")
+    assert tiers["fast"].model == "gpt-4o-mini" and tiers["large"].latency_budget_seconds == 30
+    assert parse_routes("analyze_turn=fast>large,*=large") == {"analyze_turn": ("fast", "large"), "*": ("large",)}
+    with pytest.raises(ValueError):
+        ModelRouter(tiers, {"analyze_turn": ("fast", "missing")}, "large")
+
+
+async def complete(service):
+    return await service._complete(call_site="test", messages=MESSAGES, max_tokens=3, temperature=0)
+
+
+def tier_calls(tier: str, outcome: str) -> float:
+    return llm_tier_calls.value(call_site="test", tier=tier, outcome=outcome)
+
+
+# 첫 등급이 오류를 내면 다음 등급으로 대체
+async def test_falls_back_on_error(fake_llm):
+    before = tier_calls("fast", "fallback"), tier_calls("standard", "success")
+    llm = fake_llm({"fast-model": RuntimeError("down"), "standard-model": "예"})
+
+    assert await complete(llm.service()) == "예"
+    assert llm.models() == ["fast-model", "standard-model"]
+    assert (tier_calls("fast", "fallback"), tier_calls("standard", "success")) == (before[0] + 1, before[1] + 1)
+
+
+# 첫 등급이 응답 예산을 넘기면 기다리지 않고 다음 등급으로 대체
+async def test_falls_back_on_budget_overrun(fake_llm):
+    async def slow(params):
+        await asyncio.sleep(1)
+        return "늦은 응답"
+
+    llm = fake_llm({"fast-model": slow, "standard-model": "예"})
+    service = llm.service(tiers="fast=fast-model:0.05,standard=standard-model:1")
+
+    start = asyncio.get_running_loop().time()
+    assert await complete(service) == "예"
+    assert asyncio.get_running_loop().time() - start < 0.5
+    assert llm.models() == ["fast-model", "standard-model"]
+
+
+# 마지막 등급까지 실패하면 오류 전달
+async def test_last_tier_error_is_raised(fake_llm):
+    llm = fake_llm({"fast-model": RuntimeError("down"), "standard-model": ValueError("bad")})
+    with pytest.raises(ValueError):
+        await complete(llm.service())
+
+
+# 섀도 비교는 응답한 등급과 기준 등급의 (정규화한) 응답 일치 여부를 기록
+@pytest.mark.parametrize("reference_reply, agreed", [(" 예 ", "true"), ("아니오", "false")])
+async def test_shadow_agreement_is_recorded(fake_llm, reference_reply, agreed):
+    before = llm_tier_agreement.value(call_site="test", tier="fast", agreed=agreed)
+    llm = fake_llm({"fast-model": "예", "standard-model": reference_reply})
+
+    assert await complete(llm.service(shadow_rate=1.0)) == "예"
+    await asyncio.gather(*gpt_service._shadow_tasks)
+    assert llm.models() == ["fast-model", "standard-model"]
+    assert llm_tier_agreement.value(call_site="test", tier="fast", agreed=agreed) == before + 1
+
+
+# 기준 등급이 직접 응답했거나 섀도 비율이 0이면 비교 호출 없음
+async def test_no_shadow_for_reference_tier_or_zero_rate(fake_llm):
+    llm = fake_llm({"fast-model": RuntimeError("down"), "standard-model": "예"})
+    await complete(llm.service(shadow_rate=1.0))
+    llm.replies["fast-model"] = "예"
+    await complete(llm.service(shadow_rate=0.0))
+    assert not gpt_service._shadow_tasks
+    assert llm.models() == ["fast-model", "standard-model", "fast-model"]
@@ -0,0 +1,8 @@
+from benchmarks.query_plans import check_plans
+
+
+# 저장소 쿼리에 허용 목록 밖의 전체 테이블 스캔이 없어야 함 (모델 기준 스키마의 SQLite 실행 계획)
+async def test_repository_queries_use_indexes(database):
+    checked = await check_plans(database.engine)
+    assert checked
+    assert [(name, statement, scans) for name, statement, scans in checked if scans] == []
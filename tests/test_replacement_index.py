@@ -0,0 +1,59 @@
+from app.core import constants
+from app.curriculum.service.curriculum_planner import CurriculumPlanner
+from app.lecture.lecture_models import LectureReplacement, RecentLecture
+from app.lecture.lecture_record import LectureRecord
+from app.lecture.lecture_repository import LectureCrud
+from app.lecture.replacement_index import ReplacementIndex
+
+# A→B, B→C 연쇄 대체와 별개의 X→Y 대체
+PAIRS = [("A", "B"), ("B", "C"), ("X", "Y")]
+
+
+def test_chained_replacements_are_one_class():
+    index = ReplacementIndex(PAIRS)
+    assert index.equivalents("A") == {"A", "B", "C"}
+    assert index.equivalents("X") == {"X", "Y"}
+    assert index.equivalents("Z") == {"Z"}
+    assert index.replacements_by_original == {"A": ["B"], "B": ["C"], "X": ["Y"]}
+
+
+# 동치 관계는 방향과 무관 (대체 과목을 이수해도 원 과목 이수로 인정)
+def test_equivalents_are_symmetric():
+    index = ReplacementIndex(PAIRS)
+    for code in ("A", "B", "C", "X", "Y"):
+        for other in index.equivalents(code):
+            assert code in index.equivalents(other)
+    assert index.equivalents("C") is index.equivalents("A")
+
+
+def test_expand_completed_codes():
+    index = ReplacementIndex(PAIRS)
+    assert index.expand({"C", "Z"}) == {"A", "B", "C", "Z"}
+    assert index.expand(set()) == set()
+
+
+# 이수 과목을 대체 교과목까지 확장한 뒤 미이수 필수 과목에서 제외
+async def test_completed_replacement_excludes_required_lecture(database):
+    async with database.session_factory() as db:
+        db.add_all([LectureReplacement(original_code=original, replacement_code=replacement)
+                    for original, replacement in PAIRS])
+        db.add_all([RecentLecture(code=code, name=code, credits=3, type="MR", grade="1", semester="1")
+                    for code in ("C", "D", "Y")])
+        await db.commit()
+
+        crud = LectureCrud(db)
+        completed = await crud.get_all_completed_codes_with_replacement({"A"})
+        mr, _ = await crud.get_uncompleted_required_lectures(completed, 4)
+
+    assert completed == {"A", "B", "C"}
+    assert mr == ["D", "Y"]
+
+
+# 플래너도 대체 교과목을 이수했으면 원 필수 과목을 배치하지 않음
+def test_planner_skips_required_lecture_completed_by_replacement():
+    lectures = [LectureRecord(code, code, 3, "MR", "4", "2") for code in ("C", "D")]
+    planner = CurriculumPlanner(lectures, ReplacementIndex(PAIRS))
+    earned = (constants.total_graduation_credits, constants.major_required_credits,
+              constants.general_required_credits, constants.field_practice_required, 0, {"A"})
+    plan = planner.plan(earned, 4, 2)
+    assert [lecture.code for lecture in plan.semesters[0].lectures] == ["D"]
@@ -0,0 +1,55 @@
+from app.curriculum.service.graduation_audit import audit_chunk, build_audit_tables
+from app.lecture.lecture_catalog import CatalogSnapshot
+from app.lecture.lecture_models import RecentLecture
+from app.lecture.lecture_record import LectureRecord, grade_level
+from app.lecture.lecture_repository import LectureCrud
+
+
+def _snapshot() -> CatalogSnapshot:
+    lectures = [
+        LectureRecord("MR01", "자료구조", 3, "MR", "2", "1"),
+        LectureRecord("MR02", "캡스톤디자인", 3, "MR", "4", "1"),
+        LectureRecord("GR01", "채플", 1, "GR", "전학년", "1"),
+        LectureRecord("GR02", "글쓰기", 2, "GR", None, "1"),
+    ]
+    return CatalogSnapshot(1, lectures, {}, [])
+
+
+def test_grade_level():
+    assert grade_level("3") == 3
+    assert grade_level(" 1 ") == 1
+    assert grade_level("전학년") == 0
+    assert grade_level("") == 0
+    assert grade_level(None) is None
+
+
+# 카탈로그 학년별 필수 과목과 졸업 요건 점검이 같은 과목을 미이수로 판단해야 함
+def test_catalog_and_audit_agree_on_required_lectures():
+    snapshot = _snapshot()
+    tables = build_audit_tables(snapshot)
+    for student_grade in range(1, 5):
+        expected = [
+            lec.name
+            for lecture_type in ("MR", "GR")
+            for lec in snapshot.required_lectures(lecture_type, student_grade)
+        ]
+        [result] = audit_chunk([{"student_id": 1, "grade": student_grade, "transcript": {}}], tables)
+        missing = result["missing_mr"] + result["missing_gr"]
+        assert sorted(missing) == sorted(expected), student_grade
+    assert [lec.name for lec in snapshot.required_lectures("GR", 1)] == ["채플"]
+
+
+# "전학년"과 빈 학년은 모든 학년의 미이수 필수 과목에 포함, 학년이 없는(NULL) 과목과 상위 학년 과목은 제외
+# (문자열 비교를 쓰던 이전 조회는 "전학년"을 제외했음)
+async def test_uncompleted_required_lectures_by_grade_label(database):
+    rows = [("MR1", "1", "MR"), ("MR3", "3", "MR"), ("MR_ALL", "전학년", "MR"), ("MR_EMPTY", "", "MR"),
+            ("MR_NONE", None, "MR"), ("GR_ALL", "전학년", "GR"), ("GR1_DONE", "1", "GR")]
+    async with database.session_factory() as db:
+        db.add_all([RecentLecture(code=code, name=code, credits=3, type=lecture_type, grade=grade, semester="1")
+                    for code, grade, lecture_type in rows])
+        await db.commit()
+
+        mr, gr = await LectureCrud(db).get_uncompleted_required_lectures({"GR1_DONE"}, 2)
+
+    assert mr == ["MR1", "MR_ALL", "MR_EMPTY"]
+    assert gr == ["GR_ALL"]